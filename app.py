@@ -1,10 +1,39 @@
-from flask import Flask, render_template, request
-import os
+from flask import Flask, render_template, request, jsonify
 import numpy as np
 from src.pilotproject.pipeline.prediction_pipeline import PredictionPipeline
+from src.pilotproject.pipeline.training_job_runner import get_training_job_runner
+from src.pilotproject.utils.model_cache import kernel_cache, model_cache
+from src.pilotproject import logger
 
 app = Flask(__name__)
 
+# Prediction pipeline is built lazily, once per worker process, and reused across requests
+prediction_pipeline = None
+
+
+def get_prediction_pipeline() -> PredictionPipeline:
+    """
+    Returns the process-wide prediction pipeline, creating it on first use.
+    """
+    global prediction_pipeline
+    if prediction_pipeline is None:
+        prediction_pipeline = PredictionPipeline()
+    return prediction_pipeline
+
+
+def preload() -> None:
+    """
+    Builds the prediction pipeline and loads the serving model in the current process.
+
+    The production server calls this in its master before forking, so every worker
+    starts with the config parsed and the model (or scoring kernel) already in memory,
+    shared copy-on-write instead of loaded once per worker.
+    """
+    try:
+        get_prediction_pipeline().model_prediction.get_scorer()
+    except FileNotFoundError as e:
+        logger.warning(f"No trained model to preload yet, workers will load it on first request: {e}")
+
 @app.route('/', methods=['GET'])
 def homepage():
     """
@@ -13,13 +42,25 @@ def homepage():
     return render_template("index.html")
 
 
-@app.route('/train', methods=['GET'])
+@app.route('/train', methods=['GET', 'POST'])
 def training():
     """
-    Triggers the training pipeline by running the main script.
+    Submits the training pipeline as a background job and returns its id immediately.
+    Poll `/train/<job_id>` for per-stage progress.
+    """
+    job = get_training_job_runner().submit()
+    return jsonify(job), 202
+
+
+@app.route('/train/<job_id>', methods=['GET'])
+def training_status(job_id):
+    """
+    Reports the status, current stage and per-stage timings of a training job.
     """
-    os.system('python main.py')
-    return 'Training Successful'
+    job = get_training_job_runner().get_status(job_id)
+    if job is None:
+        return jsonify({'error': f"Unknown training job '{job_id}'"}), 404
+    return jsonify(job)
 
 
 @app.route('/predict', methods=['GET', 'POST'])
@@ -62,18 +103,68 @@ def predict_route():
             ]).reshape(1, -1)
 
             # Run prediction pipeline
-            obj = PredictionPipeline()
+            obj = get_prediction_pipeline()
             pred = obj.initiate_prediction(data)
 
             return render_template('results.html', prediction=str(pred))
 
         except Exception as e:
-            print('The Exception message is:', e)
-            return 'Something went wrong during prediction.'
-        
+            logger.exception(f"Prediction failed: {e}")
+            return 'Something went wrong during prediction.', 500
+
     else:
         return render_template('index.html')
 
 
+@app.route('/predict/batch', methods=['POST'])
+def batch_predict_route():
+    """
+    Handles batch prediction logic:
+    - Accepts a CSV upload (multipart field 'file') or a JSON body.
+    - JSON may be a list of rows or an object with an 'instances' list; rows are
+      either objects keyed by schema column name or lists in schema column order.
+    - Scores all rows with a single vectorized model call.
+    - Returns predictions as JSON.
+    """
+    try:
+        uploaded_file = request.files.get('file')
+        if uploaded_file is not None:
+            data = uploaded_file.stream
+        elif request.is_json:
+            payload = request.get_json(silent=True)  # None for a malformed body, answered with 400 below
+            if payload is None:
+                return jsonify({'error': 'Request body is not valid JSON'}), 400
+            data = payload.get('instances') if isinstance(payload, dict) else payload
+            if not isinstance(data, list):
+                return jsonify({'error': "Expected a JSON list of rows or an object with an 'instances' list"}), 400
+        else:
+            return jsonify({'error': "Send a CSV file in the 'file' field or a JSON body"}), 415
+
+        obj = get_prediction_pipeline()
+        pred = obj.initiate_batch_prediction(data)
+
+        return jsonify({'count': int(pred.shape[0]), 'predictions': pred.tolist()})
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    except Exception as e:
+        logger.exception(f"Batch prediction failed: {e}")
+        return jsonify({'error': 'Something went wrong during prediction.'}), 500
+
+
+@app.route('/cache/stats', methods=['GET'])
+def cache_stats():
+    """
+    Reports model and scoring kernel cache load counts and hit rates, plus prediction log writer
+    counters, for this worker process.
+    """
+    stats = model_cache.stats()
+    stats['kernel'] = kernel_cache.stats()
+    if prediction_pipeline is not None:
+        stats['prediction_log'] = prediction_pipeline.model_prediction.log_writer.stats()
+    return jsonify(stats)
+
+
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=8080, debug=True)
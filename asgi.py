@@ -0,0 +1,124 @@
+import json
+from contextlib import asynccontextmanager
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from src.pilotproject import logger
+from src.pilotproject.config.configuration import ConfigurationManager
+from src.pilotproject.pipeline.prediction_pipeline import PredictionPipeline
+from src.pilotproject.utils.micro_batcher import MicroBatcher
+from src.pilotproject.utils.model_cache import kernel_cache, model_cache
+from src.pilotproject.utils.payload_validation import PayloadValidationError, PayloadValidator
+
+# ===================================
+# 🔹 Async JSON Prediction API
+# ===================================
+
+"""
+ASGI app serving JSON predictions with micro-batching:
+
+    python asgi.py                      # or: uvicorn asgi:app
+
+POST /v1/predict takes one row or {"instances": [...]}; rows are objects keyed by
+schema column name or lists in schema column order. Payloads are validated against
+`schema.yaml` (COLUMNS and RANGES). Concurrent requests are scored together: the
+micro-batcher waits up to `max_wait_ms` or `max_batch_rows` rows, runs one
+vectorized predict and resolves each request with its own predictions.
+Settings are under `async_api` in `config/config.yaml`.
+"""
+
+
+@asynccontextmanager
+async def lifespan(app: Starlette):
+    """
+    Loads the config, validator, model and micro-batcher once per server process.
+    """
+    config = ConfigurationManager().get_async_api_config()
+    pipeline = PredictionPipeline()
+    try:
+        pipeline.model_prediction.get_scorer()  # Load the model before the first request
+    except FileNotFoundError as e:
+        logger.warning(f"No trained model to preload yet, it will be loaded on first request: {e}")
+
+    app.state.validator = PayloadValidator(
+        config.columns,
+        config.target_column,
+        ranges=config.ranges if config.enforce_ranges else None,
+        max_rows=config.max_rows_per_request
+    )
+    app.state.batcher = MicroBatcher(
+        pipeline.model_prediction.predict,
+        max_batch_rows=config.max_batch_rows,
+        max_wait_ms=config.max_wait_ms
+    )
+    app.state.pipeline = pipeline
+    yield
+
+
+async def predict(request: Request) -> JSONResponse:
+    """
+    Validates the JSON payload and returns its predictions.
+    """
+    try:
+        payload = json.loads(await request.body())
+    except ValueError:
+        return JSONResponse({'error': 'Request body is not valid JSON'}, status_code=400)
+
+    try:
+        features = request.app.state.validator.validate(payload)
+    except PayloadValidationError as e:
+        return JSONResponse({'error': 'Payload does not match the schema', 'details': e.errors}, status_code=422)
+
+    try:
+        predictions = await request.app.state.batcher.submit(features)
+    except FileNotFoundError:
+        return JSONResponse({'error': 'No trained model is available yet'}, status_code=503)
+    except Exception as e:
+        logger.error(f"Prediction request failed: {e}")
+        return JSONResponse({'error': 'Something went wrong during prediction.'}, status_code=500)
+
+    return JSONResponse({'count': int(predictions.shape[0]), 'predictions': predictions.tolist()})
+
+
+async def health(request: Request) -> JSONResponse:
+    return JSONResponse({'status': 'ok'})
+
+
+async def stats(request: Request) -> JSONResponse:
+    """
+    Reports micro-batching, cache and prediction log counters for this server process.
+    """
+    return JSONResponse({
+        'batcher': request.app.state.batcher.stats(),
+        'model_cache': model_cache.stats(),
+        'kernel_cache': kernel_cache.stats(),
+        'prediction_log': request.app.state.pipeline.model_prediction.log_writer.stats(),
+    })
+
+
+app = Starlette(
+    routes=[
+        Route('/v1/predict', predict, methods=['POST']),
+        Route('/v1/health', health, methods=['GET']),
+        Route('/v1/stats', stats, methods=['GET']),
+    ],
+    lifespan=lifespan
+)
+
+
+if __name__ == '__main__':
+    import uvicorn
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    config = ConfigurationManager().get_async_api_config()
+    uvicorn.run(
+        'asgi:app',
+        host=config.host,
+        port=config.port,
+        workers=config.workers,
+        access_log=False  # One log line per request would cost more than scoring it
+    )
@@ -1,12 +1,12 @@
-import os
+import argparse
 from dotenv import load_dotenv
-from src.pilotproject import logger
-
-from src.pilotproject.pipeline.data_ingestion_pipeline import DataIngestionPipeline
-from src.pilotproject.pipeline.data_validation_pipeline import DataValidationPipeline
-from src.pilotproject.pipeline.data_transformation_pipeline import DataTransformationPipeline
-from src.pilotproject.pipeline.model_trainer_pipeline import ModelTrainerPipeline
-from src.pilotproject.pipeline.model_evaluation_pipeline import ModelEvaluationPipeline
+from src.pilotproject.pipeline.training_pipeline import TrainingPipeline
+from src.pilotproject.pipeline.incremental_training_pipeline import IncrementalTrainingPipeline
+from src.pilotproject.config.configuration import ConfigurationManager
+from src.pilotproject.components.import_benchmark import ImportBenchmark
+from src.pilotproject.components.config_benchmark import ConfigBenchmark
+from src.pilotproject.components.load_test import LoadTest
+from src.pilotproject.utils.artifact_store import ArtifactStore
 
 # ===================================
 # 🔹 Pipeline Entry Point
@@ -18,73 +18,78 @@ Main script to run all ML pipeline stages sequentially:
 - Data Validation
 - Data Transformation
 - Model Training
+- Model Export
 - Model Evaluation
+
+The stage list lives in `src/pilotproject/pipeline/training_pipeline.py`.
+Run `python main.py --help` for the other commands.
 """
 
 # Load environment variables (e.g., for MLflow URI)
 load_dotenv()
 
-# ==============================
-# 🔸 Data Ingestion Stage
-# ==============================
-STAGE_NAME = "Data Ingestion Stage"
-try:
-    logger.info(f">>>>>> Stage: {STAGE_NAME} started <<<<<<")
-    obj = DataIngestionPipeline()
-    obj.initiate_data_ingestion()
-    logger.info(f">>>>>> Stage: {STAGE_NAME} completed <<<<<<\n{'x' * 10}")
-except Exception as e:
-    logger.exception(e)
-    raise
-
-# ==============================
-# 🔸 Data Validation Stage
-# ==============================
-STAGE_NAME = "Data Validation Stage"
-try:
-    logger.info(f">>>>>> Stage: {STAGE_NAME} started <<<<<<")
-    obj = DataValidationPipeline()
-    obj.initiate_data_validation()
-    logger.info(f">>>>>> Stage: {STAGE_NAME} completed <<<<<<\n{'x' * 10}")
-except Exception as e:
-    logger.exception(e)
-    raise
-
-# ==============================
-# 🔸 Data Transformation Stage
-# ==============================
-STAGE_NAME = "Data Transformation Stage"
-try:
-    logger.info(f">>>>>> Stage: {STAGE_NAME} started <<<<<<")
-    obj = DataTransformationPipeline()
-    obj.initiate_data_transformation()
-    logger.info(f">>>>>> Stage: {STAGE_NAME} completed <<<<<<\n{'x' * 10}")
-except Exception as e:
-    logger.exception(e)
-    raise
-
-# ==============================
-# 🔸 Model Trainer Stage
-# ==============================
-STAGE_NAME = "Model Trainer Stage"
-try:
-    logger.info(f">>>>>> Stage: {STAGE_NAME} started <<<<<<")
-    obj = ModelTrainerPipeline()
-    obj.initiate_model_trainer()
-    logger.info(f">>>>>> Stage: {STAGE_NAME} completed <<<<<<\n{'x' * 10}")
-except Exception as e:
-    logger.exception(e)
-    raise
+parser = argparse.ArgumentParser(description="Run the wine quality ML pipeline.")
+parser.add_argument(
+    "--force", action="store_true",
+    help="Re-run every stage, including those whose inputs are unchanged since their last successful run."
+)
+parser.add_argument(
+    "--update", nargs="+", metavar="CSV",
+    help="Update the trained model with new labeled rows only (see `incremental_training` in the config)."
+)
+parser.add_argument(
+    "--compare", action="store_true",
+    help="With --update, also refit from scratch on the same rows and report the difference."
+)
+parser.add_argument(
+    "--import-benchmark", action="store_true",
+    help="Check cold-start import times against the budgets under `import_benchmark`; exits non-zero on a regression."
+)
+parser.add_argument(
+    "--config-benchmark", action="store_true",
+    help="Time building a prediction config with and without the shared config snapshot."
+)
+parser.add_argument(
+    "--gc", action="store_true",
+    help="Trim the content-addressed artifact store to `artifact_store.max_bytes`."
+)
+parser.add_argument(
+    "--load-test", action="store_true",
+    help="Send concurrent requests to a running server's /predict and report p50/p99 latency and requests/sec."
+)
+arguments = parser.parse_args()
 
-# ==============================
-# 🔸 Model Evaluation Stage
-# ==============================
-STAGE_NAME = "Model Evaluation Stage"
-try:
-    logger.info(f">>>>>> Stage: {STAGE_NAME} started <<<<<<")
-    obj = ModelEvaluationPipeline()
-    obj.initiate_model_evaluation()
-    logger.info(f">>>>>> Stage: {STAGE_NAME} completed <<<<<<\n{'x' * 10}")
-except Exception as e:
-    logger.exception(e)
-    raise
+if arguments.import_benchmark:
+    # ==============================
+    # 🔸 Import-Time Benchmark
+    # ==============================
+    ImportBenchmark(ConfigurationManager().get_import_benchmark_config()).run()
+elif arguments.config_benchmark:
+    # ==============================
+    # 🔸 Config Loading Benchmark
+    # ==============================
+    ConfigBenchmark(ConfigurationManager().get_config_benchmark_config()).run()
+elif arguments.gc:
+    # ==============================
+    # 🔸 Artifact Store Garbage Collection
+    # ==============================
+    store_config = ConfigurationManager().get_artifact_store_config()
+    ArtifactStore(store_config.root_dir, store_config.max_bytes, grace_seconds=store_config.gc_grace_seconds).gc()
+elif arguments.load_test:
+    # ==============================
+    # 🔸 Load Test
+    # ==============================
+    LoadTest(ConfigurationManager().get_load_test_config()).run()
+elif arguments.update:
+    # ==============================
+    # 🔸 Incremental Update
+    # ==============================
+    IncrementalTrainingPipeline().initiate_incremental_update(
+        arguments.update,
+        compare=arguments.compare
+    )
+else:
+    # ==============================
+    # 🔸 Run All Stages
+    # ==============================
+    TrainingPipeline(force=arguments.force).run()
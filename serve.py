@@ -0,0 +1,75 @@
+import os
+
+from dotenv import load_dotenv
+from gunicorn.app.base import BaseApplication
+
+from src.pilotproject import logger
+from src.pilotproject.config.configuration import ConfigurationManager
+from src.pilotproject.entity.config_entity import ServingConfig
+
+# ===================================
+# 🔹 Production Server Entry Point
+# ===================================
+
+"""
+Serves `app.py` with a preforking WSGI server (gunicorn) instead of Flask's
+single-threaded debug server:
+
+    python serve.py
+
+The master process parses the config and loads the serving model once, then
+forks the workers, which share the loaded model copy-on-write. Worker count,
+threads per worker and timeouts come from `serving` in `config/config.yaml`.
+Requires a POSIX system (gunicorn does not run on Windows).
+
+Measure it with `python main.py --load-test` (see `load_test` in the config).
+"""
+
+
+class ProductionServer(BaseApplication):
+    """
+    Gunicorn application that preloads the Flask app before forking workers.
+
+    Responsibilities:
+    - Translate the `serving` config section into gunicorn settings.
+    - Import the app and warm the model cache once, in the master.
+    - Log worker lifecycle events through the project logger.
+    """
+
+    def __init__(self, config: ServingConfig):
+        """
+        Parameters:
+            config (ServingConfig): Bind address, workers, threads and timeouts.
+        """
+        self.config = config
+        super().__init__()
+
+    def load_config(self) -> None:
+        workers = self.config.workers or 2 * (os.cpu_count() or 1) + 1
+        settings = {
+            "bind": self.config.bind,
+            "workers": workers,
+            "threads": self.config.threads,
+            "worker_class": "gthread" if self.config.threads > 1 else "sync",
+            "timeout": self.config.timeout,
+            "graceful_timeout": self.config.graceful_timeout,
+            "keepalive": self.config.keepalive,
+            "max_requests": self.config.max_requests,
+            "max_requests_jitter": self.config.max_requests_jitter,
+            "preload_app": True,  # load() runs in the master, before fork()
+            "post_fork": lambda server, worker: logger.info(f"Worker {worker.pid} forked from the preloaded master"),
+        }
+        for key, value in settings.items():
+            self.cfg.set(key, value)
+        logger.info(f"Serving on {self.config.bind} with {workers} worker(s) x {self.config.threads} thread(s)")
+
+    def load(self):
+        from app import app, preload
+
+        preload()  # Config parsed and model loaded once; workers inherit both
+        return app
+
+
+if __name__ == '__main__':
+    load_dotenv()
+    ProductionServer(ConfigurationManager().get_serving_config()).run()
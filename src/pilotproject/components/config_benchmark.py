@@ -0,0 +1,90 @@
+import time
+from pathlib import Path
+from typing import Callable
+
+import yaml
+
+from src.pilotproject import logger
+from src.pilotproject.config.configuration import ConfigurationManager
+from src.pilotproject.constants import CONFIG_FILE_PATH, PARAMS_FILE_PATH, SCHEMA_FILE_PATH
+from src.pilotproject.entity.config_entity import ConfigBenchmarkConfig
+from src.pilotproject.utils.common import save_json
+
+
+def time_per_call_ms(function: Callable[[], object], iterations: int) -> float:
+    """
+    Calls `function` `iterations` times after one warm-up call and returns the mean time in ms.
+    """
+    function()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return (time.perf_counter() - started) * 1000 / iterations
+
+
+class ConfigBenchmark:
+    """
+    Micro-benchmark of what loading the configuration costs per request.
+
+    Responsibilities:
+    - Time parsing the three YAML files with PyYAML's pure-Python and libyaml loaders.
+    - Time building a prediction config from a fresh `ConfigurationManager`, parsing the
+      files every time (the old behaviour) and from the shared snapshot.
+    - Write the report and fail when the snapshot is not at least `min_speedup` times faster.
+    """
+
+    def __init__(self, config: ConfigBenchmarkConfig):
+        """
+        Parameters:
+            config (ConfigBenchmarkConfig): Iteration counts, speed-up threshold and report path.
+        """
+        self.config = config
+
+    def _parse_ms(self, loader: type) -> float:
+        def parse():
+            for path in (CONFIG_FILE_PATH, PARAMS_FILE_PATH, SCHEMA_FILE_PATH):
+                with open(path) as file:
+                    yaml.load(file, Loader=loader)
+        return time_per_call_ms(parse, self.config.uncached_iterations)
+
+    def run(self) -> dict:
+        """
+        Runs the benchmark and writes the report.
+
+        Returns:
+            dict: Mean milliseconds per call for every variant and the snapshot speed-up.
+
+        Raises:
+            RuntimeError: If the snapshot speed-up is below `min_speedup`.
+        """
+        parse_ms = {"SafeLoader": self._parse_ms(yaml.SafeLoader)}
+        if getattr(yaml, "CSafeLoader", None) is not None:
+            parse_ms["CSafeLoader"] = self._parse_ms(yaml.CSafeLoader)
+        else:
+            logger.warning("PyYAML was built without libyaml; config files are parsed in pure Python")
+
+        uncached_ms = time_per_call_ms(
+            lambda: ConfigurationManager(cached=False).get_model_prediction_config(), self.config.uncached_iterations
+        )
+        cached_ms = time_per_call_ms(
+            lambda: ConfigurationManager().get_model_prediction_config(), self.config.cached_iterations
+        )
+        speedup = uncached_ms / cached_ms
+
+        report = {
+            "yaml_parse_ms": {loader: round(ms, 4) for loader, ms in parse_ms.items()},
+            "prediction_config_ms": {"uncached": round(uncached_ms, 4), "cached": round(cached_ms, 4)},
+            "speedup": round(speedup, 1),
+            "min_speedup": self.config.min_speedup,
+            "uncached_iterations": self.config.uncached_iterations,
+            "cached_iterations": self.config.cached_iterations,
+        }
+        save_json(Path(self.config.report_path), report)
+        logger.info(
+            f"Prediction config per request: {uncached_ms:.3f} ms parsing the YAML files, "
+            f"{cached_ms * 1000:.1f} us from the snapshot ({speedup:.0f}x); YAML parse: {report['yaml_parse_ms']}"
+        )
+
+        if speedup < self.config.min_speedup:
+            raise RuntimeError(f"Config snapshot is only {speedup:.1f}x faster than re-parsing, expected {self.config.min_speedup}x")
+        return report
@@ -1,14 +1,22 @@
 import os
-import urllib.request as request
+import shutil
+import zlib
+from pathlib import Path
 from src.pilotproject import logger
 from zipfile import ZipFile
 from src.pilotproject.entity.config_entity import DataIngestionConfig
+from src.pilotproject.utils.downloader import RangeDownloader
+
+# 'extract' writes the dataset member next to the archive; 'archive' leaves it compressed
+# and downstream stages stream it out of the zip file
+EXTRACT_MODES = ("extract", "archive")
 
 class DataIngestion:
     """
     Handles the data ingestion process:
-    - Downloads the dataset from a specified URL.
-    - Extracts the contents of the downloaded zip file.
+    - Downloads the dataset from a specified URL (parallel, resumable, checksum-verified).
+    - Extracts the configured dataset member of the zip file, or leaves it in the archive
+      for downstream stages to stream.
     """
 
     def __init__(self, config: DataIngestionConfig):
@@ -24,29 +32,56 @@ class DataIngestion:
         """
         Downloads the dataset from the source URL to a local file path.
 
-        - Skips downloading if the file already exists.
-        - Logs download metadata upon success.
+        - Skips downloading if the file already exists and matches the configured SHA-256.
+        - Otherwise fetches it with parallel HTTP range requests, resuming an interrupted
+          download, and renames it into place only after the checksum is verified.
 
         Returns:
             None
         """
-        if not os.path.exists(self.config.local_data_file):  # Download only if the file doesn't exist
-            filename, header = request.urlretrieve(
-                url=self.config.source_URL,
-                filename=self.config.local_data_file
-            )  # Download file from URL to specified local path
-
-            logger.info(f"File downloaded successfully: '{filename}'")
-            logger.debug(f"Download headers:\n{header}")
-        else:
+        downloader = RangeDownloader(
+            url=self.config.source_URL,
+            destination=Path(self.config.local_data_file),
+            sha256=self.config.sha256,
+            chunk_size=self.config.chunk_size,
+            max_workers=self.config.max_workers,
+            timeout=self.config.timeout,
+            retries=self.config.retries
+        )
+
+        if downloader.verify(Path(self.config.local_data_file)):  # Only ever written complete, via rename
             logger.info(f"File already exists at: '{self.config.local_data_file}' — skipping download")
+            return
+        if os.path.exists(self.config.local_data_file):
+            logger.warning(f"'{self.config.local_data_file}' does not match the configured SHA-256 — downloading again")
+
+        try:
+            downloader.download()
+        except Exception as e:
+            logger.error(f"Failed to download '{self.config.source_URL}': {e}")
+            raise  # Re-raise the exception for upstream handling
+
+    def _matches_member(self, path: str, size: int, crc: int) -> bool:
+        """
+        Checks whether an extracted file already holds the member's bytes (size, then CRC-32).
+        """
+        if not os.path.exists(path) or os.path.getsize(path) != size:
+            return False
+        checksum = 0
+        with open(path, 'rb') as file:
+            for block in iter(lambda: file.read(1024 * 1024), b''):
+                checksum = zlib.crc32(block, checksum)
+        return checksum == crc
 
     def extract_zip(self) -> None:
         """
-        Extracts the downloaded zip file into the specified directory.
+        Extracts the dataset member of the downloaded zip file into the specified directory.
 
-        - Ensures the target directory exists.
-        - Unzips all contents of the downloaded file.
+        - 'extract' mode writes only `member`, and skips it when the existing file has the
+          size and CRC-32 recorded in the archive; the copy is written to a temporary file
+          and renamed, so a failed extraction never leaves a truncated dataset behind.
+        - 'archive' mode only checks that the member exists: downstream stages read it
+          straight from the archive when their data path points at `local_data_file`.
         - Logs success or failure during extraction.
 
         Returns:
@@ -54,13 +89,35 @@ class DataIngestion:
         """
         unzip_dir = self.config.unzip_dir  # Target directory for extracted files
         local_data_file = self.config.local_data_file  # Path to the downloaded zip file
-
-        os.makedirs(unzip_dir, exist_ok=True)  # Ensure the directory exists
+        member = self.config.member  # Archive member holding the dataset
 
         try:
+            if self.config.extract_mode not in EXTRACT_MODES:
+                raise ValueError(f"Unknown extract mode '{self.config.extract_mode}', expected one of {EXTRACT_MODES}")
+
             with ZipFile(local_data_file, 'r') as zip_ref:
-                zip_ref.extractall(unzip_dir)  # Extract all files
-                logger.info(f"Extracted '{local_data_file}' into '{unzip_dir}'")
+                info = zip_ref.getinfo(member)  # KeyError if the archive has no such member
+
+                if self.config.extract_mode == "archive":
+                    logger.info(f"Leaving '{member}' in '{local_data_file}' ({info.file_size} bytes) — stages stream it from the archive")
+                    return
+
+                target = os.path.join(unzip_dir, member)
+                if self._matches_member(target, info.file_size, info.CRC):
+                    logger.info(f"'{target}' already matches '{member}' in '{local_data_file}' (CRC {info.CRC:08x}) — skipping extraction")
+                    return
+
+                os.makedirs(os.path.dirname(target) or ".", exist_ok=True)  # Ensure the directory exists
+                tmp_path = f"{target}.tmp.{os.getpid()}"
+                try:
+                    with zip_ref.open(info) as source, open(tmp_path, 'wb') as destination:
+                        shutil.copyfileobj(source, destination, 1024 * 1024)  # ZipFile checks the CRC at the end
+                    os.replace(tmp_path, target)
+                finally:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+
+                logger.info(f"Extracted '{member}' from '{local_data_file}' into '{unzip_dir}'")
         except Exception as e:
-            logger.error(f"Failed to extract '{local_data_file}' to '{unzip_dir}': {e}")
+            logger.error(f"Failed to extract '{member}' from '{local_data_file}' to '{unzip_dir}': {e}")
             raise  # Re-raise the exception for upstream handling
@@ -1,18 +1,50 @@
 from src.pilotproject.config.configuration import DataTransformationConfig
 import os
+import numpy as np
 import pandas as pd
-from sklearn.model_selection import train_test_split
 from src.pilotproject import logger
+from src.pilotproject.utils.common import open_data_file, read_csv_with_schema, save_index_array
+from src.pilotproject.utils.feature_store import FeatureStoreWriter
+from typing import List, Optional, Tuple
+
+# Split modes: 'memory' loads the dataset and uses sklearn; 'streaming' hashes row keys chunk by chunk
+SPLIT_MODES = ("memory", "streaming")
+
+# Split strategies selected under `Split` in params.yaml
+SPLIT_STRATEGIES = ("random", "stratified", "group", "time")
+
+
+def hash_split_mask(chunk: pd.DataFrame, key_columns: List[str], test_size: float, seed: int) -> np.ndarray:
+    """
+    Assigns rows to the test set by hashing their key with the seed.
+
+    The assignment of a row depends only on its key values and the seed, never on its
+    position or on the other rows, so it is identical across chunkings, reruns and machines.
+
+    Parameters:
+        chunk (pd.DataFrame): Rows to assign.
+        key_columns (List[str]): Columns identifying a row.
+        test_size (float): Fraction of rows to send to the test set.
+        seed (int): Seed mixed into the hash; changing it reshuffles the split.
+
+    Returns:
+        np.ndarray: Boolean mask, True for test rows.
+    """
+    hash_key = str(seed).zfill(16)[-16:]  # SipHash key must be exactly 16 bytes
+    hashes = pd.util.hash_pandas_object(chunk[key_columns], index=False, hash_key=hash_key).to_numpy()
+    unit = (hashes >> np.uint64(11)).astype(np.float64) / float(1 << 53)  # Uniform in [0, 1)
+    return unit < test_size
 
 class DataTransformation:
     """
     Handles the transformation of raw data into train-test splits.
 
     Responsibilities:
-    - Loads the preprocessed CSV dataset.
-    - Splits the dataset into training and testing sets.
-    - Saves the split files to disk.
-    - Validates the dataset before processing.
+    - Loads the preprocessed CSV dataset, or reuses a DataFrame handed over by validation.
+    - Splits the dataset with the strategy selected in params.yaml (random, stratified, group or time).
+    - Splits in memory, or by streaming the dataset in chunks for inputs larger than RAM.
+    - Saves each split as a compact array of row positions into the base dataset (`.npy`).
+    - Writes the dataset once as a memory-mappable binary feature store for later stages.
     """
 
     def __init__(self, config: DataTransformationConfig):
@@ -20,51 +52,142 @@ class DataTransformation:
         Initializes the DataTransformation class with the given config.
 
         Parameters:
-            config (DataTransformationConfig): Contains paths and settings for data transformation.
+            config (DataTransformationConfig): Contains paths, split parameters and settings for data transformation.
         """
         self.config = config
+        self.train = None  # Training split, available after an in-memory split
+        self.test = None   # Testing split, available after an in-memory split
 
-    def train_test_splitting(self, test_size: float = 0.25, random_state: int = 42) -> None:
+    def split_indices(self, data: pd.DataFrame, test_size: float, random_state: int) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Loads the dataset, splits it into training and testing sets, and saves both to disk.
+        Computes train and test row positions with the configured strategy.
 
-        - Uses specified test size and random state for reproducibility.
-        - Saves the resulting CSV files in the configured root directory.
-        - Logs output paths, shapes, and any issues encountered during the process.
+        - random: uniform random split.
+        - stratified: keeps the class proportions of `stratify_column` in both splits.
+        - group: keeps all rows sharing a `group_column` value on the same side.
+        - time: the latest rows by `time_column` (or file order when unset) form the test set.
 
         Parameters:
+            data (pd.DataFrame): Dataset to split.
             test_size (float): Proportion of data to use as the test set.
             random_state (int): Random seed for reproducibility.
 
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Sorted train and test row positions.
+        """
+        from sklearn.model_selection import GroupShuffleSplit, train_test_split  # Deferred: the streaming split never needs sklearn
+
+        split = self.config.split_params
+        strategy = split.strategy
+        positions = np.arange(len(data))
+
+        if strategy == "random":
+            train_idx, test_idx = train_test_split(positions, test_size=test_size, random_state=random_state)
+        elif strategy == "stratified":
+            train_idx, test_idx = train_test_split(
+                positions, test_size=test_size, random_state=random_state, stratify=data[split.stratify_column]
+            )
+        elif strategy == "group":
+            if not split.get("group_column"):
+                raise ValueError("The 'group' split strategy requires 'group_column' in params.yaml")
+            splitter = GroupShuffleSplit(n_splits=1, test_size=test_size, random_state=random_state)
+            train_idx, test_idx = next(splitter.split(positions, groups=data[split.group_column]))
+        elif strategy == "time":
+            order = positions if not split.get("time_column") else np.argsort(
+                data[split.time_column].to_numpy(), kind="stable"
+            )
+            n_test = int(np.ceil(len(data) * test_size))
+            train_idx, test_idx = order[:len(data) - n_test], order[len(data) - n_test:]
+        else:
+            raise ValueError(f"Unknown split strategy '{strategy}', expected one of {SPLIT_STRATEGIES}")
+
+        return np.sort(train_idx), np.sort(test_idx)
+
+    def feature_store_writer(self) -> FeatureStoreWriter:
+        """
+        Creates a writer for the binary feature store, with float32 features when downcasting is enabled.
+        """
+        target_column = self.config.target_column
+        return FeatureStoreWriter(
+            features_path=self.config.features_path,
+            target_path=self.config.target_path,
+            metadata_path=self.config.feature_metadata_path,
+            feature_columns=[column for column in self.config.all_schema if column != target_column],
+            target_column=target_column,
+            dtype="float32" if self.config.data_loading.downcast_float32 else "float64",
+            target_dtype=str(self.config.all_schema[target_column])
+        )
+
+    def train_test_splitting(
+        self,
+        test_size: Optional[float] = None,
+        random_state: Optional[int] = None,
+        data: Optional[pd.DataFrame] = None
+    ) -> None:
+        """
+        Loads the dataset, splits it into training and testing sets, and saves both index files.
+
+        - Delegates to `streaming_split` when `split_mode` is 'streaming'.
+        - Uses the strategy, test size and random state from params.yaml unless overridden.
+        - Saves train/test row positions as `.npy` files instead of copying the rows.
+        - Writes the binary feature store the trainer and evaluator memory-map.
+        - Logs output paths, sizes, and any issues encountered during the process.
+
+        Parameters:
+            test_size (Optional[float]): Proportion of data to use as the test set.
+            random_state (Optional[int]): Random seed for reproducibility.
+            data (Optional[pd.DataFrame]): Already-parsed dataset; read from `data_path` when omitted.
+
         Returns:
             None
         """
+        test_size = self.config.split_params.test_size if test_size is None else test_size
+        random_state = self.config.split_params.random_state if random_state is None else random_state
+
+        if self.config.split_mode not in SPLIT_MODES:
+            raise ValueError(f"Unknown split mode '{self.config.split_mode}', expected one of {SPLIT_MODES}")
+
+        if self.config.split_mode == "streaming":
+            return self.streaming_split(test_size=test_size, random_state=random_state)
+
         try:
             data_path = self.config.data_path  # Path to the preprocessed CSV data
-            root_dir = self.config.root_dir    # Directory to save the train/test files
 
-            data = pd.read_csv(data_path)  # Load the dataset from CSV
-            logger.info(f"Loaded dataset from: '{data_path}'")
+            if data is None:
+                with open_data_file(data_path, self.config.data_member) as source:  # Streams from a zip without extracting
+                    data = read_csv_with_schema(  # Load the dataset from CSV with schema dtypes
+                        source,
+                        self.config.all_schema,
+                        downcast_float32=self.config.data_loading.downcast_float32,
+                        engine=self.config.data_loading.engine
+                    )
+                logger.info(f"Loaded dataset from: '{data_path}'")
+            else:
+                logger.info("Using dataset handed over in memory")
 
             if data.empty:
                 logger.error("The dataset is empty. Cannot proceed with splitting.")
                 raise ValueError("Input data is empty.")
 
-            # Perform the train-test split with reproducibility
-            train, test = train_test_split(data, test_size=test_size, random_state=random_state)
-            logger.info(f"Split data into train and test sets with test_size={test_size}")
+            # Compute the split as row positions into the base dataset
+            train_idx, test_idx = self.split_indices(data, test_size=test_size, random_state=random_state)
+            logger.info(
+                f"Split data with strategy '{self.config.split_params.strategy}' "
+                f"and test_size={test_size}: {len(train_idx)} train / {len(test_idx)} test rows"
+            )
 
-            # Save training data
-            train_data_path = os.path.join(root_dir, 'train.csv')
-            train.to_csv(train_data_path, index=False)
-            logger.info(f"Training dataset saved at: '{train_data_path}'")
-            logger.info(f"Training data shape: {train.shape}")
+            save_index_array(self.config.train_index_path, train_idx, n_rows=len(data))
+            logger.info(f"Training row indices saved at: '{self.config.train_index_path}'")
 
-            # Save testing data
-            test_data_path = os.path.join(root_dir, 'test.csv')
-            test.to_csv(test_data_path, index=False)
-            logger.info(f"Testing dataset saved at: '{test_data_path}'")
-            logger.info(f"Testing data shape: {test.shape}")
+            save_index_array(self.config.test_index_path, test_idx, n_rows=len(data))
+            logger.info(f"Testing row indices saved at: '{self.config.test_index_path}'")
+
+            writer = self.feature_store_writer()
+            writer.append(data)
+            writer.close(source=str(data_path))
+
+            self.train = data.iloc[train_idx].reset_index(drop=True)
+            self.test = data.iloc[test_idx].reset_index(drop=True)
 
         except FileNotFoundError as fnf_error:
             logger.error(f"Data file not found at: '{self.config.data_path}'. Details: {fnf_error}")
@@ -73,3 +196,88 @@ class DataTransformation:
         except Exception as e:
             logger.error(f"An error occurred during train-test splitting: {e}")
             raise
+
+    def streaming_split(self, test_size: float = 0.25, random_state: int = 42) -> None:
+        """
+        Splits the dataset out of core, writing train and test row indices chunk by chunk.
+
+        - Reads `chunk_size` rows at a time, so memory stays flat regardless of the input size.
+        - Sends each row to train or test by hashing its key columns with `random_state`;
+          the 'group' strategy hashes `group_column` so groups never straddle the split.
+          'stratified' and 'time' need the whole dataset and are rejected rather than ignored.
+        - Appends row positions to temporary files and converts them to `.npy` when complete.
+        - Appends each chunk to the binary feature store in the same pass.
+
+        Parameters:
+            test_size (float): Expected proportion of rows in the test set.
+            random_state (int): Seed mixed into the row hash.
+
+        Returns:
+            None
+        """
+        try:
+            data_path = self.config.data_path
+            strategy = self.config.split_params.strategy
+
+            if strategy in ("time", "stratified"):
+                raise ValueError(f"The '{strategy}' split strategy needs the whole dataset; use split_mode 'memory'")
+            if strategy == "group":
+                if not self.config.split_params.get("group_column"):
+                    raise ValueError("The 'group' split strategy requires 'group_column' in params.yaml")
+                key_columns = [self.config.split_params.group_column]
+            else:
+                key_columns = list(self.config.row_key_columns or self.config.all_schema.keys())
+
+            outputs = {"train": self.config.train_index_path, "test": self.config.test_index_path}
+            temporary = {name: f"{path}.positions.{os.getpid()}" for name, path in outputs.items()}  # Raw int64 positions
+            rows = {"train": 0, "test": 0}
+            offset = 0
+
+            logger.info(
+                f"Streaming split of '{data_path}' in chunks of {self.config.chunk_size} rows "
+                f"(test_size={test_size}, key={key_columns})"
+            )
+
+            try:
+                files = {name: open(path, 'wb') for name, path in temporary.items()}
+                writer = self.feature_store_writer()
+                try:
+                    with open_data_file(data_path, self.config.data_member) as source, read_csv_with_schema(
+                        source,
+                        self.config.all_schema,
+                        chunksize=self.config.chunk_size
+                    ) as reader:  # Full-precision dtypes keep the row hashes stable
+                        for chunk in reader:
+                            is_test = hash_split_mask(chunk, key_columns, test_size, random_state)
+                            positions = np.arange(offset, offset + len(chunk), dtype=np.int64)
+                            for name, mask in (("train", ~is_test), ("test", is_test)):
+                                files[name].write(positions[mask].tobytes())
+                                rows[name] += int(mask.sum())
+                            writer.append(chunk)
+                            offset += len(chunk)
+                finally:
+                    for file in files.values():
+                        file.close()
+                    writer.close(source=str(data_path))
+
+                if offset == 0:
+                    logger.error("The dataset is empty. Cannot proceed with splitting.")
+                    raise ValueError("Input data is empty.")
+
+                for name in outputs:
+                    positions = np.memmap(temporary[name], dtype=np.int64, mode='r') if rows[name] else np.empty(0, np.int64)
+                    save_index_array(outputs[name], positions, n_rows=offset)
+                    del positions  # Release the memory map before the file is removed
+                    logger.info(f"{name.capitalize()} row indices saved at: '{outputs[name]}' ({rows[name]} rows)")
+            finally:
+                for path in temporary.values():
+                    if os.path.exists(path):
+                        os.remove(path)
+
+        except FileNotFoundError as fnf_error:
+            logger.error(f"Data file not found at: '{self.config.data_path}'. Details: {fnf_error}")
+            raise
+
+        except Exception as e:
+            logger.error(f"An error occurred during streaming train-test splitting: {e}")
+            raise
@@ -1,64 +1,343 @@
-from src.pilotproject.entity.config_entity import DataValidationConfig
+import json
+import time
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+import numpy as np
 import pandas as pd
+from src.pilotproject.entity.config_entity import DataValidationConfig
 from src.pilotproject import logger
+from src.pilotproject.utils.common import save_json, get_schema_dtypes, get_file_fingerprint, open_data_file
+
+# 'full' streams every row, 'sample' checks the header and a sample only, 'auto' runs the
+# sample check and repeats the full check only when the file fingerprint changes
+VALIDATION_MODES = ("auto", "full", "sample")
+
+
+def _import_parquet():
+    """
+    Imports pyarrow.parquet on demand; it is only required to validate Parquet datasets.
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Validating Parquet datasets requires 'pyarrow' (pip install pyarrow)") from e
+    return pq
+
 
 class DataValidation:
     """
     Handles validation of the raw dataset against the expected schema.
 
     Responsibilities:
-    - Reads the unzipped CSV data.
-    - Compares column names with the expected schema.
-    - Logs and writes the validation result to a status file.
+    - Streams the unzipped CSV (or Parquet) file in fixed-size chunks so memory stays bounded.
+    - Offers a constant-time sample mode that reads the header and a few rows, or the Parquet footer.
+    - Re-runs the full check only when the file fingerprint changes, in 'auto' mode.
+    - Checks column names, the dtypes declared in the schema, nulls and per-column min/max ranges.
+    - Writes a structured JSON validation report with per-column statistics.
+    - Optionally keeps the typed DataFrame so later stages can reuse it instead of re-reading the file.
     """
 
-    def __init__(self, config: DataValidationConfig):
+    def __init__(self, config: DataValidationConfig, keep_data: bool = False):
         """
         Initializes the DataValidation class with the given config.
 
         Parameters:
-            config (DataValidationConfig): Contains schema, paths, and status file location.
+            config (DataValidationConfig): Contains schema, ranges, chunk size and report location.
+            keep_data (bool): Collect the typed chunks into `self.data` while streaming.
+                Only enable this when the dataset fits in memory.
         """
         self.config = config
+        self.keep_data = keep_data
+        self.data = None  # Parsed dataset, set when validation passes and keep_data is enabled
+
+    def _new_column_stats(self, column: str) -> dict:
+        expected_range = self.config.ranges.get(column, {})
+        return {
+            "expected_dtype": str(self.config.all_schema[column]),
+            "min_allowed": expected_range.get("min"),
+            "max_allowed": expected_range.get("max"),
+            "dtype_errors": 0,    # Values that cannot be parsed as the declared dtype
+            "nulls": 0,
+            "below_min": 0,
+            "above_max": 0,
+            "min": None,          # Observed minimum over all chunks
+            "max": None,          # Observed maximum over all chunks
+        }
+
+    def _check_chunk(self, chunk: pd.DataFrame, columns: List[str], stats: dict) -> bool:
+        """
+        Updates the running statistics with one chunk and converts it to the schema dtypes in place.
+
+        Returns:
+            bool: True if the chunk has no dtype, null or range violations.
+        """
+        chunk_valid = True
+        for column in columns:
+            column_stats = stats[column]
+            raw = chunk[column]
+            values = pd.to_numeric(raw, errors="coerce")  # Unparseable values become NaN
+
+            nulls = raw.isna()
+            unparsed = values.isna() & ~nulls
+            if np.dtype(self.config.all_schema[column]).kind in "iu":
+                unparsed |= values.notna() & (values != np.floor(values))  # e.g. 5.5 in an int column
+
+            below = values < column_stats["min_allowed"] if column_stats["min_allowed"] is not None else None
+            above = values > column_stats["max_allowed"] if column_stats["max_allowed"] is not None else None
+
+            column_stats["nulls"] += int(nulls.sum())
+            column_stats["dtype_errors"] += int(unparsed.sum())
+            column_stats["below_min"] += int(below.sum()) if below is not None else 0
+            column_stats["above_max"] += int(above.sum()) if above is not None else 0
+
+            if values.notna().any():
+                chunk_min, chunk_max = float(values.min()), float(values.max())
+                column_stats["min"] = chunk_min if column_stats["min"] is None else min(column_stats["min"], chunk_min)
+                column_stats["max"] = chunk_max if column_stats["max"] is None else max(column_stats["max"], chunk_max)
+
+            if nulls.any() or unparsed.any() or (below is not None and below.any()) or (above is not None and above.any()):
+                chunk_valid = False
+            elif self.keep_data:
+                chunk[column] = values
+
+        return chunk_valid
+
+    def _is_parquet(self) -> bool:
+        return str(self.config.unzip_data_dir).endswith(".parquet")
+
+    def _read_header(self) -> List[str]:
+        """
+        Returns the dataset's column names without reading any rows.
+        """
+        if self._is_parquet():
+            pq = _import_parquet()
+            return list(pq.read_schema(self.config.unzip_data_dir).names)  # Footer only
+        with open_data_file(self.config.unzip_data_dir, self.config.data_member) as source:
+            return list(pd.read_csv(source, nrows=0).columns)
+
+    def _iter_chunks(self, columns: List[str]) -> Iterator[pd.DataFrame]:
+        """
+        Yields the dataset as DataFrames of at most `chunk_size` rows.
+        """
+        if self._is_parquet():
+            pq = _import_parquet()
+            parquet_file = pq.ParquetFile(self.config.unzip_data_dir)
+            for batch in parquet_file.iter_batches(batch_size=self.config.chunk_size, columns=columns):
+                yield batch.to_pandas()
+        else:
+            with open_data_file(self.config.unzip_data_dir, self.config.data_member) as source:
+                yield from pd.read_csv(source, usecols=columns, chunksize=self.config.chunk_size)
+
+    def _check_columns(self) -> dict:
+        """
+        Compares the dataset header with the schema.
+        """
+        header = self._read_header()
+        return {
+            "missing_columns": [column for column in self.config.all_schema if column not in header],
+            "unexpected_columns": [column for column in header if column not in self.config.all_schema],
+            "present_columns": [column for column in self.config.all_schema if column in header],
+        }
+
+    def _check_parquet_footer(self, columns: List[str], stats: dict) -> dict:
+        """
+        Validates dtypes, nulls and ranges from Parquet footer metadata alone.
+
+        Column types come from the Arrow schema, and null counts and min/max from the
+        per-row-group statistics, so no data pages are read.
+        """
+        pq = _import_parquet()
+        parquet_file = pq.ParquetFile(self.config.unzip_data_dir)
+        arrow_schema = parquet_file.schema_arrow
+        metadata = parquet_file.metadata
+
+        for column in columns:
+            column_stats = stats[column]
+            try:
+                arrow_dtype = np.dtype(arrow_schema.field(column).type.to_pandas_dtype())
+            except (NotImplementedError, TypeError):
+                arrow_dtype = None
+            if arrow_dtype != np.dtype(self.config.all_schema[column]):
+                column_stats["dtype_errors"] += metadata.num_rows  # The whole column has the wrong type
+
+            index = arrow_schema.get_field_index(column)
+            for row_group in range(metadata.num_row_groups):
+                statistics = metadata.row_group(row_group).column(index).statistics
+                if statistics is None:
+                    continue
+                column_stats["nulls"] += int(statistics.null_count or 0)
+                if not statistics.has_min_max:
+                    continue  # E.g. an all-null row group: it has nulls but no bounds
+                low, high = float(statistics.min), float(statistics.max)
+                column_stats["min"] = low if column_stats["min"] is None else min(column_stats["min"], low)
+                column_stats["max"] = high if column_stats["max"] is None else max(column_stats["max"], high)
+
+            # Footer statistics give bounds, not counts: flag the column when a bound is crossed
+            if column_stats["min"] is not None and column_stats["min_allowed"] is not None:
+                column_stats["below_min"] += int(column_stats["min"] < column_stats["min_allowed"])
+            if column_stats["max"] is not None and column_stats["max_allowed"] is not None:
+                column_stats["above_max"] += int(column_stats["max"] > column_stats["max_allowed"])
+
+        return {"rows": metadata.num_rows, "chunks": 0}
+
+    def _has_violations(self, stats: dict) -> bool:
+        return any(
+            column_stats[key]
+            for column_stats in stats.values()
+            for key in ("dtype_errors", "nulls", "below_min", "above_max")
+        )
+
+    def validate_sample(self) -> dict:
+        """
+        Fast schema check whose cost does not depend on the file size.
+
+        - CSV: reads the header plus the first `sample_rows` rows and checks them.
+        - Parquet: reads only the footer (schema and row-group statistics).
+
+        Returns:
+            dict: Validation report with `validation_status` and per-column statistics.
+        """
+        columns = self._check_columns()
+        present_columns = columns.pop("present_columns")
+        stats = {column: self._new_column_stats(column) for column in present_columns}
+
+        if self._is_parquet():
+            counts = self._check_parquet_footer(present_columns, stats)
+        else:
+            with open_data_file(self.config.unzip_data_dir, self.config.data_member) as source:
+                sample = pd.read_csv(source, usecols=present_columns, nrows=self.config.sample_rows)
+            self._check_chunk(sample, present_columns, stats)
+            counts = {"rows": len(sample), "chunks": 1}
+
+        status = not columns["missing_columns"] and not columns["unexpected_columns"] and not self._has_violations(stats)
+        return {"validation_status": bool(status), "mode": "sample", **counts, **columns, "columns": stats}
+
+    def validate_full(self) -> dict:
+        """
+        Full validation in a single streaming pass over every row.
+
+        - Compares the header with the column names specified in the schema.
+        - Reads the dataset chunk by chunk and checks dtypes, nulls and ranges per column.
+        - Collects the typed chunks into `self.data` when `keep_data` is enabled.
+
+        Returns:
+            dict: Validation report with `validation_status` and per-column statistics.
+        """
+        columns = self._check_columns()
+        present_columns = columns.pop("present_columns")
+        stats = {column: self._new_column_stats(column) for column in present_columns}
+        rows, chunks, kept = 0, 0, []
+        data_valid = True
+
+        for chunk in self._iter_chunks(present_columns):
+            chunk_valid = self._check_chunk(chunk, present_columns, stats)
+            data_valid = data_valid and chunk_valid
+            rows += len(chunk)
+            chunks += 1
+
+            if self.keep_data and data_valid:
+                kept.append(chunk)
+            elif kept:
+                kept = []  # The dataset will not be handed over, release what was collected
+
+        status = data_valid and not columns["missing_columns"] and not columns["unexpected_columns"] and rows > 0
+
+        if status and self.keep_data:
+            dtypes = get_schema_dtypes(self.config.all_schema, downcast_float32=self.config.data_loading.downcast_float32)
+            self.data = pd.concat(kept, ignore_index=True).astype(dtypes)[list(self.config.all_schema.keys())]
+
+        return {"validation_status": bool(status), "mode": "full", "rows": rows, "chunks": chunks, **columns, "columns": stats}
+
+    def _previous_full_report(self, fingerprint: str) -> Optional[dict]:
+        """
+        Returns the last report if it was a passing full validation of a file with this fingerprint.
+        """
+        status_file = Path(self.config.STATUS_FILE)
+        if not status_file.exists():
+            return None
+        with open(status_file) as file:
+            previous = json.load(file)
+        full = previous.get("full_validation") or previous
+        if full.get("mode") == "full" and full.get("validation_status") and previous.get("fingerprint") == fingerprint:
+            return full
+        return None
 
     def validate_all_columns(self) -> bool:
         """
-        Validates whether the columns in the raw CSV match the expected schema.
+        Validates the raw dataset against the schema according to the configured mode.
 
-        - Reads the dataset from the configured path.
-        - Compares actual column names with those specified in the schema.
-        - Writes the validation result to a status file.
-        - Logs progress and errors.
+        - 'full': streams every row through the column, dtype, null and range checks.
+        - 'sample': checks only the header and a sample (or the Parquet footer).
+        - 'auto': always runs the sample check, and the full check only when the file
+          fingerprint differs from the last passing full validation.
+        - Writes a JSON report with the overall status and per-column statistics.
 
         Returns:
             bool: True if validation passes, False otherwise.
         """
         try:
-            validation_status = None  # Will hold the result (True/False)
             unzip_data_dir = self.config.unzip_data_dir  # Path to the unzipped dataset
-            expected_column_names = set(self.config.all_schema.keys())  # Schema from config
-            STATUS_FILE = self.config.STATUS_FILE  # Path to store validation result
+            STATUS_FILE = self.config.STATUS_FILE  # Path to store the validation report
+            mode = self.config.mode
+            started = time.time()
+
+            if mode not in VALIDATION_MODES:
+                raise ValueError(f"Unknown validation mode '{mode}', expected one of {VALIDATION_MODES}")
+
+            fingerprint = get_file_fingerprint(Path(unzip_data_dir))
+            if str(unzip_data_dir).lower().endswith(".zip"):
+                fingerprint += f":{self.config.data_member}"  # Another member of the same archive is another dataset
+            logger.info(f"Performing data validation on '{unzip_data_dir}' (mode='{mode}')")
 
-            # Read the CSV data
-            data = pd.read_csv(unzip_data_dir)
-            data_column_names = set(data.columns)  # Actual column names from dataset
+            if mode == "full":
+                report = self.validate_full()
+            else:
+                report = self.validate_sample()
+                logger.info(f"Sample validation {'passed' if report['validation_status'] else 'failed'}")
+
+                if mode == "auto" and report["validation_status"]:
+                    previous = self._previous_full_report(fingerprint)
+                    if previous is not None:
+                        logger.info("File fingerprint unchanged since the last full validation — reusing its result")
+                        full_report = previous
+                    else:
+                        logger.info(f"File fingerprint changed — running full validation in chunks of {self.config.chunk_size} rows")
+                        full_report = self.validate_full()
+                    report["full_validation"] = full_report
+                    report["validation_status"] = full_report["validation_status"]
 
-            logger.info("Performing data validation")
+            validation_status = report["validation_status"]
+            failed_report = report.get("full_validation", report)
 
-            # Compare expected vs actual columns
-            if expected_column_names == data_column_names:
-                validation_status = True
-                logger.info("Column validation passed")
+            if validation_status:
+                logger.info(f"Data validation passed: {failed_report['rows']} rows checked")
             else:
-                validation_status = False
-                logger.warning("Column validation failed")
-                logger.debug(f"Expected columns: {expected_column_names}")
-                logger.debug(f"Found columns: {data_column_names}")
-
-            # Write validation status to a file
-            with open(STATUS_FILE, 'w') as file:
-                logger.info(f"Writing validation status to file at '{STATUS_FILE}'")
-                file.write(f'Validation Status: {validation_status}')
+                logger.warning("Data validation failed")
+                if failed_report["missing_columns"] or failed_report["unexpected_columns"]:
+                    logger.warning(
+                        f"Missing columns: {failed_report['missing_columns']}, "
+                        f"unexpected columns: {failed_report['unexpected_columns']}"
+                    )
+                for column, column_stats in failed_report["columns"].items():
+                    violations = {
+                        key: column_stats[key]
+                        for key in ("dtype_errors", "nulls", "below_min", "above_max") if column_stats[key]
+                    }
+                    if violations:
+                        logger.warning(f"Column '{column}': {violations}")
+
+            report.update(
+                data_file=str(unzip_data_dir),
+                fingerprint=fingerprint,
+                chunk_size=self.config.chunk_size,
+                validated_at=time.time(),
+                duration_seconds=round(time.time() - started, 3)
+            )
+
+            # Write the validation report to a file
+            logger.info(f"Writing validation report to file at '{STATUS_FILE}'")
+            save_json(Path(STATUS_FILE), report)
 
             return validation_status
 
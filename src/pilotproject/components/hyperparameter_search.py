@@ -0,0 +1,160 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import enet_path
+from sklearn.model_selection import KFold
+
+from src.pilotproject import logger
+from src.pilotproject.utils.common import resolve_n_jobs, save_json
+
+# Training data of the current search, set once per worker process by `_init_worker`
+_X: Optional[np.ndarray] = None
+_Y: Optional[np.ndarray] = None
+
+
+def _init_worker(x: np.ndarray, y: np.ndarray) -> None:
+    """
+    Receives the training data once per worker instead of once per task.
+    """
+    global _X, _Y
+    _X, _Y = x, y
+
+
+def _fold_path(l1_ratio: float, fold: int, train_idx: np.ndarray, val_idx: np.ndarray, alphas: np.ndarray) -> tuple:
+    """
+    Fits the whole regularization path for one l1_ratio on one fold and scores every alpha.
+
+    Each alpha starts from the previous alpha's coefficients (warm start along the path),
+    so the path costs little more than a single fit.
+
+    Returns:
+        tuple: (l1_ratio, fold, validation MSE per alpha, seconds spent).
+    """
+    started = time.perf_counter()
+    x_train, y_train = _X[train_idx], _Y[train_idx]
+    x_val, y_val = _X[val_idx], _Y[val_idx]
+
+    # Center on the training fold, as ElasticNet(fit_intercept=True) does
+    x_mean, y_mean = x_train.mean(axis=0), y_train.mean()
+    _, coefs, _ = enet_path(x_train - x_mean, y_train - y_mean, l1_ratio=l1_ratio, alphas=alphas)
+
+    intercepts = y_mean - x_mean @ coefs                       # (n_alphas,)
+    predictions = x_val @ coefs + intercepts                    # (n_val, n_alphas)
+    mse = ((predictions - y_val[:, None]) ** 2).mean(axis=0)
+    return l1_ratio, fold, mse, time.perf_counter() - started
+
+
+def alpha_grid(spec) -> np.ndarray:
+    """
+    Builds the alpha grid from params.yaml: either an explicit list or a {min, max, num} log-spaced range.
+
+    Returns:
+        np.ndarray: Alphas in decreasing order, as regularization paths require.
+    """
+    if isinstance(spec, dict):
+        alphas = np.geomspace(spec["min"], spec["max"], int(spec["num"]))
+    else:
+        alphas = np.asarray(list(spec), dtype=np.float64)
+    return np.unique(alphas)[::-1]  # Sorted, without duplicates
+
+
+class ElasticNetSearch:
+    """
+    Parallel k-fold cross-validated search over ElasticNet `alpha` and `l1_ratio`.
+
+    Responsibilities:
+    - Expand the grids or ranges configured under `ElasticNetSearch` in params.yaml.
+    - Fit one regularization path per (l1_ratio, fold) on a process pool using all cores.
+    - Rank every (alpha, l1_ratio) candidate by mean validation RMSE.
+    - Persist a results table with per-candidate timings and a JSON summary of the best candidate.
+    """
+
+    def __init__(self, search_params: dict, results_path: Path, summary_path: Path):
+        """
+        Parameters:
+            search_params (dict): `ElasticNetSearch` section of params.yaml.
+            results_path (Path): CSV file for the per-candidate results table.
+            summary_path (Path): JSON file for the best candidate and overall timings.
+        """
+        self.search_params = search_params
+        self.results_path = results_path
+        self.summary_path = summary_path
+
+    def run(self, x: pd.DataFrame, y: pd.DataFrame) -> Tuple[float, float]:
+        """
+        Runs the search and writes its results.
+
+        Parameters:
+            x (pd.DataFrame): Training features.
+            y (pd.DataFrame): One-column training target.
+
+        Returns:
+            Tuple[float, float]: Best `alpha` and `l1_ratio`.
+        """
+        params = self.search_params
+        alphas = alpha_grid(params.alpha)
+        l1_ratios = list(dict.fromkeys(float(value) for value in params.l1_ratio))  # Duplicates would share a row
+        workers = resolve_n_jobs(params.get("n_jobs", -1))
+
+        x_values = np.ascontiguousarray(x.to_numpy(dtype=np.float64))
+        y_values = np.ascontiguousarray(y.to_numpy(dtype=np.float64).ravel())
+        folds = list(KFold(n_splits=params.cv_folds, shuffle=True, random_state=params.random_state).split(x_values))
+
+        logger.info(
+            f"Searching {len(alphas)} alphas x {len(l1_ratios)} l1_ratios with {len(folds)}-fold CV "
+            f"on {workers} worker(s)"
+        )
+        started = time.perf_counter()
+
+        mse = np.zeros((len(l1_ratios), len(folds), len(alphas)))
+        seconds = np.zeros((len(l1_ratios), len(folds)))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(x_values, y_values)) as pool:
+            futures = {
+                (row, fold): pool.submit(_fold_path, l1_ratio, fold, train_idx, val_idx, alphas)
+                for row, l1_ratio in enumerate(l1_ratios)
+                for fold, (train_idx, val_idx) in enumerate(folds)
+            }
+            for (row, fold), future in futures.items():
+                _, _, mse[row, fold], seconds[row, fold] = future.result()
+
+        total_seconds = time.perf_counter() - started
+        rmse = np.sqrt(mse)  # (l1_ratio, fold, alpha)
+
+        results = pd.DataFrame([
+            {
+                "l1_ratio": l1_ratio,
+                "alpha": alpha,
+                "mean_rmse": rmse[i, :, j].mean(),
+                "std_rmse": rmse[i, :, j].std(),
+                "path_seconds": seconds[i].sum(),                     # All folds of this l1_ratio's path
+                "fit_seconds": seconds[i].sum() / len(alphas),        # Amortized per candidate
+            }
+            for i, l1_ratio in enumerate(l1_ratios)
+            for j, alpha in enumerate(alphas)
+        ])
+        results["rank"] = results["mean_rmse"].rank(method="min").astype(int)
+        results = results.sort_values("rank").reset_index(drop=True)
+        results.to_csv(self.results_path, index=False)
+        logger.info(f"Search results for {len(results)} candidates saved at: '{self.results_path}'")
+
+        best = results.iloc[0]
+        summary = {
+            "best_alpha": float(best.alpha),
+            "best_l1_ratio": float(best.l1_ratio),
+            "best_mean_rmse": float(best.mean_rmse),
+            "candidates": len(results),
+            "cv_folds": len(folds),
+            "workers": workers,
+            "total_seconds": round(total_seconds, 3),
+            "cpu_seconds": round(float(seconds.sum()), 3),
+        }
+        save_json(Path(self.summary_path), summary)
+        logger.info(
+            f"Best candidate: alpha={summary['best_alpha']:.6g}, l1_ratio={summary['best_l1_ratio']} "
+            f"(CV RMSE {summary['best_mean_rmse']:.4f}) in {summary['total_seconds']}s"
+        )
+        return summary["best_alpha"], summary["best_l1_ratio"]
@@ -0,0 +1,105 @@
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from src.pilotproject import logger
+from src.pilotproject.entity.config_entity import ImportBenchmarkConfig
+from src.pilotproject.utils.common import save_json
+
+
+def parse_importtime(output: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Parses the stderr of `python -X importtime` into {module: (self_us, cumulative_us)}.
+    """
+    timings = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def measure_import(module: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Imports a module in a fresh interpreter and returns its `-X importtime` timings.
+
+    Raises:
+        RuntimeError: If the import fails.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing '{module}' failed:\n{completed.stderr[-2000:]}")
+    return parse_importtime(completed.stderr)
+
+
+class ImportBenchmark:
+    """
+    Guards the cold-start cost of the web server and the CLI entry points.
+
+    Responsibilities:
+    - Import each budgeted module in fresh interpreters with `-X importtime`.
+    - Compare the median cumulative import time with the module's budget.
+    - Fail when a module pulls in a package it must load lazily (e.g. sklearn, mlflow).
+    - Report the heaviest top-level dependencies so a regression can be traced.
+    """
+
+    def __init__(self, config: ImportBenchmarkConfig):
+        """
+        Parameters:
+            config (ImportBenchmarkConfig): Budgets, repeat count and report location.
+        """
+        self.config = config
+
+    def run(self) -> dict:
+        """
+        Measures every budgeted module and writes the report.
+
+        Returns:
+            dict: Per-module median time, budget, forbidden packages loaded and heaviest imports.
+
+        Raises:
+            RuntimeError: If any module exceeds its budget or imports a forbidden package.
+        """
+        report, failures = {}, []
+        for module, budget in self.config.budgets.items():
+            measure_import(module)  # Warm-up: compile .pyc files so every measured run is a cold start of a warm install
+
+            runs = [measure_import(module) for _ in range(self.config.repeats)]
+            median_ms = statistics.median(run[module][1] for run in runs) / 1000
+
+            loaded = {name.split(".")[0] for name in runs[-1]}
+            forbidden: List[str] = sorted(loaded & set(budget.get("forbidden", [])))
+            heaviest = sorted(
+                ((name, cumulative) for name, (_, cumulative) in runs[-1].items() if "." not in name and name != module),
+                key=lambda item: item[1], reverse=True
+            )[:10]
+
+            report[module] = {
+                "median_ms": round(median_ms, 1),
+                "max_ms": budget.max_ms,
+                "forbidden_loaded": forbidden,
+                "modules_imported": len(runs[-1]),
+                "heaviest_ms": {name: round(cumulative / 1000, 1) for name, cumulative in heaviest},
+            }
+            logger.info(f"Import '{module}': {median_ms:.1f} ms (budget {budget.max_ms} ms), forbidden loaded: {forbidden}")
+
+            if median_ms > budget.max_ms:
+                failures.append(f"'{module}' took {median_ms:.1f} ms to import (budget {budget.max_ms} ms)")
+            if forbidden:
+                failures.append(f"'{module}' imports {forbidden} at module level")
+
+        save_json(Path(self.config.report_path), report)
+
+        if failures:
+            message = "Import-time budget exceeded:\n- " + "\n- ".join(failures)
+            logger.error(message)
+            raise RuntimeError(message)
+
+        logger.info("All modules are within their import-time budgets")
+        return report
@@ -0,0 +1,326 @@
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from src.pilotproject import logger
+from src.pilotproject.components.model_registry import backend_name
+from src.pilotproject.entity.config_entity import IncrementalTrainingConfig
+from src.pilotproject.utils.common import get_file_hash, read_csv_with_schema, save_json
+from src.pilotproject.utils.feature_store import load_feature_split
+
+if TYPE_CHECKING:
+    from sklearn.linear_model import ElasticNet
+
+
+@dataclass
+class SufficientStatistics:
+    """
+    Running sums that determine the ElasticNet least-squares problem exactly.
+
+    With these, the model for all rows seen so far can be refit without re-reading
+    any of them; the summary is O(n_features^2) regardless of the number of rows.
+    """
+    feature_columns: List[str]
+    n: int = 0
+    sum_x: Optional[np.ndarray] = None    # (k,)
+    sum_y: float = 0.0
+    sum_xx: Optional[np.ndarray] = None   # (k, k)
+    sum_xy: Optional[np.ndarray] = None   # (k,)
+    sum_yy: float = 0.0
+    sources: List[str] = field(default_factory=list)  # Batches folded in so far
+    model_sha256: Optional[str] = None  # Model file the summary was last refit into
+
+    def add(self, x: np.ndarray, y: np.ndarray, source: str) -> None:
+        """
+        Folds a batch of rows into the running sums.
+        """
+        k = len(self.feature_columns)
+        if self.sum_x is None:
+            self.sum_x, self.sum_xx, self.sum_xy = np.zeros(k), np.zeros((k, k)), np.zeros(k)
+
+        self.n += x.shape[0]
+        self.sum_x += x.sum(axis=0)
+        self.sum_y += float(y.sum())
+        self.sum_xx += x.T @ x
+        self.sum_xy += x.T @ y
+        self.sum_yy += float(y @ y)
+        self.sources.append(source)
+
+    def centered(self):
+        """
+        Returns means, the centered Gram matrix and the centered X'y, both divided by n.
+        """
+        x_mean, y_mean = self.sum_x / self.n, self.sum_y / self.n
+        gram = self.sum_xx / self.n - np.outer(x_mean, x_mean)
+        xy = self.sum_xy / self.n - x_mean * y_mean
+        return x_mean, y_mean, gram, xy
+
+    def save(self, path: Path) -> None:
+        tmp_path = f"{path}.tmp.{os.getpid()}.npz"
+        np.savez(
+            tmp_path,
+            feature_columns=np.array(self.feature_columns), n=self.n, sum_x=self.sum_x, sum_y=self.sum_y,
+            sum_xx=self.sum_xx, sum_xy=self.sum_xy, sum_yy=self.sum_yy, sources=np.array(self.sources),
+            model_sha256=np.array(self.model_sha256 or "")
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "SufficientStatistics":
+        with np.load(path) as data:
+            return cls(
+                feature_columns=[str(column) for column in data["feature_columns"]],
+                n=int(data["n"]), sum_x=data["sum_x"], sum_y=float(data["sum_y"]), sum_xx=data["sum_xx"],
+                sum_xy=data["sum_xy"], sum_yy=float(data["sum_yy"]), sources=[str(s) for s in data["sources"]],
+                model_sha256=str(data["model_sha256"]) or None if "model_sha256" in data.files else None
+            )
+
+
+def fit_elastic_net_from_statistics(
+    stats: SufficientStatistics,
+    alpha: float,
+    l1_ratio: float,
+    max_iter: int = 10000,
+    tol: float = 1e-8,
+    warm_start: Optional[np.ndarray] = None
+) -> "ElasticNet":
+    """
+    Solves ElasticNet by coordinate descent on the Gram matrix of the accumulated rows.
+
+    Minimizes the same objective as `sklearn.linear_model.ElasticNet` with `fit_intercept=True`:
+    1/(2n) ||y - Xw - b||^2 + alpha * l1_ratio * ||w||_1 + 0.5 * alpha * (1 - l1_ratio) * ||w||^2.
+
+    Parameters:
+        stats (SufficientStatistics): Running sums of all rows to fit on.
+        alpha (float): Regularization strength.
+        l1_ratio (float): L1/L2 mix.
+        max_iter (int): Maximum coordinate descent sweeps.
+        tol (float): Stop when the largest coefficient change in a sweep is below this.
+        warm_start (Optional[np.ndarray]): Coefficients to start from, e.g. the previous model's.
+
+    Returns:
+        ElasticNet: A fitted estimator usable anywhere the trainer's model is.
+    """
+    x_mean, y_mean, gram, xy = stats.centered()
+    l1, l2 = alpha * l1_ratio, alpha * (1.0 - l1_ratio)
+    coef = np.zeros(len(xy)) if warm_start is None else np.array(warm_start, dtype=np.float64)
+
+    for n_iter in range(1, max_iter + 1):
+        max_change = 0.0
+        for j in range(len(coef)):
+            if gram[j, j] == 0.0:
+                continue
+            rho = xy[j] - gram[j] @ coef + gram[j, j] * coef[j]
+            new = np.sign(rho) * max(abs(rho) - l1, 0.0) / (gram[j, j] + l2)
+            max_change = max(max_change, abs(new - coef[j]))
+            coef[j] = new
+        if max_change < tol:
+            break
+
+    from sklearn.linear_model import ElasticNet  # Deferred: the solver itself only needs NumPy
+
+    model = ElasticNet(alpha=alpha, l1_ratio=l1_ratio, random_state=42)
+    model.coef_ = coef
+    model.intercept_ = float(y_mean - x_mean @ coef)
+    model.n_features_in_ = len(coef)
+    model.feature_names_in_ = np.array(stats.feature_columns, dtype=object)
+    model.n_iter_ = n_iter
+    model.dual_gap_ = 0.0
+    return model
+
+
+class IncrementalTrainer:
+    """
+    Updates the serving ElasticNet model with new labeled batches only.
+
+    Responsibilities:
+    - Keep a compact running summary (sufficient statistics) of every row trained on.
+    - Seed the summary once from the training split of the feature store.
+    - Fold in each new batch and refit exactly, warm-started from the current model and
+      with its hyperparameters, so a tuned model keeps its alpha and l1_ratio.
+    - Compare the incremental model with a full retrain on the same rows, on request.
+    """
+
+    def __init__(self, config: IncrementalTrainingConfig):
+        """
+        Parameters:
+            config (IncrementalTrainingConfig): Paths, hyperparameters and solver settings.
+        """
+        self.config = config
+
+    def _load_batch(self, batch_path: Path):
+        data = read_csv_with_schema(batch_path, self.config.all_schema)
+        missing = set(self.config.all_schema) - set(data.columns)
+        if missing:
+            raise ValueError(f"Batch '{batch_path}' is missing columns: {sorted(missing)}")
+        x = data[[column for column in self.config.all_schema if column != self.config.target_column]]
+        return x, data[[self.config.target_column]]
+
+    def _base_split(self, index_path: Path):
+        return load_feature_split(
+            self.config.features_path, self.config.target_path, self.config.feature_metadata_path, index_path
+        )
+
+    def _pending_path(self) -> Path:
+        return Path(f"{self.config.stats_path}.pending.npz")
+
+    def load_statistics(self) -> SufficientStatistics:
+        """
+        Loads the running summary, seeding it from the training split on first use
+        or after the full pipeline has retrained the model.
+
+        The summary belongs to the model whose SHA-256 it recorded; timestamps are not
+        trusted, since restoring or copying artifacts changes them.
+        """
+        stats_path = Path(self.config.stats_path)
+        model_path = Path(self.config.model_path)
+        pending_path = self._pending_path()
+        if pending_path.exists():  # An update was interrupted while swapping the files
+            if model_path.exists() and get_file_hash(model_path) == SufficientStatistics.load(pending_path).model_sha256:
+                os.replace(pending_path, stats_path)  # The model was swapped in; finish the commit
+            else:
+                pending_path.unlink()
+
+        if stats_path.exists():
+            stats = SufficientStatistics.load(stats_path)
+            if not model_path.exists():
+                return stats
+            if stats.model_sha256 is None:  # Written before model hashes were recorded
+                if stats_path.stat().st_mtime >= model_path.stat().st_mtime:
+                    return stats
+            elif get_file_hash(model_path) == stats.model_sha256:
+                return stats
+            logger.info(f"'{model_path}' was retrained since the running summary was built ({stats.n} rows, {len(stats.sources)} source(s))")
+
+        logger.info("No current running summary — seeding it from the training split of the feature store")
+        x, y = self._base_split(self.config.train_index_path)
+        stats = SufficientStatistics(feature_columns=list(x.columns))
+        stats.add(x.to_numpy(np.float64), y.to_numpy(np.float64).ravel(), source=str(self.config.train_index_path))
+        return stats
+
+    def update(self, batch_path: Path) -> dict:
+        """
+        Folds a new labeled batch into the summary, refits and swaps in the model.
+
+        Parameters:
+            batch_path (Path): CSV file with the schema columns, including the target.
+
+        Returns:
+            dict: Rows added, total rows and update duration.
+        """
+        try:
+            started = time.perf_counter()
+            stats = self.load_statistics()
+
+            x, y = self._load_batch(batch_path)
+            if list(x.columns) != stats.feature_columns:
+                raise ValueError(f"Batch '{batch_path}' columns do not match the trained features")
+            stats.add(x.to_numpy(np.float64), y.to_numpy(np.float64).ravel(), source=str(batch_path))
+
+            previous = joblib.load(self.config.model_path) if os.path.exists(self.config.model_path) else None
+            if previous is not None and backend_name(previous) != "ElasticNet":
+                raise ValueError(
+                    f"Incremental updates only support ElasticNet, but '{self.config.model_path}' "
+                    f"holds a {backend_name(previous)} model"
+                )
+            # Keep the hyperparameters of the model being updated (e.g. from ElasticNetSearch)
+            alpha = previous.alpha if previous is not None else self.config.alpha
+            l1_ratio = previous.l1_ratio if previous is not None else self.config.l1_ratio
+            model = fit_elastic_net_from_statistics(
+                stats,
+                alpha=alpha,
+                l1_ratio=l1_ratio,
+                max_iter=self.config.max_iter,
+                tol=self.config.tol,
+                warm_start=getattr(previous, "coef_", None)
+            )
+
+            # Pending summary, then the model, then the summary: `load_statistics` completes or
+            # discards a pending summary, so a crash at any point leaves the two matching
+            tmp_model_path = f"{self.config.model_path}.tmp.{os.getpid()}"
+            joblib.dump(model, tmp_model_path)
+            stats.model_sha256 = get_file_hash(Path(tmp_model_path))
+            stats.save(self._pending_path())
+            os.replace(tmp_model_path, self.config.model_path)
+            os.replace(self._pending_path(), self.config.stats_path)
+
+            result = {
+                "batch": str(batch_path),
+                "rows_added": int(len(x)),
+                "total_rows": stats.n,
+                "batches": len(stats.sources),
+                "alpha": alpha,
+                "l1_ratio": l1_ratio,
+                "n_iter": model.n_iter_,
+                "seconds": round(time.perf_counter() - started, 4),
+            }
+            logger.info(f"Incremental update applied: {result}")
+            return result
+
+        except Exception as e:
+            logger.error(f"An error occurred during the incremental update: {e}")
+            raise
+
+    def compare_with_full_retrain(self) -> dict:
+        """
+        Refits from scratch on every row in the summary and compares it with the incremental model.
+
+        This re-reads the training split and every batch, so it is a verification tool and
+        not part of the update path.
+
+        Returns:
+            dict: Coefficient difference, test-split RMSE of both models and their fit times.
+        """
+        try:
+            stats = SufficientStatistics.load(Path(self.config.stats_path))
+            incremental = joblib.load(self.config.model_path)
+
+            started = time.perf_counter()
+            parts = [self._base_split(self.config.train_index_path)]
+            parts += [self._load_batch(Path(source)) for source in stats.sources[1:]]
+            x_all = pd.concat([x for x, _ in parts], ignore_index=True)
+            y_all = pd.concat([y for _, y in parts], ignore_index=True)
+            read_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            from sklearn.linear_model import ElasticNet
+
+            alpha, l1_ratio = incremental.alpha, incremental.l1_ratio  # Same hyperparameters as the model compared
+            full = ElasticNet(alpha=alpha, l1_ratio=l1_ratio, random_state=42)
+            full.fit(x_all, y_all)
+            full_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            fit_elastic_net_from_statistics(stats, alpha, l1_ratio, self.config.max_iter, self.config.tol)
+            incremental_seconds = time.perf_counter() - started
+
+            x_test, y_test = self._base_split(self.config.test_index_path)
+            y_true = y_test.to_numpy(np.float64).ravel()
+
+            def rmse(model) -> float:
+                return float(np.sqrt(np.mean((model.predict(x_test) - y_true) ** 2)))
+
+            report = {
+                "rows": int(len(x_all)),
+                "batches": len(stats.sources) - 1,
+                "max_abs_coef_diff": float(np.max(np.abs(incremental.coef_ - np.ravel(full.coef_)))),
+                "intercept_diff": float(abs(incremental.intercept_ - np.ravel(full.intercept_)[0])),
+                "incremental_test_rmse": rmse(incremental),
+                "full_retrain_test_rmse": rmse(full),
+                "incremental_refit_seconds": round(incremental_seconds, 4),
+                "full_retrain_seconds": round(full_seconds, 4),
+                "full_retrain_read_seconds": round(read_seconds, 4),  # Re-reading history, avoided by updates
+            }
+            save_json(Path(self.config.comparison_path), report)
+            logger.info(f"Incremental vs full retrain: {report}")
+            return report
+
+        except Exception as e:
+            logger.error(f"An error occurred while comparing with a full retrain: {e}")
+            raise
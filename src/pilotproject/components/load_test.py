@@ -0,0 +1,134 @@
+import http.client
+import json
+import threading
+import time
+from pathlib import Path
+from typing import List
+from urllib.parse import urlencode, urlparse
+
+import numpy as np
+
+from src.pilotproject import logger
+from src.pilotproject.entity.config_entity import LoadTestConfig
+from src.pilotproject.utils.common import save_json
+
+# One representative row, keyed by the form field names of the prediction UI
+SAMPLE_FORM = {
+    "fixed_acidity": 7.4, "volatile_acidity": 0.7, "citric_acid": 0.0, "residual_sugar": 1.9,
+    "chlorides": 0.076, "free_sulfur_dioxide": 11.0, "total_sulfur_dioxide": 34.0, "density": 0.9978,
+    "pH": 3.51, "sulphates": 0.56, "alcohol": 9.4,
+}
+
+
+class LoadTest:
+    """
+    Closed-loop HTTP load generator for the prediction endpoint.
+
+    Responsibilities:
+    - Keep `concurrency` persistent connections busy, each sending its next request as soon as
+      the previous response arrives.
+    - Send untimed warm-up requests first so worker start-up and model loading are excluded.
+    - Report p50/p90/p99 latency, requests per second and error counts.
+    """
+
+    def __init__(self, config: LoadTestConfig):
+        """
+        Parameters:
+            config (LoadTestConfig): Target URL, concurrency and request counts.
+        """
+        self.config = config
+        url = urlparse(self.config.url)
+        self.host, self.port = url.hostname, url.port or 80
+        self.path = url.path or "/"
+        if self.config.format == "json":
+            # Same row keyed by schema column name ('fixed_acidity' -> 'fixed acidity')
+            self.body = json.dumps({name.replace("_", " "): value for name, value in SAMPLE_FORM.items()})
+            self.headers = {"Content-Type": "application/json"}
+        elif self.config.format == "form":
+            self.body = urlencode(SAMPLE_FORM)
+            self.headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        else:
+            raise ValueError(f"Unknown load test format '{self.config.format}', expected 'form' or 'json'")
+
+    def _worker(self, n_requests: int, latencies: List[float], errors: List[str]) -> None:
+        connection = http.client.HTTPConnection(self.host, self.port, timeout=self.config.timeout)
+        try:
+            for _ in range(n_requests):
+                started = time.perf_counter()
+                try:
+                    connection.request("POST", self.path, body=self.body, headers=self.headers)
+                    response = connection.getresponse()
+                    response.read()
+                    if response.status != 200:
+                        errors.append(f"HTTP {response.status}")
+                        continue
+                    latencies.append(time.perf_counter() - started)
+                except (OSError, http.client.HTTPException) as e:
+                    errors.append(type(e).__name__)
+                    connection.close()  # Reconnects on the next request
+        finally:
+            connection.close()
+
+    def _run_phase(self, total_requests: int):
+        """
+        Spreads `total_requests` over the connections and returns latencies, errors and wall time.
+        """
+        latencies: List[float] = []  # list.append is atomic, so threads can share these
+        errors: List[str] = []
+        concurrency = max(1, min(self.config.concurrency, total_requests))
+        shares = [total_requests // concurrency + (i < total_requests % concurrency) for i in range(concurrency)]
+        threads = [threading.Thread(target=self._worker, args=(share, latencies, errors)) for share in shares]
+
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return latencies, errors, time.perf_counter() - started
+
+    def run(self) -> dict:
+        """
+        Runs the warm-up and the timed phase, then writes the report.
+
+        Returns:
+            dict: Latency percentiles (ms), throughput and error counts.
+
+        Raises:
+            RuntimeError: If no request succeeded, e.g. because the server is not running.
+        """
+        logger.info(
+            f"Load testing {self.config.url}: {self.config.requests} request(s) over "
+            f"{self.config.concurrency} connection(s) after {self.config.warmup_requests} warm-up request(s)"
+        )
+        if self.config.warmup_requests:
+            self._run_phase(self.config.warmup_requests)
+
+        latencies, errors, elapsed = self._run_phase(self.config.requests)
+        if not latencies:
+            raise RuntimeError(f"No successful responses from {self.config.url} (errors: {sorted(set(errors))})")
+
+        latencies_ms = np.array(latencies) * 1000
+        report = {
+            "url": self.config.url,
+            "format": self.config.format,
+            "concurrency": self.config.concurrency,
+            "requests": self.config.requests,
+            "succeeded": len(latencies),
+            "errors": len(errors),
+            "error_types": {error: errors.count(error) for error in sorted(set(errors))},
+            "seconds": round(elapsed, 3),
+            "requests_per_second": round(len(latencies) / elapsed, 1),
+            "latency_ms": {
+                "mean": round(float(latencies_ms.mean()), 3),
+                "p50": round(float(np.percentile(latencies_ms, 50)), 3),
+                "p90": round(float(np.percentile(latencies_ms, 90)), 3),
+                "p99": round(float(np.percentile(latencies_ms, 99)), 3),
+                "max": round(float(latencies_ms.max()), 3),
+            },
+        }
+        save_json(Path(self.config.report_path), report)
+        logger.info(
+            f"{report['requests_per_second']} req/s, p50 {report['latency_ms']['p50']} ms, "
+            f"p99 {report['latency_ms']['p99']} ms, {report['errors']} error(s)"
+        )
+        return report
@@ -1,14 +1,14 @@
 from src.pilotproject.config.configuration import ModelEvaluationConfig
 import numpy as np
 import pandas as pd
-from sklearn.metrics import r2_score, mean_absolute_error, mean_squared_error
 import joblib
-import mlflow
-import mlflow.sklearn
 from urllib.parse import urlparse
 from src.pilotproject.utils.common import save_json
+from src.pilotproject.utils.feature_store import load_feature_split
+from src.pilotproject.components.model_registry import backend_name
 from src.pilotproject import logger
 from pathlib import Path
+from typing import Optional
 
 class ModelEvaluation:
     """
@@ -41,13 +41,15 @@ class ModelEvaluation:
         Returns:
             tuple: (rmse, mae, r2) as floats
         """
+        from sklearn.metrics import r2_score, mean_absolute_error, mean_squared_error
+
         rmse = np.sqrt(mean_squared_error(actual, preds))
         mae = mean_absolute_error(actual, preds)
         r2 = r2_score(actual, preds)
 
         return rmse, mae, r2
 
-    def evaluate_log_with_mlflow(self) -> None:
+    def evaluate_log_with_mlflow(self, test_data: Optional[pd.DataFrame] = None) -> None:
         """
         Evaluates the model and logs the results using MLflow.
 
@@ -56,29 +58,43 @@ class ModelEvaluation:
         - Saves metrics to disk.
         - Logs metrics, parameters, and model to MLflow.
 
+        Parameters:
+            test_data (Optional[pd.DataFrame]): Already-parsed test split; sliced from
+                the feature store with `test_index_path` when omitted.
+
         Returns:
             None
         """
         try:
+            # Deferred: mlflow takes seconds to import and only this step logs to it
+            import mlflow
+            import mlflow.sklearn
+
             # Load paths and configs from config object
-            test_data_path = self.config.test_data_path
             model_path = self.config.model_path
             target_column = self.config.target_column
             mlflow_uri = self.config.mlflow_uri
             test_metric_file_path = self.config.test_metric_file_path
             all_params = self.config.all_params
 
-            # Load the test data
-            test_data = pd.read_csv(test_data_path)
-            logger.info("Loaded test dataset")
+            # Load the test data from the feature store unless it was handed over in memory
+            if test_data is None:
+                x_test, y_test = load_feature_split(
+                    self.config.features_path,
+                    self.config.target_path,
+                    self.config.feature_metadata_path,
+                    self.config.test_index_path
+                )
+                logger.info("Loaded test dataset from the feature store")
+            else:
+                logger.info("Using test dataset handed over in memory")
+                x_test = test_data.drop(target_column, axis=1)
+                y_test = test_data[[target_column]]
 
             # Load the trained model
             model = joblib.load(model_path)
-            logger.info("Loaded trained model from disk")
-
-            # Split test data into features and target
-            x_test = test_data.drop(target_column, axis=1)
-            y_test = test_data[[target_column]]
+            backend = backend_name(model)
+            logger.info(f"Loaded trained {backend} model from disk")
 
             # Set MLflow tracking URI
             mlflow.set_registry_uri(mlflow_uri)
@@ -101,7 +117,11 @@ class ModelEvaluation:
                 logger.info(f"Saved test metrics to: '{test_metric_file_path}'")
 
                 # Log parameters and metrics to MLflow
-                mlflow.log_params(all_params)
+                backend_params = all_params.get(backend) or {}
+                mlflow.log_params({  # Values the model was actually fitted with (searched, selected or configured)
+                    "backend": backend,
+                    **{name: value for name, value in model.get_params().items() if name in backend_params},
+                })
                 logger.info("Logged model parameters to MLflow")
 
                 mlflow.log_metrics(test_scores)
@@ -114,14 +134,16 @@ class ModelEvaluation:
                     mlflow.sklearn.log_model(
                         model,
                         "model",
-                        registered_model_name="ElasticNet_model",
-                        input_example=x_test.iloc[:1]
+                        registered_model_name=f"{backend}_model",
+                        input_example=x_test.iloc[:1],
+                        serialization_format="cloudpickle"  # Same trust model as the joblib artifact; tree backends are not skops-safe
                     )
                 else:
                     mlflow.sklearn.log_model(
                         model,
                         "model",
-                        input_example=x_test.iloc[:1]
+                        input_example=x_test.iloc[:1],
+                        serialization_format="cloudpickle"
                     )
 
         except FileNotFoundError as fnf_error:
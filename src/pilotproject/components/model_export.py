@@ -0,0 +1,117 @@
+import os
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+import joblib
+import numpy as np
+
+from src.pilotproject import logger
+from src.pilotproject.components.model_registry import backend_name
+from src.pilotproject.entity.config_entity import ModelExportConfig
+from src.pilotproject.utils.common import get_file_hash, save_json
+from src.pilotproject.utils.feature_store import load_feature_split
+from src.pilotproject.utils.linear_kernel import LinearKernel
+
+
+def _median_seconds(function: Callable, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return float(np.median(timings))
+
+
+class ModelExport:
+    """
+    Compiles a trained linear model into the NumPy scoring kernel used for serving.
+
+    Responsibilities:
+    - Extract coefficients, intercept and feature order from the trained model.
+    - Check that the kernel reproduces `model.predict` on the test split before publishing it.
+    - Time both scorers on single rows and on the whole split.
+    - Remove a stale kernel when the trained model is not linear, so serving falls back to the model.
+    """
+
+    def __init__(self, config: ModelExportConfig):
+        """
+        Parameters:
+            config (ModelExportConfig): Model, kernel and feature store paths plus parity settings.
+        """
+        self.config = config
+
+    def export(self) -> Optional[dict]:
+        """
+        Writes the kernel and the parity report for the current model.
+
+        Returns:
+            Optional[dict]: The parity report, or None when the model is not linear.
+
+        Raises:
+            ValueError: If the kernel's predictions differ from the model's beyond the tolerance.
+        """
+        try:
+            model = joblib.load(self.config.model_path)
+            backend = backend_name(model)
+
+            if not hasattr(model, "coef_"):
+                for path in (self.config.kernel_path, self.config.report_path):
+                    if os.path.exists(path):
+                        os.remove(path)
+                logger.info(f"{backend} is not a linear model — no scoring kernel exported, serving uses the model")
+                return None
+
+            x_test, _ = load_feature_split(
+                self.config.features_path,
+                self.config.target_path,
+                self.config.feature_metadata_path,
+                self.config.test_index_path
+            )
+            kernel = LinearKernel.from_model(
+                model, list(x_test.columns), backend=backend, model_sha256=get_file_hash(Path(self.config.model_path))
+            )
+
+            # Parity: the kernel must score exactly what the model scores
+            x_values = np.ascontiguousarray(x_test.to_numpy(dtype=np.float64))
+            model_predictions = np.ravel(model.predict(x_test))
+            kernel_predictions = kernel.predict(x_values)
+            max_abs_diff = float(np.max(np.abs(model_predictions - kernel_predictions)))
+            if max_abs_diff > self.config.parity_tolerance:
+                raise ValueError(
+                    f"Kernel predictions differ from the model by {max_abs_diff:.3g} "
+                    f"(tolerance {self.config.parity_tolerance}); kernel not exported"
+                )
+
+            repeats = self.config.latency_repeats
+            single_row, single_frame = x_values[:1], x_test.iloc[:1]
+            model_row = _median_seconds(lambda: model.predict(single_frame), repeats)
+            kernel_row = _median_seconds(lambda: kernel.predict(single_row), repeats)
+            model_batch = _median_seconds(lambda: model.predict(x_test), 10)
+            kernel_batch = _median_seconds(lambda: kernel.predict(x_values), 10)
+
+            kernel.save(Path(self.config.kernel_path))
+
+            report = {
+                "backend": backend,
+                "kernel_path": str(self.config.kernel_path),
+                "kernel_bytes": os.path.getsize(self.config.kernel_path),
+                "model_bytes": os.path.getsize(self.config.model_path),
+                "parity_rows": int(len(x_values)),
+                "max_abs_diff": max_abs_diff,
+                "model_single_row_us": model_row * 1e6,
+                "kernel_single_row_us": kernel_row * 1e6,
+                "model_batch_us_per_row": model_batch / len(x_values) * 1e6,
+                "kernel_batch_us_per_row": kernel_batch / len(x_values) * 1e6,
+                "single_row_speedup": round(model_row / kernel_row, 1),
+            }
+            save_json(Path(self.config.report_path), report)
+            logger.info(
+                f"Scoring kernel exported to '{self.config.kernel_path}': max |diff| {max_abs_diff:.3g}, "
+                f"single row {report['model_single_row_us']:.1f}us -> {report['kernel_single_row_us']:.1f}us"
+            )
+            return report
+
+        except Exception as e:
+            logger.error(f"An error occurred while exporting the scoring kernel: {e}")
+            raise
@@ -1,20 +1,26 @@
 from src.pilotproject.entity.config_entity import ModelPredictionConfig
-import joblib
+from src.pilotproject.utils.model_cache import kernel_cache, model_cache
+from src.pilotproject.utils.prediction_writer import CSVPredictionSink, get_prediction_log_writer
+from src.pilotproject.utils.prediction_store import ParquetPredictionStore
+from src.pilotproject.utils.common import read_csv_with_schema
 from pathlib import Path
 from src.pilotproject import logger
 import pandas as pd
-from typing import Any
+from typing import Any, IO, List
 import numpy as np
+import os
 
 class ModelPrediction:
     """
-    Handles prediction using a trained model and writes output to a CSV file.
+    Handles prediction using a trained model and logs the output to the prediction store.
 
     Responsibilities:
-    - Load the trained model.
-    - Predict based on input features.
-    - Format predictions with feature columns.
-    - Save results to a prediction file.
+    - Load the trained model (once per process, via the shared model cache), or the NumPy
+      scoring kernel exported from it when the model is linear.
+    - Convert single rows or whole batches into one contiguous float64 feature matrix.
+    - Predict based on input features with a single vectorized model call.
+    - Hand results to a background writer that appends them to the prediction log
+      (date-partitioned Parquet store, or a CSV file).
     """
 
     def __init__(self, config: ModelPredictionConfig):
@@ -26,47 +32,142 @@ class ModelPrediction:
         """
         self.config = config
 
-    def predict(self, data: Any) -> np.ndarray:
+        # Feature columns in schema order, i.e. every schema column except the target
+        self.feature_columns: List[str] = [
+            column for column in self.config.columns.keys()
+            if column != self.config.target_column
+        ]
+
+        if self.config.scoring_engine not in ('auto', 'kernel', 'model'):
+            raise ValueError(f"Unknown scoring_engine '{self.config.scoring_engine}', expected 'auto', 'kernel' or 'model'")
+
+        if self.config.predictions_format == 'parquet':
+            sink = ParquetPredictionStore(
+                Path(self.config.predictions_store_dir),
+                self.config.columns,
+                self.config.target_column
+            )
+        elif self.config.predictions_format == 'csv':
+            sink = CSVPredictionSink(
+                Path(self.config.predictions_file_path),
+                self.feature_columns + [self.config.target_column]
+            )
+        else:
+            raise ValueError(f"Unknown predictions_format '{self.config.predictions_format}', expected 'parquet' or 'csv'")
+
+        # Shared per-process writer; requests only enqueue, the writer thread does the disk I/O
+        self.log_writer = get_prediction_log_writer(
+            sink,
+            max_queue_rows=self.config.log_queue_size,
+            flush_rows=self.config.log_flush_rows,
+            flush_interval_seconds=self.config.log_flush_interval_seconds,
+            overflow_policy=self.config.log_overflow_policy,
+            block_timeout_seconds=self.config.log_block_timeout_seconds
+        )
+
+    def prepare_features(self, data: Any) -> np.ndarray:
         """
-        Predicts outcomes using the trained model and saves the result to a file.
+        Converts input rows into a C-contiguous float64 matrix in schema feature order.
+
+        Accepts a DataFrame, a list of dicts keyed by feature name, a list of lists,
+        a 1-D array (treated as a single row) or a 2-D array. No per-row Python loop
+        is used for array-like input.
 
         Parameters:
-            data (Any): Input data to predict on (e.g., numpy array or compatible DataFrame).
+            data (Any): Input rows to convert.
 
         Returns:
-            np.ndarray: Prediction results.
+            np.ndarray: Matrix of shape (n_rows, n_features) with dtype float64.
+
+        Raises:
+            ValueError: If columns are missing, the shape is wrong, or values are not finite.
         """
-        try:
-            model_path = self.config.model_path
-            predictions_file_path = self.config.predictions_file_path
+        if isinstance(data, list) and data and isinstance(data[0], dict):
+            data = pd.DataFrame.from_records(data)
 
-            # Extract column names from config
-            all_columns = list(self.config.columns.keys())  # Full list of columns from schema
+        if isinstance(data, pd.DataFrame):
+            missing_columns = [column for column in self.feature_columns if column not in data.columns]
+            if missing_columns:
+                raise ValueError(f"Missing feature columns: {missing_columns}")
+            matrix = data[self.feature_columns].to_numpy(dtype=np.float64)
+        else:
+            matrix = np.asarray(data, dtype=np.float64)
+            if matrix.ndim == 1:
+                matrix = matrix.reshape(1, -1)  # A single row of features
 
-            target_column = self.config.target_column  # Extract target column name
+        if matrix.ndim != 2 or matrix.shape[1] != len(self.feature_columns):
+            raise ValueError(
+                f"Expected input of shape (n_rows, {len(self.feature_columns)}), got {matrix.shape}"
+            )
 
-            logger.info("Loading model from path")
-            model = joblib.load(Path(model_path))  # Load model
+        if matrix.shape[0] == 0:
+            raise ValueError("Input contains no rows to predict")
+
+        if not np.isfinite(matrix).all():
+            raise ValueError("Input contains missing or non-finite values")
+
+        return np.ascontiguousarray(matrix)
+
+    def read_csv_batch(self, file: IO) -> np.ndarray:
+        """
+        Parses an uploaded CSV of feature rows straight into a float64 feature matrix.
 
-            logger.info("Generating predictions")
-            prediction = model.predict(data)  # Perform prediction
+        - Reads only the schema feature columns, so extra columns (e.g. the target) are ignored.
+
+        Parameters:
+            file (IO): Path or file-like object containing the CSV data with a header row.
+
+        Returns:
+            np.ndarray: Matrix of shape (n_rows, n_features) with dtype float64.
+        """
+        data = read_csv_with_schema(file, self.config.columns, usecols=self.feature_columns)
+        return self.prepare_features(data)
+
+    def get_scorer(self) -> Any:
+        """
+        Returns the object whose `predict` serves the request.
 
-            # Remove the target column to get feature columns
-            feature_columns = all_columns.copy()
-            feature_columns.remove(target_column)
+        - 'kernel' always scores with the exported NumPy kernel.
+        - 'model' always scores with the joblib model.
+        - 'auto' uses the kernel when it exists and is at least as new as the model, so a
+          retrained non-linear model, or one not yet exported, is never shadowed by an old kernel.
+
+        Returns:
+            Any: A `LinearKernel` or the deserialized model.
+        """
+        engine = self.config.scoring_engine
+        if engine == 'kernel':
+            return kernel_cache.get(Path(self.config.kernel_path))
+
+        if engine == 'auto':
+            try:
+                if os.stat(self.config.kernel_path).st_mtime_ns >= os.stat(self.config.model_path).st_mtime_ns:
+                    return kernel_cache.get(Path(self.config.kernel_path))
+            except FileNotFoundError:
+                pass  # No kernel exported (or no model yet); fall through to the model
+
+        return model_cache.get(Path(self.config.model_path))  # Served from memory unless the artifact changed
+
+    def predict(self, data: Any) -> np.ndarray:
+        """
+        Predicts outcomes using the trained model and queues the result for logging.
+
+        Parameters:
+            data (Any): Input rows to predict on (see `prepare_features` for accepted formats).
+
+        Returns:
+            np.ndarray: Prediction results, one per input row.
+        """
+        try:
+            features = self.prepare_features(data)
 
-            # Create a DataFrame from the input data using feature columns
-            data_with_predictions = pd.DataFrame(data, columns=feature_columns)
-            data_with_predictions['quality'] = prediction  # Append predictions as a new column
+            model = self.get_scorer()  # NumPy kernel or joblib model, served from memory unless the artifact changed
 
-            predictions_path = Path(predictions_file_path)
-            logger.info(f"Writing predictions to: '{predictions_path}'")
+            logger.info(f"Generating predictions for {features.shape[0]} row(s)")
+            prediction = model.predict(features)  # One vectorized call for the whole batch
 
-            # Append if file exists; otherwise create new file with header
-            if predictions_path.exists():
-                data_with_predictions.to_csv(predictions_path, mode='a', header=False, index=False)
-            else:
-                data_with_predictions.to_csv(predictions_path, index=False)
+            # Logged asynchronously; the file append happens on the writer thread
+            self.log_writer.submit(features, prediction)
 
             return prediction
 
@@ -0,0 +1,59 @@
+import importlib
+from typing import Any
+
+# CPU regressors selectable in params.yaml; each name is also the params.yaml section
+# holding that backend's hyperparameters. Classes are named by module path and imported
+# on first use, so importing the registry does not load scikit-learn.
+MODEL_REGISTRY = {
+    "ElasticNet": ("sklearn.linear_model", "ElasticNet"),
+    "Ridge": ("sklearn.linear_model", "Ridge"),
+    "HistGradientBoosting": ("sklearn.ensemble", "HistGradientBoostingRegressor"),
+    "RandomForest": ("sklearn.ensemble", "RandomForestRegressor"),
+}
+
+
+def estimator_class(backend: str) -> type:
+    """
+    Imports and returns the estimator class registered under a backend name.
+
+    Raises:
+        ValueError: If the backend is not registered.
+    """
+    if backend not in MODEL_REGISTRY:
+        raise ValueError(f"Unknown model backend '{backend}', expected one of {list(MODEL_REGISTRY)}")
+    module, name = MODEL_REGISTRY[backend]
+    return getattr(importlib.import_module(module), name)
+
+
+def build_model(backend: str, params: dict, random_state: int = 42) -> Any:
+    """
+    Instantiates a registered regressor with its params.yaml hyperparameters.
+
+    Parameters:
+        backend (str): Registry name, e.g. 'ElasticNet' or 'RandomForest'.
+        params (dict): Constructor arguments for the backend.
+        random_state (int): Seed passed to backends that accept one.
+
+    Returns:
+        Any: An unfitted scikit-learn estimator.
+
+    Raises:
+        ValueError: If the backend is not registered.
+    """
+    model_class = estimator_class(backend)
+    arguments = dict(params or {})
+    if "random_state" in model_class().get_params():
+        arguments.setdefault("random_state", random_state)
+    return model_class(**arguments)
+
+
+def backend_name(model: Any) -> str:
+    """
+    Returns the registry name of a fitted model, or its class name if it is not registered.
+    """
+    model_type = type(model)
+    for name, (module, class_name) in MODEL_REGISTRY.items():
+        # Compare by name first so checking a model never imports an unrelated sklearn module
+        if model_type.__name__ == class_name and model_type.__module__.startswith(module) and model_type is estimator_class(name):
+            return name
+    return model_type.__name__
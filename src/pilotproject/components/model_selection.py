@@ -0,0 +1,165 @@
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import train_test_split
+
+from src.pilotproject import logger
+from src.pilotproject.components.model_registry import build_model
+from src.pilotproject.utils.common import resolve_n_jobs, save_json
+
+
+def fit_backend(backend: str, params: dict, x_train: np.ndarray, y_train: np.ndarray) -> tuple:
+    """
+    Fits one backend; runs in a worker process.
+
+    Returns:
+        tuple: (fitted model, fit seconds).
+    """
+    model = build_model(backend, params)
+
+    started = time.perf_counter()
+    model.fit(x_train, y_train)
+    return model, time.perf_counter() - started
+
+
+def benchmark_backend(
+    backend: str,
+    model,
+    fit_seconds: float,
+    x_val: np.ndarray,
+    y_val: np.ndarray,
+    latency_repeats: int
+) -> dict:
+    """
+    Measures a fitted backend's accuracy, inference latency and size.
+
+    Called for one candidate at a time with no other candidate running, so the latencies
+    are not inflated by CPU contention.
+
+    Returns:
+        dict: One row of the benchmark table.
+    """
+    started = time.perf_counter()
+    predictions = model.predict(x_val)
+    batch_seconds = time.perf_counter() - started
+
+    single_row = x_val[:1]
+    timings = []
+    for _ in range(latency_repeats):  # Latency of the one-row requests the web app serves
+        started = time.perf_counter()
+        model.predict(single_row)
+        timings.append(time.perf_counter() - started)
+
+    residuals = predictions - y_val
+    return {
+        "backend": backend,
+        "rmse": float(np.sqrt(np.mean(residuals ** 2))),
+        "r2": float(1.0 - np.sum(residuals ** 2) / np.sum((y_val - y_val.mean()) ** 2)),
+        "fit_seconds": fit_seconds,
+        "single_row_latency_ms_p50": float(np.percentile(timings, 50) * 1e3),
+        "single_row_latency_ms_p99": float(np.percentile(timings, 99) * 1e3),
+        "batch_latency_us_per_row": batch_seconds / len(x_val) * 1e6,
+        "model_size_bytes": len(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)),
+    }
+
+
+class ModelSelector:
+    """
+    Benchmarks candidate backends side by side and picks one within the production budgets.
+
+    Responsibilities:
+    - Train every candidate backend in parallel on the same train/validation holdout.
+    - Then time inference for one candidate at a time, so latencies reflect an idle machine.
+    - Record validation accuracy next to fit time, per-row inference latency and model size.
+    - Choose the most accurate candidate that meets the latency and size budgets.
+    - Persist the benchmark table and the selection summary.
+    """
+
+    def __init__(self, selection_params: dict, backend_params: dict, results_path: Path, summary_path: Path):
+        """
+        Parameters:
+            selection_params (dict): `ModelSelection` section of params.yaml.
+            backend_params (dict): Hyperparameters per backend name (params.yaml sections).
+            results_path (Path): CSV file for the benchmark table.
+            summary_path (Path): JSON file for the selected backend and the budgets applied.
+        """
+        self.selection_params = selection_params
+        self.backend_params = backend_params
+        self.results_path = results_path
+        self.summary_path = summary_path
+
+    def run(self, x: pd.DataFrame, y: pd.DataFrame) -> str:
+        """
+        Benchmarks the candidates and returns the selected backend name.
+
+        Parameters:
+            x (pd.DataFrame): Training features.
+            y (pd.DataFrame): One-column training target.
+
+        Returns:
+            str: Registry name of the selected backend.
+        """
+        params = self.selection_params
+        candidates: List[str] = list(params.candidates)
+        workers = resolve_n_jobs(params.get("n_jobs", -1), limit=len(candidates))
+
+        x_train, x_val, y_train, y_val = train_test_split(
+            np.ascontiguousarray(x.to_numpy(dtype=np.float64)),
+            y.to_numpy(dtype=np.float64).ravel(),
+            test_size=params.validation_size,
+            random_state=params.random_state
+        )
+
+        candidate_params = {backend: dict(self.backend_params.get(backend) or {}) for backend in candidates}
+        logger.info(f"Training {candidates} on {workers} worker(s)")
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(fit_backend, backend, candidate_params[backend], x_train, y_train)
+                for backend in candidates
+            ]
+            fitted = [future.result() for future in futures]
+
+        logger.info("Timing inference one candidate at a time")
+        results = pd.DataFrame([
+            benchmark_backend(backend, model, fit_seconds, x_val, y_val, params.latency_repeats)
+            for backend, (model, fit_seconds) in zip(candidates, fitted)
+        ])
+
+        max_latency_ms: Optional[float] = params.get("max_latency_ms")
+        max_size_bytes: Optional[int] = params.get("max_model_size_bytes")
+        results["within_budget"] = True
+        if max_latency_ms is not None:
+            results["within_budget"] &= results["single_row_latency_ms_p99"] <= max_latency_ms
+        if max_size_bytes is not None:
+            results["within_budget"] &= results["model_size_bytes"] <= max_size_bytes
+
+        results = results.sort_values(["within_budget", "rmse"], ascending=[False, True]).reset_index(drop=True)
+        results.to_csv(self.results_path, index=False)
+        logger.info(f"Model benchmark saved at: '{self.results_path}'\n{results.to_string(index=False)}")
+
+        eligible = results[results["within_budget"]]
+        if eligible.empty:
+            raise ValueError(
+                f"No candidate meets the budgets (max_latency_ms={max_latency_ms}, "
+                f"max_model_size_bytes={max_size_bytes}); see '{self.results_path}'"
+            )
+
+        selected = str(eligible.iloc[0].backend)
+        save_json(Path(self.summary_path), {
+            "selected_backend": selected,
+            "candidates": candidates,
+            "max_latency_ms": max_latency_ms,
+            "max_model_size_bytes": max_size_bytes,
+            "validation_size": params.validation_size,
+            "candidate_params": candidate_params,
+            # Latencies are timed serially; fit times come from candidates training side by side
+            "fit_workers": workers,
+            "selected": {name: getattr(value, "item", lambda: value)() for name, value in eligible.iloc[0].items()},
+        })
+        logger.info(f"Selected model backend: '{selected}'")
+        return selected
@@ -1,19 +1,22 @@
 from src.pilotproject.entity.config_entity import ModelTrainerConfig
 import pandas as pd
-from sklearn.linear_model import ElasticNet
 import joblib
 import os
 from src.pilotproject import logger
-from typing import NoReturn
+from src.pilotproject.utils.feature_store import load_feature_split
+from src.pilotproject.components.model_registry import build_model
+from typing import NoReturn, Optional
 
 class ModelTrainer:
     """
-    Handles training of a regression model using ElasticNet.
+    Handles training of a regression model with a backend chosen in params.yaml.
 
     Responsibilities:
-    - Load training and testing datasets.
+    - Load the training rows from the memory-mapped feature store, or reuse the split handed over by transformation.
     - Split features and target column.
-    - Train the ElasticNet model.
+    - Optionally pick the backend by benchmarking the candidates against latency and size budgets.
+    - Optionally pick ElasticNet `alpha`/`l1_ratio` with a parallel cross-validated search.
+    - Train the selected backend.
     - Save the trained model to disk.
     """
 
@@ -26,45 +29,86 @@ class ModelTrainer:
         """
         self.config = config
 
-    def train(self) -> NoReturn:
+    def train(self, train_data: Optional[pd.DataFrame] = None) -> NoReturn:
         """
-        Trains the ElasticNet model and saves it to a specified path.
+        Trains the configured model backend and saves it to a specified path.
 
-        - Loads training and test datasets.
+        - Loads the training rows listed in the train index file from the feature store
+          (the test set is not needed for fitting).
         - Splits data into features and target.
-        - Trains an ElasticNet model using configured hyperparameters.
+        - Runs the hyperparameter search when `ElasticNetSearch.enabled` is set and ElasticNet is the
+          backend or one of the selection candidates, so the benchmark compares the tuned model.
+        - Benchmarks the candidate backends when `ModelSelection.enabled` is set.
+        - Trains the backend using its configured (or best searched) hyperparameters.
         - Saves the trained model as a joblib file.
 
+        Parameters:
+            train_data (Optional[pd.DataFrame]): Already-parsed training split; sliced from
+                the feature store with `train_index_path` when omitted.
+
         Returns:
             None
         """
         try:
             # Extract paths and hyperparameters from config
-            train_data_path = self.config.train_data_path
-            test_data_path = self.config.test_data_path
             target_column = self.config.target_column
-            alpha = self.config.alpha
-            l1_ratio = self.config.l1_ratio
+            backend = self.config.backend
             model_path = os.path.join(self.config.root_dir, self.config.model_name)
 
-            logger.info("Reading training data")
-            train_data = pd.read_csv(train_data_path)
+            if train_data is None:
+                logger.info("Reading training data from the feature store")
+                x_train, y_train = load_feature_split(
+                    self.config.features_path,
+                    self.config.target_path,
+                    self.config.feature_metadata_path,
+                    self.config.train_index_path
+                )
+            else:
+                logger.info("Using training data handed over in memory")
+                logger.info("Extracting features and target from training data")
+                x_train = train_data.drop(target_column, axis=1)  # Input features
+                y_train = train_data[[target_column]]             # Target column
+
+            selection_params = self.config.selection_params
+            candidates = list(selection_params.candidates) if selection_params.enabled else [backend]
+            model_params = {name: dict(self.config.model_params.get(name) or {}) for name in candidates}
+
+            # Search first, so the selector compares the tuned ElasticNet rather than the params.yaml one
+            if "ElasticNet" in candidates and self.config.search_params.enabled:
+                from src.pilotproject.components.hyperparameter_search import ElasticNetSearch
+
+                search = ElasticNetSearch(
+                    self.config.search_params,
+                    results_path=self.config.search_results_path,
+                    summary_path=self.config.search_summary_path
+                )
+                elastic_net = model_params.setdefault("ElasticNet", {})
+                elastic_net["alpha"], elastic_net["l1_ratio"] = search.run(x_train, y_train)
+
+            if selection_params.enabled:
+                from src.pilotproject.components.model_selection import ModelSelector
 
-            logger.info("Reading test data")
-            test_data = pd.read_csv(test_data_path)
+                selector = ModelSelector(
+                    selection_params,
+                    backend_params=model_params,
+                    results_path=self.config.selection_results_path,
+                    summary_path=self.config.selection_summary_path
+                )
+                backend = selector.run(x_train, y_train)
 
-            logger.info("Extracting features and target from training data")
-            x_train = train_data.drop(target_column, axis=1)  # Input features
-            y_train = train_data[[target_column]]             # Target column
+            params = model_params.get(backend) or {}
 
-            # Initialize and train ElasticNet model
-            lr = ElasticNet(alpha=alpha, l1_ratio=l1_ratio, random_state=42)
-            logger.info(f"Training ElasticNet model with alpha={alpha}, l1_ratio={l1_ratio}")
-            lr.fit(x_train, y_train)
+            # Initialize and train the selected backend
+            lr = build_model(backend, params)
+            logger.info(f"Training {backend} model with {params}")
+            lr.fit(x_train, y_train[target_column])  # 1-D target, as the tree ensembles expect
             logger.info("Model training completed")
 
-            # Save trained model to disk
-            joblib.dump(lr, model_path)
+            # Save trained model to a temporary file, then swap it in atomically so that
+            # a serving process never loads a half-written artifact
+            tmp_model_path = f"{model_path}.tmp.{os.getpid()}"
+            joblib.dump(lr, tmp_model_path)
+            os.replace(tmp_model_path, model_path)
             logger.info(f"Trained model saved to: '{model_path}'")
 
         except FileNotFoundError as fnf_error:
@@ -0,0 +1,217 @@
+import glob
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Tuple
+from urllib.parse import urlparse
+
+from src.pilotproject import logger
+from src.pilotproject.entity.config_entity import DataIngestionConfig
+from src.pilotproject.utils.common import get_file_hash, open_data_file, save_json
+from src.pilotproject.utils.downloader import RangeDownloader
+
+
+def is_url(source: str) -> bool:
+    return urlparse(source).scheme in ("http", "https")
+
+
+class ShardIngestion:
+    """
+    Builds the dataset from many source shards, ingesting each shard only once.
+
+    Responsibilities:
+    - Expand `sources` into shards: URLs are taken as they are, other entries are glob
+      patterns over local `.csv` files (or `.zip` archives holding one CSV).
+    - Skip shards recorded in the manifest; a recorded local shard whose content changed
+      is an error, since its rows are already part of the dataset.
+    - Download new URL shards and hash new local shards concurrently on `source_workers` threads.
+    - Append each new shard's rows to the dataset in source order, checking its header, and
+      commit the dataset size and the shard to the manifest after every shard.
+    - On start-up, cut off bytes appended after the last commit (an interrupted run), and
+      rebuild from scratch when the dataset no longer matches the manifest.
+    """
+
+    def __init__(self, config: DataIngestionConfig):
+        """
+        Parameters:
+            config (DataIngestionConfig): Sources, shard directory, manifest path and dataset member.
+        """
+        self.config = config
+        self.dataset_path = Path(self.config.unzip_dir) / self.config.member  # Where downstream stages read it
+        self.manifest_path = Path(self.config.manifest_path)
+
+    def _resolve_sources(self) -> List[str]:
+        """
+        Expands the configured sources into an ordered, de-duplicated list of shards.
+        """
+        shards = []
+        for source in self.config.sources:
+            if is_url(source):
+                shards.append(source)
+                continue
+            matches = sorted(glob.glob(source, recursive=True))
+            if not matches:
+                logger.warning(f"Source pattern '{source}' matches no files")
+            shards.extend(os.path.normpath(match) for match in matches)
+        return list(dict.fromkeys(shards))
+
+    def _empty_manifest(self) -> dict:
+        return {"dataset": str(self.dataset_path), "committed_bytes": 0, "header": None, "shards": {}}
+
+    def _load_manifest(self) -> dict:
+        """
+        Loads the manifest and brings the dataset back to its last committed state.
+        """
+        manifest = self._empty_manifest()
+        if self.manifest_path.exists():
+            with open(self.manifest_path) as file:
+                manifest = json.load(file)
+
+        size = os.path.getsize(self.dataset_path) if self.dataset_path.exists() else None
+        committed = manifest["committed_bytes"]
+        if manifest["shards"] and (size is None or size < committed or manifest.get("dataset") != str(self.dataset_path)):
+            logger.warning(f"'{self.dataset_path}' does not match '{self.manifest_path}' — rebuilding it from every shard")
+            manifest = self._empty_manifest()
+            committed = 0
+            size = None
+
+        if size is None or not manifest["shards"]:
+            open(self.dataset_path, 'wb').close()  # Start an empty dataset
+        elif size > committed:
+            logger.warning(f"Discarding {size - committed} byte(s) appended to '{self.dataset_path}' by an interrupted run")
+            with open(self.dataset_path, 'r+b') as file:
+                file.truncate(committed)
+        return manifest
+
+    def _local_unchanged(self, path: str, entry: dict) -> bool:
+        """
+        Checks a recorded local shard: stat first, content hash only when the stat differs.
+        """
+        stat = os.stat(path)
+        if stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]:
+            return True
+        if get_file_hash(Path(path)) == entry["sha256"]:
+            entry["mtime_ns"] = stat.st_mtime_ns  # Touched but identical
+            return True
+        return False
+
+    def _fetch(self, shard: str) -> Tuple[str, str]:
+        """
+        Makes a shard available locally and returns its path and SHA-256.
+        """
+        if not is_url(shard):
+            return shard, get_file_hash(Path(shard))
+
+        name = os.path.basename(urlparse(shard).path) or "shard"
+        destination = Path(self.config.shards_dir) / f"{hashlib.sha1(shard.encode()).hexdigest()[:12]}-{name}"  # URLs may share a file name
+        RangeDownloader(
+            url=shard,
+            destination=destination,
+            chunk_size=self.config.chunk_size,
+            max_workers=1,  # Parallelism comes from fetching several shards at once
+            timeout=self.config.timeout,
+            retries=self.config.retries
+        ).download()
+        return str(destination), get_file_hash(destination)
+
+    def _append(self, path: str, manifest: dict) -> int:
+        """
+        Appends a shard's data rows to the dataset and returns the number of bytes written.
+        """
+        with open_data_file(path) as source:  # A zip shard is read from its only member
+            stream = source if hasattr(source, "read") else open(source, 'rb')
+            try:
+                header = stream.readline().rstrip(b"\r\n").decode()
+                if not header:
+                    raise ValueError(f"Shard '{path}' is empty")
+                if manifest["header"] is None:
+                    manifest["header"] = header
+                elif header != manifest["header"]:
+                    raise ValueError(f"Shard '{path}' has header {header!r}, expected {manifest['header']!r}")
+
+                with open(self.dataset_path, 'ab') as dataset:
+                    start = dataset.tell()
+                    if start == 0:
+                        dataset.write(header.encode() + b"\n")
+                    last = b"\n"
+                    for block in iter(lambda: stream.read(1024 * 1024), b""):
+                        dataset.write(block)
+                        last = block[-1:]
+                    if last != b"\n":
+                        dataset.write(b"\n")  # The next shard must start on a new line
+                    dataset.flush()
+                    os.fsync(dataset.fileno())
+                    return dataset.tell() - start
+            finally:
+                if stream is not source:
+                    stream.close()
+
+    def ingest(self) -> dict:
+        """
+        Ingests every shard not yet recorded in the manifest.
+
+        Returns:
+            dict: Counts of new, skipped and total shards and the dataset size in bytes.
+
+        Raises:
+            ValueError: If no shard is found, a recorded local shard changed or a shard's header differs.
+        """
+        try:
+            started = time.time()
+            os.makedirs(self.config.shards_dir, exist_ok=True)
+            os.makedirs(self.dataset_path.parent, exist_ok=True)
+
+            if self.config.extract_mode != "extract":
+                raise ValueError("Shards are appended to an extracted dataset; set data_ingestion.extract_mode to 'extract'")
+            shards = self._resolve_sources()
+            if not shards:
+                raise ValueError(f"No shards found for sources {list(self.config.sources)}")
+            manifest = self._load_manifest()
+            recorded = manifest["shards"]
+
+            new_shards = []
+            for shard in shards:
+                entry = recorded.get(shard)
+                if entry is None:
+                    new_shards.append(shard)
+                elif not is_url(shard) and not self._local_unchanged(shard, entry):
+                    raise ValueError(
+                        f"Shard '{shard}' changed after it was ingested; delete '{self.manifest_path}' to rebuild the dataset"
+                    )
+            logger.info(
+                f"{len(shards)} shard(s) found: {len(new_shards)} new, {len(shards) - len(new_shards)} already ingested"
+            )
+
+            with ThreadPoolExecutor(max_workers=max(1, self.config.source_workers)) as pool:
+                fetched = pool.map(self._fetch, new_shards)  # Downloads overlap with the appends below
+
+                for shard, (path, sha256) in zip(new_shards, fetched):
+                    appended = self._append(path, manifest)
+                    manifest["committed_bytes"] = os.path.getsize(self.dataset_path)
+                    recorded[shard] = {
+                        "sha256": sha256,
+                        "bytes_appended": appended,
+                        "ingested_at": time.time(),
+                        **({} if is_url(shard) else {"size": os.path.getsize(shard), "mtime_ns": os.stat(shard).st_mtime_ns}),
+                    }
+                    save_json(self.manifest_path, manifest)  # Commit point: this shard is now part of the dataset
+                    if path != shard:
+                        os.remove(path)  # The downloaded copy is no longer needed
+                    logger.info(f"Appended shard '{shard}' ({appended} bytes) to '{self.dataset_path}'")
+
+            save_json(self.manifest_path, manifest)
+            summary = {
+                "new_shards": len(new_shards),
+                "skipped_shards": len(shards) - len(new_shards),
+                "total_shards": len(recorded),
+                "dataset_bytes": manifest["committed_bytes"],
+            }
+            logger.info(f"Shard ingestion finished in {time.time() - started:.2f}s: {summary}")
+            return summary
+
+        except Exception as e:
+            logger.error(f"Shard ingestion into '{self.dataset_path}' failed: {e}")
+            raise
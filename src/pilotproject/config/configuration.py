@@ -1,13 +1,24 @@
 import os
 from src.pilotproject.constants import * 
-from src.pilotproject.utils.common import read_yaml, create_directories
+from src.pilotproject.utils.common import read_yaml, read_yaml_snapshot, create_directories
 from src.pilotproject.entity.config_entity import (
+    DataLoadingConfig,
     DataIngestionConfig, 
     DataValidationConfig, 
     DataTransformationConfig, 
     ModelTrainerConfig, 
+    ModelExportConfig,
     ModelEvaluationConfig,
-    ModelPredictionConfig
+    IncrementalTrainingConfig,
+    ModelPredictionConfig,
+    PipelineConfig,
+    ArtifactStoreConfig,
+    TrainingJobsConfig,
+    ImportBenchmarkConfig,
+    ConfigBenchmarkConfig,
+    ServingConfig,
+    LoadTestConfig,
+    AsyncApiConfig
 )
 
 class ConfigurationManager:
@@ -15,7 +26,8 @@ class ConfigurationManager:
     Reads and manages all configuration sections for the pipeline components.
 
     Responsibilities:
-    - Load configuration, parameters, and schema YAML files.
+    - Load configuration, parameters, and schema YAML files (from the process-wide snapshot,
+      so constructing a manager only re-parses files that changed on disk).
     - Return structured config dataclasses for each pipeline stage.
     - Ensure necessary directories are created before pipeline execution.
     """
@@ -24,17 +36,39 @@ class ConfigurationManager:
         self,
         config_filepath=CONFIG_FILE_PATH,
         params_filepath=PARAMS_FILE_PATH,
-        schema_filepath=SCHEMA_FILE_PATH
+        schema_filepath=SCHEMA_FILE_PATH,
+        cached: bool = True
     ):
         """
         Initializes the ConfigurationManager by loading YAML files and creating the artifact root directory.
+
+        Parameters:
+            cached (bool): Use the shared, frozen snapshots of the files (re-parsed only when a
+                file's mtime changes) instead of parsing private copies.
         """
-        self.config = read_yaml(config_filepath)
-        self.params = read_yaml(params_filepath)
-        self.schema = read_yaml(schema_filepath)
+        load = read_yaml_snapshot if cached else read_yaml
+        self.config = load(config_filepath)
+        self.params = load(params_filepath)
+        self.schema = load(schema_filepath)
 
         create_directories(self.config.artifacts_root)  # Ensure base artifacts directory exists
 
+    def get_data_loading_config(self) -> DataLoadingConfig:
+        """
+        Prepares and returns the CSV loading options shared by all stages.
+
+        Returns:
+            DataLoadingConfig: Parser engine and dtype downcasting options.
+        """
+        config = self.config.data_loading
+
+        data_loading_config = DataLoadingConfig(
+            engine=config.engine,
+            downcast_float32=config.downcast_float32
+        )
+
+        return data_loading_config
+
     def get_data_ingestion_config(self) -> DataIngestionConfig:
         """
         Prepares and returns configuration for data ingestion.
@@ -49,7 +83,18 @@ class ConfigurationManager:
             root_dir=config.root_dir,
             source_URL=config.source_URL,
             local_data_file=config.local_data_file,
-            unzip_dir=config.unzip_dir
+            unzip_dir=config.unzip_dir,
+            member=config.member,
+            extract_mode=config.extract_mode,
+            sha256=config.sha256,
+            chunk_size=config.chunk_size,
+            max_workers=config.max_workers,
+            timeout=config.timeout,
+            retries=config.retries,
+            sources=list(config.get("sources") or []),
+            shards_dir=config.shards_dir,
+            manifest_path=config.manifest_path,
+            source_workers=config.source_workers
         )
 
         return data_ingestion_config
@@ -69,7 +114,13 @@ class ConfigurationManager:
             root_dir=config.root_dir,
             STATUS_FILE=config.STATUS_FILE,
             unzip_data_dir=config.unzip_data_dir,
-            all_schema=schema
+            data_member=self.config.data_ingestion.member,
+            all_schema=schema,
+            ranges=self.schema.get("RANGES", {}),
+            chunk_size=config.chunk_size,
+            mode=config.mode,
+            sample_rows=config.sample_rows,
+            data_loading=self.get_data_loading_config()
         )
 
         return data_validation_config
@@ -82,12 +133,26 @@ class ConfigurationManager:
             DataTransformationConfig: Configuration for the data transformation stage.
         """
         config = self.config.data_transformation
+        schema = self.schema.COLUMNS
         create_directories(config.root_dir)
 
         data_transformation_config = DataTransformationConfig(
             root_dir=config.root_dir,
             data_path=config.data_path,
-            STATUS_FILE=config.STATUS_FILE
+            data_member=self.config.data_ingestion.member,
+            STATUS_FILE=config.STATUS_FILE,
+            all_schema=schema,
+            data_loading=self.get_data_loading_config(),
+            split_mode=config.split_mode,
+            chunk_size=config.chunk_size,
+            row_key_columns=list(config.row_key_columns),
+            train_index_path=config.train_index_path,
+            test_index_path=config.test_index_path,
+            split_params=self.params.Split,
+            target_column=self.schema.TARGET_COLUMN.target_column,
+            features_path=config.features_path,
+            target_path=config.target_path,
+            feature_metadata_path=config.feature_metadata_path
         )
 
         return data_transformation_config
@@ -100,22 +165,85 @@ class ConfigurationManager:
             ModelTrainerConfig: Configuration for the model training stage.
         """
         config = self.config.model_trainer
-        params = self.params.ElasticNet
         schema = self.schema.TARGET_COLUMN
         create_directories(config.root_dir)
 
         model_trainer_config = ModelTrainerConfig(
             root_dir=config.root_dir,
-            train_data_path=config.train_data_path,
-            test_data_path=config.test_data_path,
+            features_path=config.features_path,
+            target_path=config.target_path,
+            feature_metadata_path=config.feature_metadata_path,
+            train_index_path=config.train_index_path,
             model_name=config.model_name,
-            alpha=params.alpha,
-            l1_ratio=params.l1_ratio,
+            backend=self.params.Model.backend,
+            model_params=self.params,
             target_column=schema.target_column,
+            search_params=self.params.ElasticNetSearch,
+            search_results_path=config.search_results_path,
+            search_summary_path=config.search_summary_path,
+            selection_params=self.params.ModelSelection,
+            selection_results_path=config.selection_results_path,
+            selection_summary_path=config.selection_summary_path
         )
 
         return model_trainer_config
 
+    def get_model_export_config(self) -> ModelExportConfig:
+        """
+        Prepares and returns configuration for exporting the NumPy scoring kernel.
+
+        Returns:
+            ModelExportConfig: Configuration for the model export stage.
+        """
+        config = self.config.model_export
+        create_directories(config.root_dir)
+
+        model_export_config = ModelExportConfig(
+            root_dir=config.root_dir,
+            model_path=config.model_path,
+            kernel_path=config.kernel_path,
+            report_path=config.report_path,
+            features_path=config.features_path,
+            target_path=config.target_path,
+            feature_metadata_path=config.feature_metadata_path,
+            test_index_path=config.test_index_path,
+            parity_tolerance=config.parity_tolerance,
+            latency_repeats=config.latency_repeats
+        )
+
+        return model_export_config
+
+    def get_incremental_training_config(self) -> IncrementalTrainingConfig:
+        """
+        Prepares and returns configuration for incremental model updates.
+
+        Returns:
+            IncrementalTrainingConfig: Configuration for the incremental trainer.
+        """
+        config = self.config.incremental_training
+        params = self.params.ElasticNet
+        create_directories(config.root_dir)
+
+        incremental_training_config = IncrementalTrainingConfig(
+            root_dir=config.root_dir,
+            stats_path=config.stats_path,
+            features_path=config.features_path,
+            target_path=config.target_path,
+            feature_metadata_path=config.feature_metadata_path,
+            train_index_path=config.train_index_path,
+            test_index_path=config.test_index_path,
+            model_path=config.model_path,
+            comparison_path=config.comparison_path,
+            alpha=params.alpha,
+            l1_ratio=params.l1_ratio,
+            max_iter=config.max_iter,
+            tol=config.tol,
+            target_column=self.schema.TARGET_COLUMN.target_column,
+            all_schema=self.schema.COLUMNS
+        )
+
+        return incremental_training_config
+
     def get_model_evaluation_config(self) -> ModelEvaluationConfig:
         """
         Prepares and returns configuration for model evaluation.
@@ -124,17 +252,19 @@ class ConfigurationManager:
             ModelEvaluationConfig: Configuration for the model evaluation stage.
         """
         config = self.config.model_evaluation
-        params = self.params.ElasticNet
         schema = self.schema.TARGET_COLUMN
         create_directories(config.root_dir)
 
         model_evaluation_config = ModelEvaluationConfig(
             root_dir=config.root_dir,
-            test_data_path=config.test_data_path,
+            features_path=config.features_path,
+            target_path=config.target_path,
+            feature_metadata_path=config.feature_metadata_path,
+            test_index_path=config.test_index_path,
             model_path=config.model_path,
             test_metric_file_path=config.test_metric_file_path,
             target_column=schema.target_column,
-            all_params=params,
+            all_params=self.params,
             mlflow_uri=os.getenv("MLFLOW_TRACKING_URI")
         )
 
@@ -155,9 +285,183 @@ class ConfigurationManager:
         model_prediction_config = ModelPredictionConfig(
             root_dir=config.root_dir,
             model_path=config.model_path,
+            kernel_path=config.kernel_path,
+            scoring_engine=config.scoring_engine,
             predictions_file_path=config.predictions_file_path,
+            predictions_format=config.predictions_format,
+            predictions_store_dir=config.predictions_store_dir,
             target_column=target_schema.target_column,
-            columns=col_schema
+            columns=col_schema,
+            log_queue_size=config.log_queue_size,
+            log_flush_rows=config.log_flush_rows,
+            log_flush_interval_seconds=config.log_flush_interval_seconds,
+            log_overflow_policy=config.log_overflow_policy,
+            log_block_timeout_seconds=config.log_block_timeout_seconds
         )
 
         return model_prediction_config
+
+    def get_pipeline_config(self) -> PipelineConfig:
+        """
+        Prepares and returns configuration for the stage DAG runner.
+
+        Returns:
+            PipelineConfig: Configuration for pipeline state and run manifests.
+        """
+        config = self.config.pipeline
+        create_directories(config.root_dir)
+
+        pipeline_config = PipelineConfig(
+            root_dir=config.root_dir,
+            state_file=config.state_file,
+            manifest_file=config.manifest_file,
+            lock_file=config.lock_file,
+            in_memory_handoff=config.in_memory_handoff
+        )
+
+        return pipeline_config
+
+    def get_artifact_store_config(self) -> ArtifactStoreConfig:
+        """
+        Prepares and returns configuration for the content-addressed artifact store.
+
+        Returns:
+            ArtifactStoreConfig: Store location, size budget and GC grace period.
+        """
+        config = self.config.artifact_store
+        create_directories(config.root_dir)
+
+        artifact_store_config = ArtifactStoreConfig(
+            enabled=config.enabled,
+            root_dir=config.root_dir,
+            max_bytes=config.max_bytes,
+            gc_grace_seconds=config.gc_grace_seconds
+        )
+
+        return artifact_store_config
+
+    def get_training_jobs_config(self) -> TrainingJobsConfig:
+        """
+        Prepares and returns configuration for background training jobs.
+
+        Returns:
+            TrainingJobsConfig: Configuration for the training job runner.
+        """
+        config = self.config.training_jobs
+        create_directories(config.root_dir)
+
+        training_jobs_config = TrainingJobsConfig(
+            root_dir=config.root_dir,
+            max_concurrent_jobs_per_model=config.max_concurrent_jobs_per_model,
+            model_path=config.model_path
+        )
+
+        return training_jobs_config
+
+    def get_import_benchmark_config(self) -> ImportBenchmarkConfig:
+        """
+        Prepares and returns configuration for the import-time benchmark.
+
+        Returns:
+            ImportBenchmarkConfig: Budgets and report location for the benchmark.
+        """
+        config = self.config.import_benchmark
+        create_directories(config.root_dir)
+
+        import_benchmark_config = ImportBenchmarkConfig(
+            root_dir=config.root_dir,
+            report_path=config.report_path,
+            repeats=config.repeats,
+            budgets=config.budgets
+        )
+
+        return import_benchmark_config
+
+    def get_config_benchmark_config(self) -> ConfigBenchmarkConfig:
+        """
+        Prepares and returns configuration for the config-loading benchmark.
+
+        Returns:
+            ConfigBenchmarkConfig: Iteration counts, threshold and report location.
+        """
+        config = self.config.config_benchmark
+        create_directories(config.root_dir)
+
+        config_benchmark_config = ConfigBenchmarkConfig(
+            root_dir=config.root_dir,
+            report_path=config.report_path,
+            uncached_iterations=config.uncached_iterations,
+            cached_iterations=config.cached_iterations,
+            min_speedup=config.min_speedup
+        )
+
+        return config_benchmark_config
+
+    def get_serving_config(self) -> ServingConfig:
+        """
+        Prepares and returns configuration for the production server.
+
+        Returns:
+            ServingConfig: Worker, thread and timeout settings.
+        """
+        config = self.config.serving
+
+        serving_config = ServingConfig(
+            bind=config.bind,
+            workers=config.workers,
+            threads=config.threads,
+            timeout=config.timeout,
+            graceful_timeout=config.graceful_timeout,
+            keepalive=config.keepalive,
+            max_requests=config.max_requests,
+            max_requests_jitter=config.max_requests_jitter
+        )
+
+        return serving_config
+
+    def get_load_test_config(self) -> LoadTestConfig:
+        """
+        Prepares and returns configuration for the load test harness.
+
+        Returns:
+            LoadTestConfig: Target endpoint, concurrency and request counts.
+        """
+        config = self.config.load_test
+        create_directories(config.root_dir)
+
+        load_test_config = LoadTestConfig(
+            root_dir=config.root_dir,
+            report_path=config.report_path,
+            url=config.url,
+            format=config.format,
+            concurrency=config.concurrency,
+            requests=config.requests,
+            warmup_requests=config.warmup_requests,
+            timeout=config.timeout
+        )
+
+        return load_test_config
+
+    def get_async_api_config(self) -> AsyncApiConfig:
+        """
+        Prepares and returns configuration for the async JSON prediction API.
+
+        Returns:
+            AsyncApiConfig: Server, micro-batching and payload validation settings.
+        """
+        config = self.config.async_api
+
+        async_api_config = AsyncApiConfig(
+            host=config.host,
+            port=config.port,
+            workers=config.workers,
+            max_batch_rows=config.max_batch_rows,
+            max_wait_ms=config.max_wait_ms,
+            enforce_ranges=config.enforce_ranges,
+            max_rows_per_request=config.max_rows_per_request,
+            columns=self.schema.COLUMNS,
+            target_column=self.schema.TARGET_COLUMN.target_column,
+            ranges=self.schema.get("RANGES", {})
+        )
+
+        return async_api_config
@@ -1,6 +1,15 @@
 from pathlib import Path
 from dataclasses import dataclass
 
+@dataclass
+class DataLoadingConfig:
+    """
+    Options for schema-typed CSV loading shared by all stages.
+    """
+    engine: str             # 'auto', 'pyarrow', 'c' or 'python'
+    downcast_float32: bool  # Load float64 schema columns as float32
+
+
 @dataclass
 class DataIngestionConfig:
     """
@@ -10,6 +19,17 @@ class DataIngestionConfig:
     source_URL: str
     local_data_file: Path
     unzip_dir: Path
+    member: str        # Archive member holding the dataset
+    extract_mode: str  # 'extract' or 'archive'
+    sha256: str  # Expected SHA-256 of the download; None skips verification
+    chunk_size: int
+    max_workers: int
+    timeout: float
+    retries: int
+    sources: list        # Shard URLs and local glob patterns; empty uses source_URL
+    shards_dir: Path     # Download directory for URL shards
+    manifest_path: Path  # Record of the shards already ingested
+    source_workers: int  # Shards fetched concurrently
 
 
 @dataclass
@@ -18,9 +38,15 @@ class DataValidationConfig:
     Configuration for data validation component.
     """
     root_dir: Path
-    unzip_data_dir: Path
-    STATUS_FILE: Path
-    all_schema: dict  # Expected column names and schema
+    unzip_data_dir: Path    # Dataset file, or the zip archive it is streamed from
+    data_member: str        # Archive member read when unzip_data_dir is a zip file
+    STATUS_FILE: Path       # JSON validation report
+    all_schema: dict        # Expected column names and schema
+    ranges: dict            # Allowed min/max per column
+    chunk_size: int         # Rows read per chunk while streaming
+    mode: str               # 'auto', 'full' or 'sample'
+    sample_rows: int        # Rows checked by the sample validation
+    data_loading: DataLoadingConfig
 
 
 @dataclass
@@ -29,8 +55,21 @@ class DataTransformationConfig:
     Configuration for data transformation component.
     """
     root_dir: Path
-    data_path: Path
+    data_path: Path         # Dataset file, or the zip archive it is streamed from
+    data_member: str        # Archive member read when data_path is a zip file
     STATUS_FILE: Path
+    all_schema: dict  # Column names and dtypes used when parsing the dataset
+    data_loading: DataLoadingConfig
+    split_mode: str         # 'memory' or 'streaming'
+    chunk_size: int         # Rows read per chunk in streaming mode
+    row_key_columns: list   # Columns hashed to assign rows in streaming mode
+    train_index_path: Path  # Row positions of the training split (.npy)
+    test_index_path: Path   # Row positions of the testing split (.npy)
+    split_params: dict      # Strategy, test size and seed from params.yaml `Split`
+    target_column: str
+    features_path: Path          # Feature matrix of the binary feature store (.npy)
+    target_path: Path            # Target vector of the binary feature store (.npy)
+    feature_metadata_path: Path  # Column names and dtypes of the feature store (.json)
 
 
 @dataclass
@@ -39,12 +78,59 @@ class ModelTrainerConfig:
     Configuration for model training component.
     """
     root_dir: Path
-    train_data_path: Path
-    test_data_path: Path
+    features_path: Path
+    target_path: Path
+    feature_metadata_path: Path
+    train_index_path: Path
     model_name: str  # File name to save the trained model
-    alpha: float     # Hyperparameter for ElasticNet
-    l1_ratio: float  # Hyperparameter for ElasticNet
+    backend: str     # Registered model backend, from `Model.backend` in params.yaml
+    model_params: dict  # All of params.yaml; each backend reads the section named after it
     target_column: dict
+    search_params: dict         # `ElasticNetSearch` section of params.yaml
+    search_results_path: Path   # Per-candidate results table (.csv)
+    search_summary_path: Path   # Best candidate and timings (.json)
+    selection_params: dict      # `ModelSelection` section of params.yaml
+    selection_results_path: Path  # Per-backend benchmark table (.csv)
+    selection_summary_path: Path  # Selected backend and budgets (.json)
+
+
+@dataclass
+class ModelExportConfig:
+    """
+    Configuration for exporting linear models to the NumPy scoring kernel.
+    """
+    root_dir: Path
+    model_path: Path
+    kernel_path: Path   # Exported kernel (.npz)
+    report_path: Path   # Parity and timing report (.json)
+    features_path: Path
+    target_path: Path
+    feature_metadata_path: Path
+    test_index_path: Path
+    parity_tolerance: float  # Max |kernel - model| prediction difference
+    latency_repeats: int     # Single-row predictions timed per scorer
+
+
+@dataclass
+class IncrementalTrainingConfig:
+    """
+    Configuration for incremental model updates from new labeled batches.
+    """
+    root_dir: Path
+    stats_path: Path            # Running sufficient statistics (.npz)
+    features_path: Path
+    target_path: Path
+    feature_metadata_path: Path
+    train_index_path: Path
+    test_index_path: Path
+    model_path: Path            # Serving model updated after each batch
+    comparison_path: Path       # Incremental vs full retrain report (.json)
+    alpha: float                # Used only when no trained model exists yet; otherwise the model's own
+    l1_ratio: float
+    max_iter: int
+    tol: float
+    target_column: str
+    all_schema: dict            # Column names and dtypes of incoming batches
 
 
 @dataclass
@@ -53,12 +139,15 @@ class ModelEvaluationConfig:
     Configuration for model evaluation component.
     """
     root_dir: Path
-    test_data_path: Path
+    features_path: Path
+    target_path: Path
+    feature_metadata_path: Path
+    test_index_path: Path
     model_path: Path
     test_metric_file_path: Path
     target_column: dict
     mlflow_uri: str
-    all_params: dict  # All model parameters to log with MLflow
+    all_params: dict  # All of params.yaml; the section of the evaluated backend is logged with MLflow
 
 
 @dataclass
@@ -68,6 +157,118 @@ class ModelPredictionConfig:
     """
     root_dir: Path
     model_path: Path
+    kernel_path: Path       # NumPy scoring kernel exported from linear models
+    scoring_engine: str     # 'auto', 'kernel' or 'model'
     predictions_file_path: Path
+    predictions_format: str       # 'parquet' (partitioned store) or 'csv'
+    predictions_store_dir: Path   # Root of the partitioned Parquet prediction store
     target_column: str  # Name of the column being predicted
     columns: dict       # All input feature columns (from schema)
+    log_queue_size: int               # Max prediction rows buffered for the background writer
+    log_flush_rows: int               # Flush the prediction log after this many rows
+    log_flush_interval_seconds: float # ...or after this many seconds
+    log_overflow_policy: str          # 'drop' or 'block' when the queue is full
+    log_block_timeout_seconds: float  # Max wait under the 'block' policy
+
+
+@dataclass
+class PipelineConfig:
+    """
+    Configuration for the stage DAG runner.
+    """
+    root_dir: Path
+    state_file: Path     # Stage fingerprints and output hashes from previous runs
+    manifest_file: Path  # Per-stage status and durations of the latest run
+    lock_file: Path      # Exclusive lock held for the duration of a run
+    in_memory_handoff: bool  # Pass parsed DataFrames between stages instead of re-reading them
+
+
+@dataclass
+class ArtifactStoreConfig:
+    """
+    Configuration for the content-addressed artifact store.
+    """
+    enabled: bool
+    root_dir: Path
+    max_bytes: int           # Size budget enforced by garbage collection
+    gc_grace_seconds: float  # Minimum age of an unreferenced blob before it is collected
+
+
+@dataclass
+class TrainingJobsConfig:
+    """
+    Configuration for background training jobs.
+    """
+    root_dir: Path                     # Directory for per-job status files
+    max_concurrent_jobs_per_model: int # Worker processes per model
+    model_path: Path                   # Serving model refreshed after a successful job
+
+
+@dataclass
+class ConfigBenchmarkConfig:
+    """
+    Configuration for the config-loading micro-benchmark.
+    """
+    root_dir: Path
+    report_path: Path         # Per-call timings and speed-up
+    uncached_iterations: int  # Calls timed while re-parsing the YAML files
+    cached_iterations: int    # Calls timed while reusing the snapshot
+    min_speedup: float        # Fail below this snapshot speed-up
+
+
+@dataclass
+class ImportBenchmarkConfig:
+    """
+    Configuration for the import-time (cold start) benchmark.
+    """
+    root_dir: Path
+    report_path: Path  # Per-module import times and heaviest dependencies
+    repeats: int       # Fresh interpreters per module; the median is checked
+    budgets: dict      # Module name -> {max_ms, forbidden}
+
+
+@dataclass
+class ServingConfig:
+    """
+    Configuration for the preforking production server.
+    """
+    bind: str                 # host:port to listen on
+    workers: int              # Forked worker processes; 0 means 2 x cores + 1
+    threads: int              # Request threads per worker
+    timeout: int              # Seconds before a stuck worker is replaced
+    graceful_timeout: int     # Seconds to finish in-flight requests on restart
+    keepalive: int            # Seconds an idle connection is held open
+    max_requests: int         # Requests before a worker is recycled; 0 disables
+    max_requests_jitter: int  # Random extra requests so workers do not recycle together
+
+
+@dataclass
+class LoadTestConfig:
+    """
+    Configuration for the local load test harness.
+    """
+    root_dir: Path
+    report_path: Path     # Latency percentiles and throughput of the latest run
+    url: str              # Endpoint under test
+    format: str           # 'form' or 'json' request body
+    concurrency: int      # Concurrent client connections
+    requests: int         # Timed requests
+    warmup_requests: int  # Untimed requests sent first
+    timeout: float        # Seconds to wait for each response
+
+
+@dataclass
+class AsyncApiConfig:
+    """
+    Configuration for the async JSON prediction API.
+    """
+    host: str
+    port: int
+    workers: int               # Server processes, each with its own micro-batcher
+    max_batch_rows: int        # Flush a micro-batch at this many rows...
+    max_wait_ms: float         # ...or after the first request has waited this long
+    enforce_ranges: bool       # Reject values outside the schema RANGES
+    max_rows_per_request: int  # Payload size limit
+    columns: dict              # Schema COLUMNS
+    target_column: str         # Column that is predicted, not sent
+    ranges: dict               # Schema RANGES
@@ -1,5 +1,6 @@
 from src.pilotproject.config.configuration import ConfigurationManager
 from src.pilotproject.components.data_ingestion import DataIngestion
+from src.pilotproject.components.shard_ingestion import ShardIngestion
 from src.pilotproject import logger
 
 STAGE_NAME = "Data Ingestion Stage"
@@ -10,21 +11,29 @@ class DataIngestionPipeline:
 
     Responsibilities:
     - Loads the data ingestion configuration.
-    - Executes downloading and unzipping of raw data.
+    - Executes downloading and unzipping of raw data, or the incremental ingestion of
+      source shards when `sources` is configured.
     """
 
     def __init__(self):
         pass
 
-    def initiate_data_ingestion(self):
+    def initiate_data_ingestion(self, context: dict = None):
         """
         Executes the data ingestion workflow:
         - Retrieves configuration for data ingestion.
-        - Downloads data if not already present.
-        - Extracts the zip file to a specified directory.
+        - With `sources` configured, appends the shards not ingested yet to the dataset.
+        - Otherwise downloads data if not already present and extracts the zip file.
+
+        Parameters:
+            context (dict, optional): In-memory artifact handoff shared by the stages of one run.
         """
         config = ConfigurationManager()
         data_ingestion_config = config.get_data_ingestion_config()
+        if data_ingestion_config.sources:
+            ShardIngestion(data_ingestion_config).ingest()
+            return
+
         data_ingestion = DataIngestion(data_ingestion_config)
         data_ingestion.download_file()
         data_ingestion.extract_zip()
@@ -1,6 +1,8 @@
 from src.pilotproject.config.configuration import ConfigurationManager
 from src.pilotproject.components.data_transformation import DataTransformation
 from src.pilotproject import logger
+from src.pilotproject.utils.common import load_json
+from pathlib import Path
 
 STAGE_NAME = "Data Transformation"
 
@@ -9,35 +11,43 @@ class DataTransformationPipeline:
     Orchestrates the data transformation stage of the pipeline.
 
     Responsibilities:
-    - Reads validation status from file.
+    - Reads validation status from the JSON validation report.
     - If validation passes, proceeds with train-test split.
     """
 
     def __init__(self):
         pass
 
-    def initiate_data_transformation(self):
+    def initiate_data_transformation(self, context: dict = None):
         """
         Executes the data transformation workflow:
-        - Checks validation status from status file.
+        - Checks validation status from the validation report.
         - If valid, splits data into train and test sets.
         - If invalid, logs error and raises exception.
+
+        Parameters:
+            context (dict, optional): In-memory artifact handoff shared by the stages of one run.
+                The validated dataset is taken from it when present, and the resulting
+                train/test splits are added to it.
         """
         config = ConfigurationManager()
         data_transformation_config = config.get_data_transformation_config()
         STATUS_FILE = data_transformation_config.STATUS_FILE
 
         logger.info("Checking validation status...")
-        with open(STATUS_FILE, 'r') as file:
-            validation_status = file.read().split(" ")[-1]
-
-            if validation_status == 'True':
-                logger.info(f"Validation status: '{validation_status}' — proceeding with transformation")
-                data_transformation = DataTransformation(data_transformation_config)
-                data_transformation.train_test_splitting()
-            else:
-                logger.info(f"Validation status: '{validation_status}' — stopping pipeline")
-                raise Exception("Data schema is not valid")
+        validation_status = load_json(Path(STATUS_FILE)).validation_status
+
+        if validation_status:
+            logger.info(f"Validation status: '{validation_status}' — proceeding with transformation")
+            data_transformation = DataTransformation(data_transformation_config)
+            data_transformation.train_test_splitting(data=(context or {}).get('raw_data'))
+
+            if context is not None:
+                context['train_data'] = data_transformation.train
+                context['test_data'] = data_transformation.test
+        else:
+            logger.info(f"Validation status: '{validation_status}' — stopping pipeline")
+            raise Exception("Data schema is not valid")
 
 
 if __name__ == '__main__':
@@ -16,16 +16,25 @@ class DataValidationPipeline:
     def __init__(self):
         pass
 
-    def initiate_data_validation(self):
+    def initiate_data_validation(self, context: dict = None):
         """
         Executes the data validation workflow:
         - Retrieves config.
-        - Performs column/schema validation.
+        - Streams the dataset through column, dtype, null and range validation.
+        - Hands the parsed dataset to later stages when a handoff context is given.
+
+        Parameters:
+            context (dict, optional): In-memory artifact handoff shared by the stages of one run.
         """
         config = ConfigurationManager()
         data_validation_config = config.get_data_validation_config()
-        data_validation = DataValidation(config=data_validation_config)
-        data_validation.validate_all_columns()
+        # A streaming split reads the file itself, so the full dataset is only kept for an in-memory split
+        keep_data = context is not None and config.get_data_transformation_config().split_mode == "memory"
+        data_validation = DataValidation(config=data_validation_config, keep_data=keep_data)
+        validation_status = data_validation.validate_all_columns()
+
+        if context is not None and validation_status:
+            context['raw_data'] = data_validation.data
 
 
 if __name__ == '__main__':
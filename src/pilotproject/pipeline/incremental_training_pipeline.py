@@ -0,0 +1,77 @@
+import sys
+from pathlib import Path
+
+from src.pilotproject.config.configuration import ConfigurationManager
+from src.pilotproject.components.incremental_trainer import IncrementalTrainer
+from src.pilotproject.components.model_export import ModelExport
+from src.pilotproject.pipeline.stage_runner import StageRunner
+from src.pilotproject.pipeline.training_pipeline import TRAINING_STAGES
+from src.pilotproject import logger
+
+STAGE_NAME = "Incremental Training Stage"
+
+# Training pipeline stages whose declared outputs an update rewrites
+UPDATED_STAGES = ["Model Trainer Stage", "Model Export Stage"]
+
+class IncrementalTrainingPipeline:
+    """
+    Orchestrates incremental model updates from new labeled batches.
+
+    Responsibilities:
+    - Loads the incremental training configuration.
+    - Folds each new batch into the running summary and refits the serving model.
+    - Re-exports the NumPy scoring kernel so serving picks up the updated coefficients.
+    - Records the rewritten model and kernel in the training pipeline's state, holding the
+      pipeline lock, so a later run keeps the update instead of re-running or restoring over it.
+    - Optionally compares the result with a full retrain on the same rows.
+    """
+
+    def __init__(self):
+        pass
+
+    def initiate_incremental_update(self, batch_paths: list, compare: bool = False) -> list:
+        """
+        Executes the incremental update workflow:
+        - Applies each batch in order; serving processes pick up the swapped model file on their next request.
+        - Writes the comparison report when requested.
+
+        Parameters:
+            batch_paths (list): CSV files of new labeled rows.
+            compare (bool): Also refit from scratch and report the difference.
+
+        Returns:
+            list: One result per applied batch.
+        """
+        config = ConfigurationManager()
+        incremental_training_config = config.get_incremental_training_config()
+        incremental_trainer = IncrementalTrainer(incremental_training_config)
+        stage_runner = StageRunner(TRAINING_STAGES, config_manager=config)
+
+        results = []
+        with stage_runner.exclusive():  # A training run must not retrain the model mid-update
+            try:
+                for batch_path in batch_paths:
+                    results.append(incremental_trainer.update(Path(batch_path)))
+            finally:
+                if results:  # Also after a failed batch: the earlier ones are already swapped in
+                    ModelExport(config.get_model_export_config()).export()
+                    stage_runner.record_external_update(UPDATED_STAGES)
+
+        if compare:
+            incremental_trainer.compare_with_full_retrain()
+        return results
+
+
+if __name__ == '__main__':
+    try:
+        logger.info(f">>>>>> Stage: {STAGE_NAME} started <<<<<<")
+        arguments = sys.argv[1:]
+        obj = IncrementalTrainingPipeline()
+        obj.initiate_incremental_update(
+            [argument for argument in arguments if argument != '--compare'],
+            compare='--compare' in arguments
+        )
+        logger.info(f">>>>>> Stage: {STAGE_NAME} completed <<<<<<\n{'x' * 10}")
+    except Exception as e:
+        logger.exception(e)
+        raise
@@ -17,17 +17,20 @@ class ModelEvaluationPipeline:
     def __init__(self):
         pass
 
-    def initiate_model_evaluation(self):
+    def initiate_model_evaluation(self, context: dict = None):
         """
         Executes the model evaluation workflow:
         - Loads test data and trained model.
         - Computes evaluation metrics.
         - Logs parameters, metrics, and model to MLflow.
+
+        Parameters:
+            context (dict, optional): In-memory artifact handoff shared by the stages of one run.
         """
         config = ConfigurationManager()
         model_evaluation_config = config.get_model_evaluation_config()
         model_evaluation = ModelEvaluation(model_evaluation_config)
-        model_evaluation.evaluate_log_with_mlflow()
+        model_evaluation.evaluate_log_with_mlflow(test_data=(context or {}).get('test_data'))
 
 
 if __name__ == '__main__':
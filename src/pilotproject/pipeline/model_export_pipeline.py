@@ -0,0 +1,40 @@
+from src.pilotproject.config.configuration import ConfigurationManager
+from src.pilotproject.components.model_export import ModelExport
+from src.pilotproject import logger
+
+STAGE_NAME = "Model Export Stage"
+
+class ModelExportPipeline:
+    """
+    Orchestrates the export of the trained model to the NumPy scoring kernel.
+
+    Responsibilities:
+    - Loads the export configuration.
+    - Writes the kernel and its parity report, or removes a stale kernel for non-linear models.
+    """
+
+    def __init__(self):
+        pass
+
+    def initiate_model_export(self, context: dict = None):
+        """
+        Executes the model export workflow.
+
+        Parameters:
+            context (dict, optional): In-memory artifact handoff shared by the stages of one run (unused).
+        """
+        config = ConfigurationManager()
+        model_export_config = config.get_model_export_config()
+        model_export = ModelExport(model_export_config)
+        model_export.export()
+
+
+if __name__ == '__main__':
+    try:
+        logger.info(f">>>>>> Stage: {STAGE_NAME} started <<<<<<")
+        obj = ModelExportPipeline()
+        obj.initiate_model_export()
+        logger.info(f">>>>>> Stage: {STAGE_NAME} completed <<<<<<\n{'x' * 10}")
+    except Exception as e:
+        logger.exception(e)
+        raise
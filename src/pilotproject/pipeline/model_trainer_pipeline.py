@@ -17,17 +17,20 @@ class ModelTrainerPipeline:
     def __init__(self):
         pass
 
-    def initiate_model_trainer(self):
+    def initiate_model_trainer(self, context: dict = None):
         """
         Executes the model training workflow:
         - Retrieves configuration for model training.
         - Initializes and trains the model.
         - Saves the trained model file.
+
+        Parameters:
+            context (dict, optional): In-memory artifact handoff shared by the stages of one run.
         """
         config = ConfigurationManager()
         model_trainer_config = config.get_model_trainer_config()
         model_trainer = ModelTrainer(model_trainer_config)
-        model_trainer.train()
+        model_trainer.train(train_data=(context or {}).get('train_data'))
 
 
 if __name__ == '__main__':
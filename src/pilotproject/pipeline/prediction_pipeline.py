@@ -6,12 +6,18 @@ class PredictionPipeline:
     Orchestrates the model prediction stage of the pipeline.
 
     Responsibilities:
-    - Loads model prediction configuration.
+    - Loads model prediction configuration once, when the pipeline is created.
     - Accepts input data and returns predictions.
     """
 
     def __init__(self):
-        pass
+        """
+        Resolves the prediction configuration up front so that repeated calls to
+        `initiate_prediction` do not re-parse the YAML files on every request.
+        """
+        config = ConfigurationManager()
+        model_prediction_config = config.get_model_prediction_config()
+        self.model_prediction = ModelPrediction(model_prediction_config)
 
     def initiate_prediction(self, data) -> list:
         """
@@ -23,9 +29,23 @@ class PredictionPipeline:
         Returns:
             list: Prediction results generated by the model.
         """
-        config = ConfigurationManager()
-        model_prediction_config = config.get_model_prediction_config()
-        model_prediction = ModelPrediction(model_prediction_config)
-        prediction = model_prediction.predict(data)
+        prediction = self.model_prediction.predict(data)
+
+        return prediction
+
+    def initiate_batch_prediction(self, data) -> list:
+        """
+        Executes the model prediction workflow for many rows at once.
+
+        Parameters:
+            data: A file-like CSV upload, or rows as a list of dicts / list of lists / 2-D array.
+
+        Returns:
+            list: One prediction per input row, produced by a single model call.
+        """
+        if hasattr(data, 'read'):  # Uploaded CSV file
+            data = self.model_prediction.read_csv_batch(data)
+
+        prediction = self.model_prediction.predict(data)
 
         return prediction
@@ -0,0 +1,401 @@
+import glob
+import hashlib
+import json
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+from box import Box
+
+from src.pilotproject import logger
+from src.pilotproject.config.configuration import ConfigurationManager
+from src.pilotproject.utils.artifact_store import ArtifactStore
+from src.pilotproject.utils.common import get_file_hash, save_json
+
+try:
+    import fcntl  # POSIX advisory locks; serializes runs across threads and processes
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+@dataclass
+class StageSpec:
+    """
+    Declaration of one pipeline stage and everything its result depends on.
+
+    Inputs and outputs are dotted keys into `config.yaml` (e.g. 'model_trainer.train_index_path')
+    that resolve to artifact file paths; `params` and `schema` name top-level keys of
+    `params.yaml` and `schema.yaml`. `input_globs` keys resolve to a pattern or a list of
+    patterns; files appearing, disappearing or changing under them invalidate the stage.
+    """
+    name: str
+    pipeline_class: type
+    method: str
+    config_sections: List[str] = field(default_factory=list)  # config.yaml sections the stage reads
+    params: List[str] = field(default_factory=list)           # params.yaml keys the stage reads
+    schema: List[str] = field(default_factory=list)           # schema.yaml keys the stage reads
+    env: List[str] = field(default_factory=list)              # Environment variables the stage reads
+    inputs: List[str] = field(default_factory=list)           # Upstream artifacts (dotted config keys)
+    outputs: List[str] = field(default_factory=list)          # Produced artifacts (dotted config keys)
+    input_globs: List[str] = field(default_factory=list)      # Dotted config keys holding glob patterns of input files
+
+
+def _plain(value: Any) -> Any:
+    """
+    Converts Box/ConfigBox values to plain Python containers for hashing.
+    """
+    return value.to_dict() if isinstance(value, Box) else value
+
+
+def _resolve(root: Box, dotted_key: str) -> Any:
+    """
+    Looks up a dotted key such as 'data_ingestion.local_data_file' in a config tree.
+    """
+    value = root
+    for part in dotted_key.split("."):
+        value = value[part]
+    return value
+
+
+class StageRunner:
+    """
+    Executes pipeline stages as a DAG with artifact-level caching.
+
+    Responsibilities:
+    - Order stages so that every stage runs after the stages producing its inputs.
+    - Fingerprint each stage from its config sections, params, schema, environment and
+      the content hashes of its input artifacts.
+    - Skip a stage when its fingerprint is unchanged and its outputs are intact; re-run it,
+      with a warning, when only its outputs were changed outside the pipeline.
+    - With the artifact store enabled, keep every output version by content hash, restore a
+      stage's outputs from the store when its fingerprint changed to one of a retained run,
+      record a pointer per run and garbage-collect the store afterwards.
+    - Hold an exclusive lock for the whole run: stages write to fixed artifact paths and share
+      one state file and manifest, so concurrent runs are serialized rather than isolated.
+    - Share an in-memory handoff context between the stages of a run, when enabled.
+    - Persist the cache state and write a run manifest with per-stage durations.
+    """
+
+    def __init__(
+        self,
+        stages: List[StageSpec],
+        config_manager: Optional[ConfigurationManager] = None,
+        progress_callback: Optional[Callable[[List[dict]], None]] = None
+    ):
+        """
+        Parameters:
+            stages (List[StageSpec]): Stage declarations, in any order.
+            config_manager (Optional[ConfigurationManager]): Source of config, params and schema.
+            progress_callback (Optional[Callable[[List[dict]], None]]): Called with the stage records
+                every time a stage changes state.
+        """
+        self.config_manager = config_manager or ConfigurationManager()
+        self.pipeline_config = self.config_manager.get_pipeline_config()
+        self.stages = self._topological_order(stages)
+        self.progress_callback = progress_callback
+        self.state = self._load_state()
+        self._lock_depth = 0
+
+        store_config = self.config_manager.get_artifact_store_config()
+        self.store = ArtifactStore(
+            store_config.root_dir, store_config.max_bytes, grace_seconds=store_config.gc_grace_seconds
+        ) if store_config.enabled else None
+
+        # Parsed datasets handed from stage to stage within a single run
+        self.context = {} if self.pipeline_config.in_memory_handoff else None
+
+    def _topological_order(self, stages: List[StageSpec]) -> List[StageSpec]:
+        """
+        Orders stages so producers come before consumers; ties keep declaration order.
+        """
+        producers = {output: stage.name for stage in stages for output in self._paths(stage.outputs)}
+        dependencies = {
+            stage.name: {producers[path] for path in self._paths(stage.inputs) if path in producers} - {stage.name}
+            for stage in stages
+        }
+
+        ordered, done = [], set()
+        while len(ordered) < len(stages):
+            ready = [stage for stage in stages if stage.name not in done and dependencies[stage.name] <= done]
+            if not ready:
+                raise ValueError(f"Pipeline stages contain a dependency cycle: {dependencies}")
+            ordered.append(ready[0])
+            done.add(ready[0].name)
+        return ordered
+
+    def _paths(self, dotted_keys: List[str]) -> List[str]:
+        return [os.path.normpath(str(_resolve(self.config_manager.config, key))) for key in dotted_keys]
+
+    def _load_state(self) -> dict:
+        state_file = Path(self.pipeline_config.state_file)
+        if state_file.exists():
+            with open(state_file) as file:
+                return json.load(file)
+        return {"stages": {}, "files": {}}
+
+    @contextmanager
+    def exclusive(self):
+        """
+        Holds the pipeline lock, waiting for a run that already holds it, and reloads the
+        cache state once it is held, since the previous holder may have changed it.
+        Re-entrant within one runner.
+        """
+        if self._lock_depth:
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+            return
+
+        lock_path = Path(self.pipeline_config.lock_file)
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    logger.info(f"Another pipeline run holds '{lock_path}' — waiting for it to finish")
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+            self.state = self._load_state()
+            self._lock_depth = 1
+            try:
+                yield
+            finally:
+                self._lock_depth = 0
+        finally:
+            os.close(fd)  # Closing the descriptor also releases the lock
+
+    def _hash_file(self, path: str) -> Optional[str]:
+        """
+        Returns a file's content hash, reusing the stored hash when mtime and size are unchanged.
+        """
+        if not os.path.exists(path):
+            return None
+
+        stat = os.stat(path)
+        cached = self.state["files"].get(path)
+        if cached and cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+            return cached["sha256"]
+
+        sha256 = get_file_hash(Path(path))
+        self.state["files"][path] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": sha256}
+        return sha256
+
+    def _glob_listing(self, dotted_key: str) -> List[list]:
+        """
+        Lists the files matched by the pattern(s) under a config key with their size and mtime.
+
+        Stat data rather than content hashes keep this cheap for directories of many shards;
+        entries that are not glob patterns (e.g. URLs) simply match nothing.
+        """
+        patterns = _plain(_resolve(self.config_manager.config, dotted_key)) or []
+        listing = []
+        for pattern in [patterns] if isinstance(patterns, str) else patterns:
+            for path in sorted(glob.glob(str(pattern), recursive=True)):
+                stat = os.stat(path)
+                listing.append([os.path.normpath(path), stat.st_size, stat.st_mtime_ns])
+        return listing
+
+    def _fingerprint(self, stage: StageSpec) -> str:
+        """
+        Hashes everything the stage declares as an input.
+        """
+        manager = self.config_manager
+        payload = {
+            "config": {section: _plain(manager.config[section]) for section in stage.config_sections},
+            "params": {key: _plain(manager.params[key]) for key in stage.params},
+            "schema": {key: _plain(manager.schema[key]) for key in stage.schema},
+            "env": {name: os.getenv(name) for name in stage.env},
+            "inputs": {path: self._hash_file(path) for path in self._paths(stage.inputs)},
+        }
+        if stage.input_globs:  # Only stages declaring globs carry the key, so other fingerprints are unchanged
+            payload["input_globs"] = {key: self._glob_listing(key) for key in stage.input_globs}
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _is_fresh(self, stage: StageSpec, fingerprint: str) -> bool:
+        """
+        A stage is fresh when its fingerprint matches the last successful run and
+        every output still has the content it had when that run finished.
+        """
+        previous = self.state["stages"].get(stage.name)
+        if previous is None or previous["fingerprint"] != fingerprint:
+            return False
+        return all(self._hash_file(path) == sha256 for path, sha256 in previous["outputs"].items())
+
+    def _restore(self, stage: StageSpec, fingerprint: str) -> bool:
+        """
+        Restores a stage's outputs from the artifact store if it has a result for this fingerprint.
+        """
+        outputs = self.store.lookup(stage.name, fingerprint) if self.store is not None else None
+        if outputs is None or set(outputs) != set(self._paths(stage.outputs)):
+            return False
+
+        for path, sha256 in outputs.items():
+            if sha256 is None or self._hash_file(path) == sha256:
+                continue  # Not produced by the stage, or already in place
+            self.store.restore(sha256, path)
+            stat = os.stat(path)
+            self.state["files"][path] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": sha256}
+        return True
+
+    def _archive(self, stage: StageSpec, fingerprint: str, outputs: dict) -> None:
+        """
+        Copies new output versions into the artifact store and indexes them by fingerprint.
+        """
+        stored = [path for path, sha256 in outputs.items() if sha256 is not None and self.store.put(path, sha256)]
+        self.store.record_stage(stage.name, fingerprint, outputs)
+        if stored:
+            logger.info(f"Stored {len(stored)} new artifact version(s) of '{stage.name}' in '{self.store.root_dir}'")
+
+    def _save_state(self) -> None:
+        save_json(Path(self.pipeline_config.state_file), self.state)
+
+    @staticmethod
+    def _new_run_id() -> str:
+        return f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+    def record_external_update(self, stage_names: List[str]) -> None:
+        """
+        Adopts outputs rewritten outside a run (e.g. by an incremental model update) as the
+        current results of the named stages.
+
+        Their fingerprints and output hashes are recorded in the cache state, and the new
+        versions are archived with a run pointer of their own, so the next run skips these
+        stages instead of re-running or restoring over the update; downstream stages see
+        changed inputs and re-run.
+
+        Parameters:
+            stage_names (List[str]): Stages whose declared outputs were rewritten.
+        """
+        with self.exclusive():
+            run_outputs = {}
+            for stage in self.stages:  # Dependency order: a later stage fingerprints the outputs recorded before it
+                if stage.name not in stage_names:
+                    continue
+                fingerprint = self._fingerprint(stage)
+                outputs = {path: self._hash_file(path) for path in self._paths(stage.outputs)}
+                self.state["stages"][stage.name] = {"fingerprint": fingerprint, "outputs": outputs, "completed_at": time.time()}
+                if self.store is not None:
+                    self._archive(stage, fingerprint, outputs)
+                    run_outputs[stage.name] = {"fingerprint": fingerprint, "status": "updated", "outputs": outputs}
+            self._save_state()
+            if self.store is not None:
+                self.store.record_run(self._new_run_id(), run_outputs)
+            logger.info(f"Recorded outputs updated outside the pipeline for: {', '.join(run_outputs or stage_names)}")
+
+    def _notify(self, records: List[dict]) -> None:
+        if self.progress_callback is not None:
+            self.progress_callback(records)
+
+    def run(self, force: bool = False) -> List[dict]:
+        """
+        Runs the pipeline, executing only the stages whose inputs changed.
+
+        Waits for any other run holding the pipeline lock to finish first.
+
+        Parameters:
+            force (bool): Re-run every stage regardless of the cache.
+
+        Returns:
+            List[dict]: One record per stage with status ('completed', 'restored' or 'skipped'), timings and fingerprint.
+
+        Raises:
+            Exception: Re-raises the first stage failure after recording it in the manifest.
+        """
+        with self.exclusive():
+            return self._run(force)
+
+    def _run(self, force: bool) -> List[dict]:
+        run_id = self._new_run_id()
+        run_started = time.time()
+        records = [
+            {"name": stage.name, "status": "pending", "started_at": None, "finished_at": None,
+             "duration_seconds": None, "fingerprint": None}
+            for stage in self.stages
+        ]
+        self._notify(records)
+        run_outputs = {}  # Stage outputs this run produced, restored or kept, for the run pointer
+
+        try:
+            for record, stage in zip(records, self.stages):
+                record["status"] = "running"
+                record["started_at"] = time.time()
+                self._notify(records)
+
+                fingerprint = self._fingerprint(stage)
+                record["fingerprint"] = fingerprint
+                previous = self.state["stages"].get(stage.name)
+                inputs_changed = previous is None or previous["fingerprint"] != fingerprint
+
+                if not force and self._is_fresh(stage, fingerprint):
+                    record["status"] = "skipped"
+                    logger.info(f">>>>>> Stage: {stage.name} skipped — inputs unchanged <<<<<<")
+                elif not force and inputs_changed and self._restore(stage, fingerprint):
+                    record["status"] = "restored"
+                    logger.info(f">>>>>> Stage: {stage.name} restored from the artifact store — inputs match an earlier run <<<<<<")
+                else:
+                    if not force and not inputs_changed:
+                        logger.warning(
+                            f"Outputs of {stage.name} were changed outside the pipeline since its last run "
+                            f"(inputs unchanged) — re-running it"
+                        )
+                    try:
+                        logger.info(f">>>>>> Stage: {stage.name} started <<<<<<")
+                        getattr(stage.pipeline_class(), stage.method)(context=self.context)
+                        logger.info(f">>>>>> Stage: {stage.name} completed <<<<<<\n{'x' * 10}")
+                    except Exception:
+                        record["status"] = "failed"
+                        record["finished_at"] = time.time()
+                        record["duration_seconds"] = round(record["finished_at"] - record["started_at"], 3)
+                        self.state["stages"].pop(stage.name, None)  # Never trust outputs of a failed run
+                        raise
+
+                    record["status"] = "completed"
+
+                if record["status"] != "skipped":
+                    self.state["stages"][stage.name] = {
+                        "fingerprint": fingerprint,
+                        "outputs": {path: self._hash_file(path) for path in self._paths(stage.outputs)},
+                        "completed_at": time.time(),
+                    }
+                    self._save_state()
+
+                if self.store is not None:
+                    outputs = self.state["stages"][stage.name]["outputs"]
+                    self._archive(stage, fingerprint, outputs)
+                    run_outputs[stage.name] = {"fingerprint": fingerprint, "status": record["status"], "outputs": outputs}
+
+                record["finished_at"] = time.time()
+                record["duration_seconds"] = round(record["finished_at"] - record["started_at"], 3)
+                self._notify(records)
+
+        except Exception as e:
+            self._notify(records)
+            logger.exception(e)
+            raise
+
+        finally:
+            self._save_state()
+            manifest = {
+                "run_id": run_id,
+                "started_at": run_started,
+                "finished_at": time.time(),
+                "duration_seconds": round(time.time() - run_started, 3),
+                "forced": force,
+                "stages": records,
+            }
+            if self.store is not None:
+                manifest["artifact_pointer"] = str(self.store.record_run(run_id, run_outputs))
+            save_json(Path(self.pipeline_config.manifest_file), manifest)
+            logger.info(f"Run manifest written to: '{self.pipeline_config.manifest_file}'")
+
+        if self.store is not None:
+            self.store.gc()
+
+        return records
@@ -0,0 +1,248 @@
+import json
+import multiprocessing
+import os
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.pilotproject import logger
+from src.pilotproject.config.configuration import ConfigurationManager
+from src.pilotproject.entity.config_entity import TrainingJobsConfig
+from src.pilotproject.utils.common import save_json
+from src.pilotproject.utils.model_cache import model_cache
+
+try:
+    import fcntl  # POSIX advisory locks; bound concurrent jobs per model across web workers
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+def _status_path(root_dir: Path, job_id: str) -> Path:
+    return Path(root_dir) / f"{job_id}.json"
+
+
+def _acquire_job_slot(root_dir: Path, model: str, slots: int) -> int:
+    """
+    Waits for one of the model's `slots` lock files to be free and returns its descriptor.
+
+    The locks live next to the job status files, so the limit holds across every web worker
+    process of the server, not just the one that accepted the job.
+    """
+    name = re.sub(r"[^\w.-]", "_", model)  # The model name becomes part of a file name
+    fds = [os.open(Path(root_dir) / f"{name}.slot{slot}.lock", os.O_RDWR | os.O_CREAT, 0o644) for slot in range(max(1, slots))]
+    if fcntl is None:
+        return fds[0]
+    while True:
+        for fd in fds:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                continue
+            for other in fds:
+                if other != fd:
+                    os.close(other)
+            return fd
+        time.sleep(1.0)
+
+
+def run_training_job(job_id: str, status_file: str, max_concurrent_jobs: int = 1) -> dict:
+    """
+    Executes the full training pipeline inside a worker process and keeps the
+    job's status file up to date after every stage transition.
+
+    The job stays 'queued' until a slot for its model is free server-wide.
+
+    Parameters:
+        job_id (str): Identifier of the job being executed.
+        status_file (str): Path of the job's JSON status file.
+        max_concurrent_jobs (int): Jobs allowed to run at once for the same model.
+
+    Returns:
+        dict: The final job status.
+    """
+    from dotenv import load_dotenv
+    from src.pilotproject.pipeline.training_pipeline import TrainingPipeline
+
+    load_dotenv()  # Same environment as `python main.py` (e.g. MLflow credentials)
+
+    with open(status_file) as file:
+        status = json.load(file)
+
+    slot_fd = _acquire_job_slot(Path(status_file).parent, status.get("model", "default"), max_concurrent_jobs)
+    try:
+        status.update(status="running", started_at=time.time(), pid=os.getpid())
+        save_json(Path(status_file), status)
+
+        def on_progress(records: list) -> None:
+            status["stages"] = records
+            running = [record["name"] for record in records if record["status"] == "running"]
+            status["current_stage"] = running[0] if running else None
+            save_json(Path(status_file), status)
+
+        try:
+            TrainingPipeline(progress_callback=on_progress).run()
+            status["status"] = "succeeded"
+        except Exception as e:
+            status["status"] = "failed"
+            status["error"] = f"{type(e).__name__}: {e}"
+
+        status["current_stage"] = None
+        status["finished_at"] = time.time()
+        status["duration_seconds"] = round(status["finished_at"] - status["started_at"], 3)
+        save_json(Path(status_file), status)
+        return status
+    finally:
+        os.close(slot_fd)  # Closing the descriptor also releases the lock
+
+
+class TrainingJobRunner:
+    """
+    Runs training pipelines as background jobs on a local process pool.
+
+    Responsibilities:
+    - Accept job submissions and return a job id immediately.
+    - Run at most `max_concurrent_jobs_per_model` jobs per model across all web workers,
+      queueing the rest.
+    - Start job processes from a clean forkserver (or spawn) parent, never by forking the
+      threaded web worker, whose locks a forked child could inherit held.
+    - Persist per-job, per-stage progress to JSON so any web worker can report it.
+    - Atomically hot-swap the serving model into the prediction cache when a job succeeds.
+    """
+
+    def __init__(self, config: TrainingJobsConfig):
+        """
+        Initializes the runner with its configuration.
+
+        Parameters:
+            config (TrainingJobsConfig): Job status directory, concurrency and serving model path.
+        """
+        self.config = config
+        self._executors: Dict[str, ProcessPoolExecutor] = {}
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def _executor_for(self, model: str) -> ProcessPoolExecutor:
+        """
+        Returns the dedicated process pool for a model, creating it on first use.
+        """
+        with self._lock:
+            if model not in self._executors:
+                method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                self._executors[model] = ProcessPoolExecutor(
+                    max_workers=self.config.max_concurrent_jobs_per_model,
+                    mp_context=multiprocessing.get_context(method)
+                )
+            return self._executors[model]
+
+    def submit(self, model: str = "default") -> dict:
+        """
+        Queues a training job and returns without waiting for it.
+
+        Parameters:
+            model (str): Model the job trains; jobs for the same model share a concurrency limit.
+
+        Returns:
+            dict: The initial job status, including its `job_id`.
+        """
+        job_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        status_file = _status_path(self.config.root_dir, job_id)
+
+        status = {
+            "job_id": job_id,
+            "model": model,
+            "status": "queued",
+            "submitted_at": time.time(),
+            "started_at": None,
+            "finished_at": None,
+            "duration_seconds": None,
+            "current_stage": None,
+            "stages": [],
+            "error": None,
+            "model_swapped": False
+        }
+        save_json(status_file, status)
+
+        future = self._executor_for(model).submit(
+            run_training_job, job_id, str(status_file), self.config.max_concurrent_jobs_per_model
+        )
+        self._futures[job_id] = future  # Before the callback, which removes it and may run immediately
+        future.add_done_callback(lambda done: self._on_job_done(job_id, done))
+
+        logger.info(f"Submitted training job '{job_id}' for model '{model}'")
+        return status
+
+    def _on_job_done(self, job_id: str, future: Future) -> None:
+        """
+        Finalizes a job in the submitting process: records crashes and hot-swaps the model.
+        """
+        self._futures.pop(job_id, None)
+        status_file = _status_path(self.config.root_dir, job_id)
+        status = self.get_status(job_id) or {"job_id": job_id}
+
+        error = future.exception()
+        if error is not None:
+            # The worker process died before it could record the failure itself
+            status.update(status="failed", error=f"{type(error).__name__}: {error}", finished_at=time.time())
+            save_json(status_file, status)
+            logger.error(f"Training job '{job_id}' crashed: {error}")
+            return
+
+        if status.get("status") != "succeeded":
+            logger.error(f"Training job '{job_id}' failed: {status.get('error')}")
+            return
+
+        try:
+            model_cache.refresh(Path(self.config.model_path))  # Swap in the new model for this worker
+            status["model_swapped"] = True
+            save_json(status_file, status)
+            logger.info(f"Training job '{job_id}' succeeded — serving model hot-swapped")
+        except Exception as e:
+            logger.error(f"Training job '{job_id}' succeeded but the model could not be reloaded: {e}")
+
+    def get_status(self, job_id: str) -> Optional[dict]:
+        """
+        Reads the latest status of a job.
+
+        Parameters:
+            job_id (str): Identifier returned by `submit`.
+
+        Returns:
+            Optional[dict]: The job status, or None if the job is unknown.
+        """
+        if not job_id.replace("-", "").isalnum():  # Job ids never contain path separators
+            return None
+
+        status_file = _status_path(self.config.root_dir, job_id)
+        if not status_file.exists():
+            return None
+
+        with open(status_file) as file:
+            return json.load(file)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops all worker pools.
+
+        Parameters:
+            wait (bool): Whether to wait for running jobs to finish.
+        """
+        for executor in self._executors.values():
+            executor.shutdown(wait=wait)
+
+
+# Process-wide runner, created on first use
+_runner: Optional[TrainingJobRunner] = None
+
+
+def get_training_job_runner() -> TrainingJobRunner:
+    """
+    Returns the process-wide training job runner, creating it on first use.
+    """
+    global _runner
+    if _runner is None:
+        _runner = TrainingJobRunner(ConfigurationManager().get_training_jobs_config())
+    return _runner
@@ -0,0 +1,122 @@
+from typing import Callable, List, Optional
+
+from src.pilotproject.pipeline.stage_runner import StageRunner, StageSpec
+from src.pilotproject.pipeline.data_ingestion_pipeline import DataIngestionPipeline
+from src.pilotproject.pipeline.data_validation_pipeline import DataValidationPipeline
+from src.pilotproject.pipeline.data_transformation_pipeline import DataTransformationPipeline
+from src.pilotproject.pipeline.model_trainer_pipeline import ModelTrainerPipeline
+from src.pilotproject.pipeline.model_export_pipeline import ModelExportPipeline
+from src.pilotproject.pipeline.model_evaluation_pipeline import ModelEvaluationPipeline
+
+# Training stages and what each one reads and writes. Artifact paths are dotted keys into
+# config.yaml; the runner derives execution order from them and skips a stage whose
+# declared inputs hash the same as on its last successful run.
+TRAINING_STAGES = [
+    StageSpec(
+        name="Data Ingestion Stage",
+        pipeline_class=DataIngestionPipeline,
+        method="initiate_data_ingestion",
+        config_sections=["data_ingestion"],
+        input_globs=["data_ingestion.sources"],  # New local shards re-run the stage
+        outputs=["data_ingestion.local_data_file", "data_validation.unzip_data_dir"],
+    ),
+    StageSpec(
+        name="Data Validation Stage",
+        pipeline_class=DataValidationPipeline,
+        method="initiate_data_validation",
+        config_sections=["data_validation", "data_loading", "data_transformation", "data_ingestion"],
+        schema=["COLUMNS", "RANGES"],
+        inputs=["data_validation.unzip_data_dir"],
+        outputs=["data_validation.STATUS_FILE"],
+    ),
+    StageSpec(
+        name="Data Transformation Stage",
+        pipeline_class=DataTransformationPipeline,
+        method="initiate_data_transformation",
+        config_sections=["data_transformation", "data_loading", "data_ingestion"],
+        params=["Split"],
+        schema=["COLUMNS"],
+        inputs=["data_transformation.data_path", "data_transformation.STATUS_FILE"],
+        outputs=[
+            "data_transformation.train_index_path", "data_transformation.test_index_path",
+            "data_transformation.features_path", "data_transformation.target_path",
+            "data_transformation.feature_metadata_path",
+        ],
+    ),
+    StageSpec(
+        name="Model Trainer Stage",
+        pipeline_class=ModelTrainerPipeline,
+        method="initiate_model_trainer",
+        config_sections=["model_trainer"],
+        params=[
+            "Model", "ElasticNet", "Ridge", "HistGradientBoosting", "RandomForest",
+            "ElasticNetSearch", "ModelSelection",
+        ],
+        schema=["COLUMNS", "TARGET_COLUMN"],
+        inputs=[
+            "model_trainer.features_path", "model_trainer.target_path",
+            "model_trainer.feature_metadata_path", "model_trainer.train_index_path",
+        ],
+        outputs=["model_evaluation.model_path"],
+    ),
+    StageSpec(
+        name="Model Export Stage",
+        pipeline_class=ModelExportPipeline,
+        method="initiate_model_export",
+        config_sections=["model_export"],
+        inputs=[
+            "model_export.model_path", "model_export.features_path", "model_export.target_path",
+            "model_export.feature_metadata_path", "model_export.test_index_path",
+        ],
+        outputs=["model_export.kernel_path", "model_export.report_path"],
+    ),
+    StageSpec(
+        name="Model Evaluation Stage",
+        pipeline_class=ModelEvaluationPipeline,
+        method="initiate_model_evaluation",
+        config_sections=["model_evaluation"],
+        params=["Model", "ElasticNet", "Ridge", "HistGradientBoosting", "RandomForest"],
+        schema=["COLUMNS", "TARGET_COLUMN"],
+        env=["MLFLOW_TRACKING_URI"],
+        inputs=[
+            "model_evaluation.features_path", "model_evaluation.target_path",
+            "model_evaluation.feature_metadata_path", "model_evaluation.test_index_path",
+            "model_evaluation.model_path",
+        ],
+        outputs=["model_evaluation.test_metric_file_path"],
+    ),
+]
+
+
+class TrainingPipeline:
+    """
+    Runs the training stages through the caching DAG runner and reports per-stage progress.
+
+    Responsibilities:
+    - Execute ingestion, validation, transformation, training, kernel export and evaluation in dependency order.
+    - Skip stages whose config, params, schema and input artifacts are unchanged.
+    - Notify an optional callback whenever a stage starts, completes, is skipped or fails.
+    """
+
+    def __init__(self, progress_callback: Optional[Callable[[List[dict]], None]] = None, force: bool = False):
+        """
+        Parameters:
+            progress_callback (Optional[Callable[[List[dict]], None]]): Called with the list of
+                stage records every time a stage changes state.
+            force (bool): Re-run every stage even if its inputs are unchanged.
+        """
+        self.progress_callback = progress_callback
+        self.force = force
+
+    def run(self) -> List[dict]:
+        """
+        Executes all training stages that are out of date.
+
+        Returns:
+            List[dict]: One record per stage with status, start/finish times and duration.
+
+        Raises:
+            Exception: Re-raises the first stage failure after recording it.
+        """
+        runner = StageRunner(TRAINING_STAGES, progress_callback=self.progress_callback)
+        return runner.run(force=self.force)
@@ -0,0 +1,214 @@
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.pilotproject import logger
+
+
+def _write_json(path: Path, data: dict) -> None:
+    tmp_path = f"{path}.tmp.{os.getpid()}.{threading.get_ident()}"
+    with open(tmp_path, "w") as file:
+        json.dump(data, file, indent=4)
+    os.replace(tmp_path, path)
+
+
+class ArtifactStore:
+    """
+    Content-addressed store for pipeline outputs, with per-run pointers and size-bounded GC.
+
+    Layout under `root_dir`:
+        objects/<sha256[:2]>/<sha256>   read-only copy of every output version, stored once
+        stages/<fingerprint>.json       stage name and output hashes produced for that fingerprint
+        runs/<run_id>.json              every stage's fingerprint and output hashes in one run
+
+    Responsibilities:
+    - Store output files by SHA-256, so identical artifacts from different runs share one blob.
+    - Map a stage fingerprint to the outputs it produced, so a stage whose inputs match any
+      retained run (not only the last one) can be restored instead of re-run.
+    - Record which blobs each run produced or used.
+    - Garbage-collect blobs no run references, then drop the oldest runs until the store
+      fits `max_bytes`; the newest run is always kept. Unreferenced blobs younger than
+      `grace_seconds` are left alone, since a run still in progress may not have recorded them yet.
+
+    Every file is written to a temporary sibling and renamed, so concurrent runs can share
+    one store.
+    """
+
+    def __init__(self, root_dir: Path, max_bytes: int, grace_seconds: float = 3600):
+        """
+        Parameters:
+            root_dir (Path): Store directory.
+            max_bytes (int): Size budget for the blobs; enforced by `gc`.
+            grace_seconds (float): Minimum age of an unreferenced blob before `gc` deletes it.
+        """
+        self.root_dir = Path(root_dir)
+        self.max_bytes = max_bytes
+        self.grace_seconds = grace_seconds
+        self.objects_dir = self.root_dir / "objects"
+        self.stages_dir = self.root_dir / "stages"
+        self.runs_dir = self.root_dir / "runs"
+        for directory in (self.objects_dir, self.stages_dir, self.runs_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+
+    def object_path(self, sha256: str) -> Path:
+        return self.objects_dir / sha256[:2] / sha256
+
+    def put(self, path: str, sha256: str) -> bool:
+        """
+        Stores a file under its (already computed) hash.
+
+        Parameters:
+            path (str): File to store.
+            sha256 (str): Its SHA-256.
+
+        Returns:
+            bool: True if a new blob was written, False if the content was already stored.
+        """
+        target = self.object_path(sha256)
+        if target.exists():
+            return False
+        target.parent.mkdir(exist_ok=True)
+        tmp_path = f"{target}.tmp.{os.getpid()}.{threading.get_ident()}"
+        shutil.copyfile(path, tmp_path)  # A copy, not a link: stages rewrite their outputs in place
+        os.chmod(tmp_path, 0o444)
+        os.replace(tmp_path, target)
+        return True
+
+    def restore(self, sha256: str, path: str) -> None:
+        """
+        Copies a stored blob back to an output path, atomically.
+
+        Parameters:
+            sha256 (str): Blob to restore.
+            path (str): Destination file.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp.{os.getpid()}.{threading.get_ident()}"
+        shutil.copyfile(self.object_path(sha256), tmp_path)
+        os.replace(tmp_path, path)
+
+    def record_stage(self, stage_name: str, fingerprint: str, outputs: Dict[str, Optional[str]]) -> None:
+        _write_json(
+            self.stages_dir / f"{fingerprint}.json",
+            {"stage": stage_name, "fingerprint": fingerprint, "outputs": outputs, "recorded_at": time.time()}
+        )
+
+    def lookup(self, stage_name: str, fingerprint: str) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Returns the outputs a stage produced for this fingerprint, if all of them are still stored.
+
+        Parameters:
+            stage_name (str): Stage name; guards against fingerprint collisions between stages.
+            fingerprint (str): Stage input fingerprint.
+
+        Returns:
+            Optional[Dict[str, Optional[str]]]: Output path to SHA-256 (None for outputs the stage
+                did not write), or None on a cache miss.
+        """
+        entry_path = self.stages_dir / f"{fingerprint}.json"
+        if not entry_path.exists():
+            return None
+        with open(entry_path) as file:
+            entry = json.load(file)
+        if entry.get("stage") != stage_name:
+            return None
+        outputs = entry["outputs"]
+        if any(sha256 is not None and not self.object_path(sha256).exists() for sha256 in outputs.values()):
+            return None  # Collected since it was recorded
+        return outputs
+
+    def record_run(self, run_id: str, stages: Dict[str, dict]) -> Path:
+        """
+        Writes the run pointer: each stage's fingerprint and output hashes.
+
+        Parameters:
+            run_id (str): Unique run identifier.
+            stages (Dict[str, dict]): Stage name to {"fingerprint", "status", "outputs"}.
+
+        Returns:
+            Path: The pointer file.
+        """
+        pointer = self.runs_dir / f"{run_id}.json"
+        _write_json(pointer, {"run_id": run_id, "recorded_at": time.time(), "stages": stages})
+        return pointer
+
+    def _runs(self) -> List[dict]:
+        runs = []
+        for pointer in self.runs_dir.glob("*.json"):
+            try:
+                with open(pointer) as file:
+                    run = json.load(file)
+            except (OSError, ValueError):
+                continue  # Being replaced by a concurrent writer
+            run["pointer"] = pointer
+            runs.append(run)
+        return sorted(runs, key=lambda run: run["recorded_at"], reverse=True)
+
+    def _blobs(self) -> Dict[str, os.stat_result]:
+        return {path.name: path.stat() for path in self.objects_dir.glob("*/*") if ".tmp." not in path.name}
+
+    def gc(self) -> dict:
+        """
+        Deletes blobs that no run references, then the oldest runs and their blobs until the
+        store fits `max_bytes`, and finally stage entries whose blobs are gone.
+
+        Returns:
+            dict: Blob and run counts removed, bytes freed and the resulting store size.
+        """
+        blobs = self._blobs()
+        runs = self._runs()
+
+        def referenced(kept_runs: List[dict]) -> set:
+            return {
+                sha256
+                for run in kept_runs
+                for stage in run["stages"].values()
+                for sha256 in stage["outputs"].values() if sha256 is not None
+            }
+
+        live = referenced(runs)
+        removed_runs = 0
+        while len(runs) > 1 and sum(stat.st_size for sha256, stat in blobs.items() if sha256 in live) > self.max_bytes:
+            oldest = runs.pop()
+            oldest["pointer"].unlink(missing_ok=True)
+            removed_runs += 1
+            live = referenced(runs)
+
+        freed, removed_blobs = 0, 0
+        cutoff = time.time() - self.grace_seconds
+        for sha256, stat in blobs.items():
+            if sha256 not in live and stat.st_mtime < cutoff:
+                self.object_path(sha256).unlink(missing_ok=True)
+                freed += stat.st_size
+                removed_blobs += 1
+
+        removed_entries = 0
+        for entry_path in self.stages_dir.glob("*.json"):
+            try:
+                with open(entry_path) as file:
+                    outputs = json.load(file)["outputs"]
+            except (OSError, ValueError, KeyError):
+                continue
+            if any(sha256 is not None and not self.object_path(sha256).exists() for sha256 in outputs.values()):
+                entry_path.unlink(missing_ok=True)
+                removed_entries += 1
+
+        size = sum(stat.st_size for stat in blobs.values()) - freed
+        summary = {
+            "removed_blobs": removed_blobs,
+            "removed_runs": removed_runs,
+            "removed_stage_entries": removed_entries,
+            "freed_bytes": freed,
+            "blobs": len(blobs) - removed_blobs,
+            "runs": len(runs),
+            "store_bytes": size,
+            "max_bytes": self.max_bytes,
+        }
+        if size > self.max_bytes:
+            logger.warning(f"Artifact store holds {size} bytes after GC, over its {self.max_bytes}-byte budget")
+        logger.info(f"Artifact store GC: {summary}")
+        return summary
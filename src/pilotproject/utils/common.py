@@ -1,21 +1,33 @@
 import os
 import yaml
+import hashlib
+import importlib.util
+import threading
 from src.pilotproject import logger
 import json
-import joblib
 from ensure import ensure_annotations
 from box import ConfigBox
 from pathlib import Path
-from typing import Any
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, List
 from box.exceptions import BoxValueError
 
-@ensure_annotations
-def read_yaml(path_to_yaml: Path) -> ConfigBox:
+try:
+    from yaml import CSafeLoader as YamlLoader  # libyaml parser, several times faster than pure Python
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+
+def read_yaml(path_to_yaml: Path, frozen: bool = False) -> ConfigBox:
     """
     Reads a YAML file and returns its content as a Configbox object.
 
+    Not wrapped in `ensure_annotations`: it runs whenever a config file is (re)loaded, and
+    the runtime type check cost more than parsing a small file with libyaml.
+
     Args:
         path_to_yaml (Path): Path to the YAML file.
+        frozen (bool, optional): Return an immutable ConfigBox. Defaults to False.
 
     Returns:
         Configbox: Parsed content of the YAML file.
@@ -26,25 +38,64 @@ def read_yaml(path_to_yaml: Path) -> ConfigBox:
     """
     try:
         with open(path_to_yaml) as yaml_file:  # Open YAML file
-            content = yaml.safe_load(yaml_file)  # Load content safely to prevent code execution
+            content = yaml.load(yaml_file, Loader=YamlLoader)  # Safe loader: no arbitrary objects
             logger.info(f"yaml file: '{path_to_yaml}' loaded successfully")  # Log successful loading
-            return ConfigBox(content)  # Convert loaded data to Configbox object for easy access
+            return ConfigBox(content, frozen_box=frozen)  # Convert loaded data to Configbox object for easy access
     except BoxValueError:
         raise ValueError("yaml file is empty")  # Handle case where YAML content is empty
     except Exception as e:
         raise e  # Propagate other exceptions
 
 
-@ensure_annotations
+# Parsed YAML files shared by the whole process: path -> ((mtime_ns, size, inode), frozen ConfigBox)
+_yaml_snapshots = {}
+_yaml_snapshots_lock = threading.Lock()
+
+
+def read_yaml_snapshot(path_to_yaml: Path) -> ConfigBox:
+    """
+    Returns a process-wide, read-only snapshot of a YAML file.
+
+    The file is parsed on first use and again only when its mtime, size or inode changes,
+    so constructing many readers of the same config costs one `stat` per file. The
+    snapshot is frozen because every caller shares the same object.
+
+    Args:
+        path_to_yaml (Path): Path to the YAML file.
+
+    Returns:
+        Configbox: Frozen parsed content of the YAML file.
+    """
+    stat = os.stat(path_to_yaml)
+    version = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    key = os.path.abspath(path_to_yaml)
+
+    cached = _yaml_snapshots.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with _yaml_snapshots_lock:  # One thread parses; the others reuse its result
+        cached = _yaml_snapshots.get(key)
+        if cached is None or cached[0] != version:
+            cached = (version, read_yaml(path_to_yaml, frozen=True))
+            _yaml_snapshots[key] = cached
+        return cached[1]
+
+
 def create_directories(*path_to_directories, verbose=True):
     """
     Creates directories from the provided list.
 
+    Directories that already exist are left alone without logging, since the config
+    getters call this on every construction.
+
     Args:
         path_to_directories (list): List of directory paths.
         verbose (bool, optional): Enables logging of created directories. Defaults to True.
     """
     for path in path_to_directories:
+        if os.path.isdir(path):
+            continue
         os.makedirs(path, exist_ok=True)  # Create directories, ignoring if they already exist
         if verbose:
             logger.info(f"created directory at: '{path}'")  # Log directory creation
@@ -55,12 +106,17 @@ def save_json(path: Path, data: dict):
     """
     Saves a dictionary to a JSON file.
 
+    The file is written to a temporary sibling and renamed into place, so readers
+    never observe a partially written document.
+
     Args:
         path (Path): Path to the output JSON file.
         data (dict): Dictionary to save.
     """
-    with open(path, 'w') as file:  # Open file in write mode
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    with open(tmp_path, 'w') as file:  # Open temporary file in write mode
         json.dump(data, file, indent=4)  # Write data as formatted JSON
+    os.replace(tmp_path, path)  # Atomically replace the target file
 
     logger.info(f"JSON file saved at: '{path}'")  # Log JSON file creation
 
@@ -92,6 +148,8 @@ def save_bin(path: Path, data: Any):
         path (Path): Path to the binary file.
         data (Any): Python object to serialize.
     """
+    import joblib  # Deferred: pulls in its parallel backends, unneeded by most callers of this module
+
     joblib.dump(value=data, filename=path)  # Serialize and save the Python object
     logger.info(f"Binary file saved at: '{path}'")  # Log binary file creation
 
@@ -107,6 +165,218 @@ def load_bin(path: Path) -> Any:
     Returns:
         Any: Python object loaded from the binary file.
     """
+    import joblib
+
     data = joblib.load(path)  # Load Python object from binary file
     logger.info(f"Binary file loaded from: '{path}'")  # Log successful load
     return data
+
+
+@ensure_annotations
+def get_file_hash(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Computes the SHA-256 hex digest of a file without loading it fully into memory.
+
+    Args:
+        path (Path): Path to the file to hash.
+        chunk_size (int, optional): Number of bytes read per iteration. Defaults to 1 MiB.
+
+    Returns:
+        str: Hex-encoded SHA-256 digest of the file content.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:  # Stream the file in fixed-size blocks
+        for block in iter(lambda: file.read(chunk_size), b''):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+@ensure_annotations
+def get_file_fingerprint(path: Path, sample_bytes: int = 1024 * 1024) -> str:
+    """
+    Computes a constant-time fingerprint of a file from its stat data and sampled blocks.
+
+    Only the first, middle and last `sample_bytes` are hashed, so the cost does not grow
+    with the file size. Edits between the samples are caught by the modification time and
+    inode instead, which any write or replacement of the file changes. Use `get_file_hash`
+    when every byte must be covered regardless of how the file was modified.
+
+    Args:
+        path (Path): Path to the file to fingerprint.
+        sample_bytes (int, optional): Size of each sampled block. Defaults to 1 MiB.
+
+    Returns:
+        str: "<size>:<mtime_ns>:<inode>:<sha256 of the sampled blocks>".
+    """
+    stat = os.stat(path)
+    size = stat.st_size
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for offset in sorted({0, max(0, size // 2 - sample_bytes // 2), max(0, size - sample_bytes)}):
+            file.seek(offset)
+            digest.update(file.read(sample_bytes))
+
+    return f"{size}:{stat.st_mtime_ns}:{stat.st_ino}:{digest.hexdigest()}"
+
+
+# pyarrow's multithreaded CSV reader is used whenever it is installed and the call allows it
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+
+def resolve_n_jobs(n_jobs: Optional[int], limit: Optional[int] = None) -> int:
+    """
+    Converts a joblib-style `n_jobs` setting into a worker count.
+
+    Args:
+        n_jobs (Optional[int]): Positive worker count, or None/-1 for every core; -2 means all
+            cores but one, and so on.
+        limit (Optional[int], optional): Upper bound, e.g. the number of tasks. Defaults to None.
+
+    Returns:
+        int: Number of workers, at least 1.
+    """
+    cpus = os.cpu_count() or 1
+    if n_jobs is None:
+        workers = cpus
+    else:
+        n_jobs = int(n_jobs)
+        workers = cpus + 1 + n_jobs if n_jobs < 0 else n_jobs
+    if limit is not None:
+        workers = min(workers, limit)
+    return max(1, workers)
+
+
+def get_schema_dtypes(schema: dict, downcast_float32: bool = False, usecols: Optional[List[str]] = None) -> dict:
+    """
+    Builds a pandas dtype mapping from the schema's column definitions.
+
+    Args:
+        schema (dict): Column names mapped to dtype names (schema.yaml `COLUMNS`).
+        downcast_float32 (bool, optional): Map float64 columns to float32. Defaults to False.
+        usecols (Optional[List[str]], optional): Restrict the mapping to these columns.
+
+    Returns:
+        dict: Column name to dtype name, ready to pass as `dtype=` to `pd.read_csv`.
+    """
+    dtypes = {}
+    for column, dtype in schema.items():
+        if usecols is not None and column not in usecols:
+            continue
+        dtype = str(dtype)
+        if downcast_float32 and dtype == "float64":
+            dtype = "float32"
+        dtypes[column] = dtype
+    return dtypes
+
+
+def read_csv_with_schema(
+    path: Any,
+    schema: dict,
+    usecols: Optional[List[str]] = None,
+    downcast_float32: bool = False,
+    engine: str = "auto",
+    **kwargs
+) -> Any:
+    """
+    Reads a CSV file with column dtypes taken from the schema instead of inferred ones.
+
+    - Declared dtypes skip pandas' type inference and avoid int64/float64 defaults where
+      a narrower type is requested.
+    - `engine='auto'` uses the pyarrow engine when it is installed and the call does not
+      need options it lacks (`chunksize`, `nrows`, `skiprows`, `iterator`); otherwise pandas' C engine.
+
+    Args:
+        path (Any): File path or file-like object.
+        schema (dict): Column names mapped to dtype names (schema.yaml `COLUMNS`).
+        usecols (Optional[List[str]], optional): Only parse these columns.
+        downcast_float32 (bool, optional): Load float64 columns as float32. Defaults to False.
+        engine (str, optional): 'auto', 'pyarrow', 'c' or 'python'. Defaults to 'auto'.
+        **kwargs: Extra keyword arguments forwarded to `pd.read_csv`.
+
+    Returns:
+        Any: A DataFrame, or a chunk iterator when `chunksize`/`iterator` is given.
+    """
+    import pandas as pd  # Deferred so that importing this module stays cheap
+
+    if engine == "auto":
+        unsupported = {"chunksize", "nrows", "skiprows", "iterator"} & set(kwargs)
+        engine = "pyarrow" if PYARROW_AVAILABLE and not unsupported else "c"
+
+    dtypes = get_schema_dtypes(schema, downcast_float32=downcast_float32, usecols=usecols)
+    return pd.read_csv(path, dtype=dtypes, usecols=usecols, engine=engine, **kwargs)
+
+
+@contextmanager
+def open_data_file(path: Any, member: Optional[str] = None) -> Iterator[Any]:
+    """
+    Opens a dataset for reading, streaming it out of a zip archive when `path` is one.
+
+    Plain files are yielded as their path. For a `.zip` path the member is decompressed on
+    the fly as it is read, so no extracted copy is written to disk.
+
+    Args:
+        path (Any): Dataset file, or a `.zip` archive containing it.
+        member (Optional[str], optional): Archive member to read. Defaults to the only member.
+
+    Returns:
+        Iterator[Any]: Context manager yielding a path or a binary file object for `pd.read_csv`.
+
+    Raises:
+        ValueError: If no member is given and the archive does not hold exactly one file.
+    """
+    if not str(path).lower().endswith(".zip"):
+        yield path
+        return
+
+    from zipfile import ZipFile
+
+    with ZipFile(path) as archive:
+        if member is None:
+            names = [info.filename for info in archive.infolist() if not info.is_dir()]
+            if len(names) != 1:
+                raise ValueError(f"Archive '{path}' holds {len(names)} files; configure which member to read")
+            member = names[0]
+        with archive.open(member) as stream:  # CRC is verified when the member has been read to the end
+            yield stream
+
+
+def save_npy(path: Any, array: Any, dtype: Any = None, block_rows: int = 1 << 22) -> None:
+    """
+    Saves an array as a C-contiguous `.npy` file, atomically and without loading it fully.
+
+    The source may be a memory map; it is copied into the destination in row blocks,
+    so both can be larger than RAM.
+
+    Args:
+        path (Any): Destination `.npy` file.
+        array (Any): Array-like with a `shape` (1-D or 2-D).
+        dtype (Any, optional): Output dtype. Defaults to the source dtype.
+        block_rows (int, optional): Rows copied per block. Defaults to 4M.
+    """
+    import numpy as np  # Deferred so that importing this module stays cheap
+
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    output = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=dtype or array.dtype, shape=tuple(array.shape))
+    for start in range(0, array.shape[0], block_rows):
+        output[start:start + block_rows] = array[start:start + block_rows]
+    output.flush()
+    del output  # Close the memory map before renaming
+    os.replace(tmp_path, path)
+
+
+def save_index_array(path: Any, indices: Any, n_rows: int) -> None:
+    """
+    Saves row positions as a compact `.npy` file.
+
+    The narrowest integer dtype that can address `n_rows` rows is used (int32 for any
+    dataset under 2**31 rows).
+
+    Args:
+        path (Any): Destination `.npy` file.
+        indices (Any): 1-D array-like of row positions; may be a memory map.
+        n_rows (int): Number of rows in the dataset the positions refer to.
+    """
+    import numpy as np
+
+    save_npy(path, indices, dtype=np.int32 if n_rows < 2 ** 31 else np.int64)
@@ -0,0 +1,227 @@
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from src.pilotproject import logger
+from src.pilotproject.utils.common import get_file_hash
+
+
+class ChecksumMismatchError(ValueError):
+    """
+    Raised when a downloaded file does not hash to the configured SHA-256.
+    """
+
+
+class RangeDownloader:
+    """
+    Downloads a URL in parallel byte ranges, resumably and atomically.
+
+    Responsibilities:
+    - Probe the server for the content length and range support.
+    - Fetch fixed-size chunks over `max_workers` connections and write each at its offset
+      in a preallocated `<destination>.part` file.
+    - Record finished chunks in `<destination>.part.json` so an interrupted download resumes
+      with the missing chunks only, as long as the remote size and validator are unchanged.
+    - Fall back to a single streamed request when the server ignores `Range`.
+    - Verify the SHA-256 (when one is given) before renaming the part file into place, so
+      `destination` either does not exist or holds the complete, verified file.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        destination: Path,
+        sha256: Optional[str] = None,
+        chunk_size: int = 1024 * 1024,
+        max_workers: int = 4,
+        timeout: float = 30.0,
+        retries: int = 3,
+    ):
+        """
+        Parameters:
+            url (str): HTTP(S) URL to download.
+            destination (Path): Final path of the downloaded file.
+            sha256 (Optional[str]): Expected hex digest; None skips verification.
+            chunk_size (int): Bytes per range request.
+            max_workers (int): Concurrent range requests.
+            timeout (float): Socket timeout in seconds for each request.
+            retries (int): Extra attempts per request before giving up.
+        """
+        self.url = url
+        self.destination = Path(destination)
+        self.sha256 = sha256.lower() if sha256 else None
+        self.chunk_size = chunk_size
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.retries = retries
+
+        self.part_path = self.destination.with_name(self.destination.name + ".part")
+        self.state_path = self.destination.with_name(self.destination.name + ".part.json")
+        self._state_lock = threading.Lock()
+
+    def _with_retries(self, action, description: str):
+        for attempt in range(self.retries + 1):
+            try:
+                return action()
+            except (OSError, urllib.error.URLError) as e:  # HTTPError and socket timeouts included
+                if attempt == self.retries:
+                    raise
+                delay = 0.5 * 2 ** attempt
+                logger.warning(f"{description} failed ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    def _probe(self) -> Tuple[Optional[int], bool, str]:
+        """
+        Returns the content length (None if unknown), whether byte ranges are served, and the
+        ETag/Last-Modified validator used to decide if a partial download can be resumed.
+        """
+        def probe():
+            # A one-byte range answers both questions and works where HEAD is not allowed
+            req = urllib.request.Request(self.url, headers={"Range": "bytes=0-0"})
+            with urllib.request.urlopen(req, timeout=self.timeout) as response:
+                validator = response.headers.get("ETag") or response.headers.get("Last-Modified") or ""
+                content_range = response.headers.get("Content-Range", "")
+                if response.status == 206 and "/" in content_range and not content_range.endswith("/*"):
+                    return int(content_range.rsplit("/", 1)[1]), True, validator
+                length = response.headers.get("Content-Length")
+                return (int(length) if length else None), False, validator
+
+        return self._with_retries(probe, f"Probing '{self.url}'")
+
+    def _load_state(self, size: int, validator: str) -> List[int]:
+        """
+        Returns the chunks already on disk, or an empty list if there is nothing to resume.
+        """
+        if not (self.state_path.exists() and self.part_path.exists()):
+            return []
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return []
+        if (state.get("url"), state.get("size"), state.get("validator"), state.get("chunk_size")) != (
+            self.url, size, validator, self.chunk_size
+        ) or os.path.getsize(self.part_path) != size:
+            logger.info(f"Remote file changed since '{self.part_path}' was started; downloading from scratch")
+            return []
+        return sorted(set(state.get("done", [])))
+
+    def _save_state(self, size: int, validator: str, done: List[int]) -> None:
+        tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"url": self.url, "size": size, "validator": validator, "chunk_size": self.chunk_size, "done": done}, f)
+        os.replace(tmp_path, self.state_path)
+
+    def _fetch_chunk(self, fd: int, index: int, size: int) -> None:
+        start = index * self.chunk_size
+        end = min(start + self.chunk_size, size) - 1
+
+        def fetch():
+            req = urllib.request.Request(self.url, headers={"Range": f"bytes={start}-{end}"})
+            with urllib.request.urlopen(req, timeout=self.timeout) as response:
+                if response.status != 206:
+                    raise urllib.error.URLError(f"expected 206 for bytes {start}-{end}, got {response.status}")
+                data = response.read()
+            if len(data) != end - start + 1:
+                raise urllib.error.URLError(f"short read for bytes {start}-{end}: {len(data)} byte(s)")
+            os.pwrite(fd, data, start)  # Positional write: threads never share a file offset
+
+        self._with_retries(fetch, f"Chunk {index} (bytes {start}-{end})")
+
+    def _download_ranges(self, size: int, validator: str) -> None:
+        n_chunks = max(1, -(-size // self.chunk_size))
+        done = self._load_state(size, validator)
+        if done:
+            logger.info(f"Resuming '{self.part_path}': {len(done)}/{n_chunks} chunk(s) already downloaded")
+        else:
+            with open(self.part_path, "wb") as f:
+                f.truncate(size)  # Preallocate so every chunk can be written at its offset
+            self._save_state(size, validator, done)
+
+        finished = set(done)
+        missing = [index for index in range(n_chunks) if index not in finished]
+        fd = os.open(self.part_path, os.O_WRONLY)
+        try:
+            def run(index: int) -> None:
+                self._fetch_chunk(fd, index, size)
+                with self._state_lock:  # Recorded only once its bytes are written
+                    done.append(index)
+                    self._save_state(size, validator, sorted(done))
+
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing) or 1)) as pool:
+                for future in [pool.submit(run, index) for index in missing]:
+                    future.result()  # Re-raises the first failed chunk; finished ones stay recorded
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _download_stream(self) -> None:
+        def stream():
+            with urllib.request.urlopen(self.url, timeout=self.timeout) as response, open(self.part_path, "wb") as f:
+                for block in iter(lambda: response.read(self.chunk_size), b""):
+                    f.write(block)
+                f.flush()
+                os.fsync(f.fileno())
+
+        self._with_retries(stream, f"Downloading '{self.url}'")
+
+    def verify(self, path: Path) -> bool:
+        """
+        Checks a file against the expected SHA-256.
+
+        Parameters:
+            path (Path): File to check.
+
+        Returns:
+            bool: True if it matches, or if no checksum is configured and the file exists.
+        """
+        if not Path(path).exists():
+            return False
+        return self.sha256 is None or get_file_hash(Path(path)) == self.sha256
+
+    def download(self) -> Path:
+        """
+        Downloads the URL to `destination`, resuming a previous partial download if possible.
+
+        Returns:
+            Path: The destination path.
+
+        Raises:
+            ChecksumMismatchError: If the downloaded bytes do not match `sha256`; the partial
+                file is removed so the next attempt starts clean.
+        """
+        self.destination.parent.mkdir(parents=True, exist_ok=True)
+        started = time.perf_counter()
+
+        size, ranges, validator = self._probe()
+        if ranges and size:
+            logger.info(
+                f"Downloading '{self.url}' ({size} bytes) in {self.chunk_size}-byte ranges "
+                f"over up to {self.max_workers} connection(s)"
+            )
+            self._download_ranges(size, validator)
+        else:
+            logger.info(f"Server does not serve byte ranges for '{self.url}'; downloading in one stream")
+            self._download_stream()
+
+        digest = get_file_hash(self.part_path)
+        if self.sha256 is not None and digest != self.sha256:
+            for path in (self.part_path, self.state_path):
+                path.unlink(missing_ok=True)
+            raise ChecksumMismatchError(f"SHA-256 of '{self.url}' is {digest}, expected {self.sha256}")
+        if self.sha256 is None:
+            logger.warning(f"No SHA-256 configured for '{self.url}'; downloaded file hashes to {digest}")
+
+        os.replace(self.part_path, self.destination)  # Atomic: readers never see a partial file
+        self.state_path.unlink(missing_ok=True)
+        logger.info(
+            f"Downloaded '{self.destination}' ({os.path.getsize(self.destination)} bytes) "
+            f"in {time.perf_counter() - started:.2f}s, SHA-256 {digest}"
+        )
+        return self.destination
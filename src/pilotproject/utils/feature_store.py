@@ -0,0 +1,144 @@
+import os
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.pilotproject import logger
+from src.pilotproject.utils.common import load_json, save_json, save_npy
+
+
+class FeatureStoreWriter:
+    """
+    Writes a dataset as a binary feature store: a features matrix, a target vector and metadata.
+
+    Responsibilities:
+    - Accept the dataset in one or more chunks, appending raw rows to temporary files.
+    - Convert the rows into C-contiguous `.npy` files that later stages memory-map.
+    - Record column names, dtypes and row count in a small JSON metadata file.
+    """
+
+    def __init__(
+        self,
+        features_path: Path,
+        target_path: Path,
+        metadata_path: Path,
+        feature_columns: List[str],
+        target_column: str,
+        dtype: str = "float64",
+        target_dtype: str = "int64"
+    ):
+        """
+        Parameters:
+            features_path (Path): Destination of the (n_rows, n_features) matrix.
+            target_path (Path): Destination of the (n_rows,) target vector.
+            metadata_path (Path): Destination of the JSON metadata.
+            feature_columns (List[str]): Feature column names, in matrix column order.
+            target_column (str): Name of the target column.
+            dtype (str): Feature matrix dtype, 'float32' or 'float64'.
+            target_dtype (str): Target vector dtype.
+        """
+        self.features_path = Path(features_path)
+        self.target_path = Path(target_path)
+        self.metadata_path = Path(metadata_path)
+        self.feature_columns = list(feature_columns)
+        self.target_column = target_column
+        self.dtype = np.dtype(dtype)
+        self.target_dtype = np.dtype(target_dtype)
+        self.n_rows = 0
+
+        self._raw_paths = {
+            "features": f"{self.features_path}.rows.{os.getpid()}",
+            "target": f"{self.target_path}.rows.{os.getpid()}",
+        }
+        self._files = {name: open(path, 'wb') for name, path in self._raw_paths.items()}
+
+    def append(self, chunk: pd.DataFrame) -> None:
+        """
+        Appends the rows of a chunk, in order.
+
+        Parameters:
+            chunk (pd.DataFrame): Rows holding at least the feature and target columns.
+        """
+        features = np.ascontiguousarray(chunk[self.feature_columns].to_numpy(dtype=self.dtype))
+        target = np.ascontiguousarray(chunk[self.target_column].to_numpy(dtype=self.target_dtype))
+        self._files["features"].write(features.tobytes())
+        self._files["target"].write(target.tobytes())
+        self.n_rows += len(chunk)
+
+    def close(self, source: str = "") -> dict:
+        """
+        Finalizes the `.npy` files and writes the metadata.
+
+        Parameters:
+            source (str): Dataset the store was built from, recorded in the metadata.
+
+        Returns:
+            dict: The metadata that was written.
+        """
+        try:
+            for file in self._files.values():
+                file.close()
+
+            n_features = len(self.feature_columns)
+            features = np.memmap(self._raw_paths["features"], dtype=self.dtype, mode='r', shape=(self.n_rows, n_features)) \
+                if self.n_rows else np.empty((0, n_features), self.dtype)
+            target = np.memmap(self._raw_paths["target"], dtype=self.target_dtype, mode='r', shape=(self.n_rows,)) \
+                if self.n_rows else np.empty(0, self.target_dtype)
+
+            save_npy(self.features_path, features)
+            save_npy(self.target_path, target)
+            del features, target  # Release the memory maps before the raw files are removed
+
+            metadata = {
+                "feature_columns": self.feature_columns,
+                "target_column": self.target_column,
+                "dtype": self.dtype.name,
+                "target_dtype": self.target_dtype.name,
+                "n_rows": self.n_rows,
+                "source": source,
+                "created_at": time.time(),
+            }
+            save_json(self.metadata_path, metadata)
+            logger.info(f"Feature store written: '{self.features_path}' ({self.n_rows} x {n_features}, {self.dtype.name})")
+            return metadata
+        finally:
+            for path in self._raw_paths.values():
+                if os.path.exists(path):
+                    os.remove(path)
+
+
+def load_feature_split(
+    features_path: Path,
+    target_path: Path,
+    metadata_path: Path,
+    index_path: Path
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Loads one split (train or test) from the feature store.
+
+    The feature matrix, target and row indices are memory-mapped, so only the selected
+    rows are ever read from disk and copied.
+
+    Parameters:
+        features_path (Path): `.npy` feature matrix written by `FeatureStoreWriter`.
+        target_path (Path): `.npy` target vector written by `FeatureStoreWriter`.
+        metadata_path (Path): JSON metadata with the column names.
+        index_path (Path): `.npy` row positions of the split.
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: Features and a one-column target frame.
+    """
+    metadata = load_json(Path(metadata_path))
+    features = np.load(features_path, mmap_mode='r')
+    target = np.load(target_path, mmap_mode='r')
+    indices = np.load(index_path, mmap_mode='r')
+
+    if features.shape != (metadata.n_rows, len(metadata.feature_columns)):
+        raise ValueError(f"Feature store at '{features_path}' does not match its metadata '{metadata_path}'")
+
+    x = pd.DataFrame(features[indices], columns=list(metadata.feature_columns), copy=False)
+    y = pd.DataFrame({metadata.target_column: target[indices]})
+    return x, y
@@ -0,0 +1,95 @@
+import os
+from pathlib import Path
+from typing import Any, List
+
+import numpy as np
+
+# Deliberately imports nothing but NumPy: serving a linear model through this kernel
+# never loads scikit-learn or unpickles an estimator.
+
+
+class LinearKernel:
+    """
+    Dependency-free scorer for a fitted linear regression model.
+
+    Responsibilities:
+    - Hold the coefficients, intercept and feature order exported from a trained model.
+    - Predict with one vectorized dot product, without sklearn's per-call input validation.
+    - Save to and load from a small `.npz` file that needs no pickle to read.
+    """
+
+    def __init__(self, coef: np.ndarray, intercept: float, feature_columns: List[str], backend: str = "", model_sha256: str = ""):
+        """
+        Parameters:
+            coef (np.ndarray): One coefficient per feature, in `feature_columns` order.
+            intercept (float): Model intercept.
+            feature_columns (List[str]): Feature names in the order the coefficients expect.
+            backend (str): Registry name of the model the kernel was exported from.
+            model_sha256 (str): Content hash of that model artifact.
+        """
+        self.coef = np.ascontiguousarray(coef, dtype=np.float64).ravel()
+        self.intercept = float(intercept)
+        self.feature_columns = list(feature_columns)
+        self.backend = backend
+        self.model_sha256 = model_sha256
+
+        if len(self.coef) != len(self.feature_columns):
+            raise ValueError(f"Kernel has {len(self.coef)} coefficients for {len(self.feature_columns)} features")
+
+    def predict(self, x: Any) -> np.ndarray:
+        """
+        Scores a (n_rows, n_features) matrix, or a DataFrame with the feature columns.
+
+        Returns:
+            np.ndarray: One prediction per row.
+        """
+        if hasattr(x, "columns"):
+            x = x[self.feature_columns].to_numpy(dtype=np.float64)
+        return np.asarray(x, dtype=np.float64) @ self.coef + self.intercept
+
+    def save(self, path: Path) -> None:
+        """
+        Writes the kernel atomically, so a serving process never reads a half-written file.
+        """
+        tmp_path = f"{path}.tmp.{os.getpid()}.npz"
+        np.savez(
+            tmp_path,
+            coef=self.coef,
+            intercept=self.intercept,
+            feature_columns=np.array(self.feature_columns),
+            backend=self.backend,
+            model_sha256=self.model_sha256
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "LinearKernel":
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                coef=data["coef"],
+                intercept=float(data["intercept"]),
+                feature_columns=[str(column) for column in data["feature_columns"]],
+                backend=str(data["backend"]),
+                model_sha256=str(data["model_sha256"])
+            )
+
+    @classmethod
+    def from_model(cls, model: Any, feature_columns: List[str], backend: str = "", model_sha256: str = "") -> "LinearKernel":
+        """
+        Extracts a kernel from a fitted single-target linear estimator (ElasticNet, Ridge, ...).
+
+        Raises:
+            ValueError: If the model is not linear or has more than one target.
+        """
+        if not hasattr(model, "coef_") or not hasattr(model, "intercept_"):
+            raise ValueError(f"{type(model).__name__} is not a linear model and cannot be exported as a kernel")
+
+        coef, intercept = np.asarray(model.coef_, dtype=np.float64), np.asarray(model.intercept_, dtype=np.float64)
+        if (coef.ndim > 1 and coef.shape[0] != 1) or intercept.size != 1:
+            raise ValueError("Only single-target linear models can be exported as a kernel")
+
+        names = getattr(model, "feature_names_in_", None)
+        if names is not None and list(names) != list(feature_columns):
+            raise ValueError("Model feature order does not match the feature store columns")
+
+        return cls(coef.ravel(), float(intercept.ravel()[0]), feature_columns, backend, model_sha256)
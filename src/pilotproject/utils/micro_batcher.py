@@ -0,0 +1,127 @@
+import asyncio
+import time
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from src.pilotproject import logger
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent prediction requests into one vectorized model call.
+
+    Responsibilities:
+    - Queue each caller's rows together with an asyncio future.
+    - Score immediately when no batch is in flight; otherwise collect requests until the
+      in-flight batch finishes, `max_batch_rows` rows are pending or `max_wait_ms` has passed.
+    - Score the whole batch with a single `predict` call off the event loop, then hand each
+      caller its own slice of the predictions (or the exception).
+    - Track batch counts and sizes.
+
+    A request arriving on an idle batcher is scored at once, so light traffic pays no added
+    latency; under bursts, requests that would queue behind the in-flight batch anyway are
+    scored together in the next one.
+    """
+
+    def __init__(self, predict: Callable[[np.ndarray], np.ndarray], max_batch_rows: int = 64, max_wait_ms: float = 2.0):
+        """
+        Parameters:
+            predict (Callable[[np.ndarray], np.ndarray]): Scores a (n_rows, n_features) matrix.
+            max_batch_rows (int): Flush as soon as this many rows are pending.
+            max_wait_ms (float): Longest the first pending request waits for others to join.
+        """
+        self.predict = predict
+        self.max_batch_rows = max_batch_rows
+        self.max_wait_seconds = max_wait_ms / 1000
+
+        self._pending: List[Tuple[np.ndarray, asyncio.Future]] = []
+        self._pending_rows = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running = 0  # Batches being scored right now
+
+        self.batches = 0
+        self.rows = 0
+        self.max_batch_seen = 0
+        self.scoring_seconds = 0.0
+
+    async def submit(self, features: np.ndarray) -> np.ndarray:
+        """
+        Queues rows for the next batch and waits for their predictions.
+
+        Parameters:
+            features (np.ndarray): Matrix of shape (n_rows, n_features).
+
+        Returns:
+            np.ndarray: Predictions for these rows, in order.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((features, future))
+        self._pending_rows += features.shape[0]
+
+        if self._pending_rows >= self.max_batch_rows or self._running == 0:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_seconds, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """
+        Takes everything pending and schedules it as one batch.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        batch, self._pending, self._pending_rows = self._pending, [], 0
+        self._running += 1  # Counted from now, so requests arriving before the task starts join the next batch
+        asyncio.get_running_loop().create_task(self._score(batch))
+
+    async def _score(self, batch: List[Tuple[np.ndarray, asyncio.Future]]) -> None:
+        matrix = batch[0][0] if len(batch) == 1 else np.vstack([features for features, _ in batch])
+        started = time.perf_counter()
+        try:
+            predictions = await asyncio.to_thread(self.predict, matrix)  # Keeps the loop accepting requests
+
+            self.batches += 1
+            self.rows += matrix.shape[0]
+            self.max_batch_seen = max(self.max_batch_seen, matrix.shape[0])
+
+            offset = 0
+            for features, future in batch:
+                n_rows = features.shape[0]
+                if not future.done():  # The caller may have disconnected and cancelled its future
+                    future.set_result(predictions[offset:offset + n_rows])
+                offset += n_rows
+
+        except Exception as e:
+            logger.error(f"Micro-batch of {matrix.shape[0]} row(s) failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+        finally:
+            self._running -= 1
+            self.scoring_seconds += time.perf_counter() - started
+            if self._pending and self._running == 0:
+                self._flush()  # Requests that arrived while this batch was scored
+
+    def stats(self) -> dict:
+        """
+        Returns batch counters suitable for JSON serialization.
+        """
+        return {
+            "batches": self.batches,
+            "rows": self.rows,
+            "mean_batch_rows": round(self.rows / self.batches, 2) if self.batches else 0.0,
+            "max_batch_rows_seen": self.max_batch_seen,
+            "pending_rows": self._pending_rows,
+            "batches_running": self._running,
+            "scoring_seconds": round(self.scoring_seconds, 4),
+            "max_batch_rows": self.max_batch_rows,
+            "max_wait_ms": self.max_wait_seconds * 1000,
+        }
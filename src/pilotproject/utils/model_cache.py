@@ -0,0 +1,163 @@
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from src.pilotproject import logger
+from src.pilotproject.utils.common import get_file_hash
+from src.pilotproject.utils.linear_kernel import LinearKernel
+
+
+@dataclass
+class CachedModel:
+    """
+    A loaded model artifact together with the file fingerprint it was loaded from.
+    """
+    model: Any
+    mtime_ns: int
+    size: int
+    sha256: str
+    loaded_at: float
+
+
+class ModelCache:
+    """
+    Process-resident cache for trained model artifacts.
+
+    Responsibilities:
+    - Load each model artifact once per worker process and reuse it across requests.
+    - Reload only when the artifact's mtime/size changes and its content hash differs.
+    - Track load counts and hit rates so cache effectiveness can be monitored.
+    """
+
+    def __init__(self, loader: Optional[Callable[[Path], Any]] = None):
+        """
+        Initializes an empty cache.
+
+        Parameters:
+            loader (Optional[Callable[[Path], Any]]): Function used to deserialize an artifact
+                from disk; `joblib.load` when omitted, imported on the first load.
+        """
+        self.loader = loader
+        self._entries: Dict[str, CachedModel] = {}
+        self._lock = threading.Lock()
+        self.loads = 0          # Number of times an artifact was deserialized from disk
+        self.hits = 0           # Requests served from memory
+        self.revalidations = 0  # mtime changed but the content hash did not
+
+    def get(self, path: Path) -> Any:
+        """
+        Returns the model stored at the given path, loading it only if needed.
+
+        - A matching mtime and size is served straight from memory (one stat call).
+        - A changed mtime triggers a content hash; the model is reloaded only if the hash differs.
+
+        Parameters:
+            path (Path): Path to the serialized model artifact.
+
+        Returns:
+            Any: The deserialized model object.
+        """
+        key = os.path.abspath(path)
+        stat = os.stat(key)  # Raises FileNotFoundError if the artifact is missing
+
+        entry = self._entries.get(key)
+        if entry is not None and (entry.mtime_ns, entry.size) == (stat.st_mtime_ns, stat.st_size):
+            self.hits += 1
+            return entry.model
+
+        with self._lock:
+            # Another thread may have refreshed the entry while we waited for the lock
+            entry = self._entries.get(key)
+            if entry is not None and (entry.mtime_ns, entry.size) == (stat.st_mtime_ns, stat.st_size):
+                self.hits += 1
+                return entry.model
+
+            sha256 = get_file_hash(Path(key))
+            if entry is not None and entry.sha256 == sha256:
+                # File was touched or rewritten with identical content; keep the loaded model
+                entry.mtime_ns, entry.size = stat.st_mtime_ns, stat.st_size
+                self.revalidations += 1
+                self.hits += 1
+                logger.info(f"Model artifact '{key}' unchanged (sha256={sha256[:12]}) — reusing cached model")
+                return entry.model
+
+            return self._load(key, stat, sha256).model
+
+    def refresh(self, path: Path) -> Any:
+        """
+        Forces a reload of the artifact and atomically swaps it into the cache.
+
+        Parameters:
+            path (Path): Path to the serialized model artifact.
+
+        Returns:
+            Any: The freshly loaded model object.
+        """
+        key = os.path.abspath(path)
+        with self._lock:
+            stat = os.stat(key)
+            return self._load(key, stat, get_file_hash(Path(key))).model
+
+    def _load(self, key: str, stat: os.stat_result, sha256: str) -> CachedModel:
+        """
+        Deserializes the artifact and replaces the cache entry in a single assignment.
+        """
+        if self.loader is None:
+            import joblib
+            self.loader = joblib.load
+
+        start = time.perf_counter()
+        model = self.loader(key)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        entry = CachedModel(
+            model=model,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            sha256=sha256,
+            loaded_at=time.time()
+        )
+        self._entries[key] = entry  # Readers see either the old or the new entry, never a partial one
+        self.loads += 1
+        logger.info(f"Loaded model from '{key}' (sha256={sha256[:12]}) in {elapsed_ms:.2f} ms")
+        return entry
+
+    def clear(self) -> None:
+        """
+        Drops all cached models and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.loads = self.hits = self.revalidations = 0
+
+    def stats(self) -> dict:
+        """
+        Returns load counts, hit rate and the fingerprint of every cached artifact.
+
+        Returns:
+            dict: Cache statistics suitable for JSON serialization.
+        """
+        requests = self.hits + self.loads
+        return {
+            "loads": self.loads,
+            "hits": self.hits,
+            "revalidations": self.revalidations,
+            "requests": requests,
+            "hit_rate": round(self.hits / requests, 6) if requests else 0.0,
+            "entries": {
+                key: {
+                    "sha256": entry.sha256,
+                    "size": entry.size,
+                    "loaded_at": entry.loaded_at
+                }
+                for key, entry in self._entries.items()
+            }
+        }
+
+
+# Process-wide caches shared by every prediction request in this worker
+model_cache = ModelCache()
+kernel_cache = ModelCache(loader=LinearKernel.load)  # NumPy scoring kernels exported from linear models
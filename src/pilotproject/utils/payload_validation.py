@@ -0,0 +1,119 @@
+import math
+import reprlib
+from typing import Any, List, Optional
+
+import numpy as np
+
+
+class PayloadValidationError(ValueError):
+    """
+    Raised when a prediction payload does not match the schema; carries every problem found.
+    """
+
+    def __init__(self, errors: List[str]):
+        super().__init__("; ".join(errors))
+        self.errors = errors
+
+
+class PayloadValidator:
+    """
+    Validates JSON prediction payloads against `schema.yaml` and converts them to a feature matrix.
+
+    Responsibilities:
+    - Accept one row or an `instances` list; rows are objects keyed by schema column name or
+      lists in schema column order.
+    - Reject missing or unknown columns, non-numeric or non-finite values, and values outside
+      the schema `RANGES`.
+    - Report every problem with its row index and column, not just the first.
+    """
+
+    def __init__(self, columns: dict, target_column: str, ranges: Optional[dict] = None, max_rows: int = 10000):
+        """
+        Parameters:
+            columns (dict): Schema `COLUMNS` (name -> dtype).
+            target_column (str): Column that is predicted, not sent.
+            ranges (Optional[dict]): Schema `RANGES` (name -> {min, max}); None skips range checks.
+            max_rows (int): Largest number of rows accepted in one payload.
+        """
+        self.feature_columns = [column for column in columns if column != target_column]
+        self.ranges = {
+            column: (bounds.get("min"), bounds.get("max"))
+            for column, bounds in (ranges or {}).items() if column in self.feature_columns
+        }
+        self.max_rows = max_rows
+
+    def _rows(self, payload: Any) -> list:
+        if isinstance(payload, dict) and "instances" in payload:
+            rows = payload["instances"]
+            if not isinstance(rows, list):
+                raise PayloadValidationError(["'instances' must be a list of rows"])
+            return rows
+        if isinstance(payload, dict):
+            return [payload]  # A single row keyed by column name
+        if isinstance(payload, list) and payload and not isinstance(payload[0], (dict, list)):
+            return [payload]  # A single row as a list of values
+        if isinstance(payload, list):
+            return payload
+        raise PayloadValidationError(["Expected a row object, a list of rows, or an object with an 'instances' list"])
+
+    def _row_values(self, index: int, row: Any, errors: List[str]) -> Optional[list]:
+        if isinstance(row, dict):
+            missing = [column for column in self.feature_columns if column not in row]
+            unknown = [column for column in row if column not in self.feature_columns]
+            if missing:
+                errors.append(f"row {index}: missing columns {missing}")
+            if unknown:
+                errors.append(f"row {index}: unknown columns {unknown}")
+            return None if missing or unknown else [row[column] for column in self.feature_columns]
+        if isinstance(row, list):
+            if len(row) != len(self.feature_columns):
+                errors.append(f"row {index}: expected {len(self.feature_columns)} values, got {len(row)}")
+                return None
+            return row
+        errors.append(f"row {index}: expected an object or a list, got {type(row).__name__}")
+        return None
+
+    def validate(self, payload: Any) -> np.ndarray:
+        """
+        Validates a parsed JSON payload.
+
+        Parameters:
+            payload (Any): Decoded JSON body.
+
+        Returns:
+            np.ndarray: C-contiguous float64 matrix of shape (n_rows, n_features) in schema order.
+
+        Raises:
+            PayloadValidationError: With every problem found.
+        """
+        rows = self._rows(payload)
+        if not rows:
+            raise PayloadValidationError(["Payload contains no rows to predict"])
+        if len(rows) > self.max_rows:
+            raise PayloadValidationError([f"Payload has {len(rows)} rows, the limit is {self.max_rows}"])
+
+        errors: List[str] = []
+        matrix = np.empty((len(rows), len(self.feature_columns)), dtype=np.float64)
+        for index, row in enumerate(rows):
+            values = self._row_values(index, row, errors)
+            if values is None:
+                continue
+            for position, (column, value) in enumerate(zip(self.feature_columns, values)):
+                number = None
+                # bool is an int subclass, but true/false is never a valid measurement
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    try:
+                        number = float(value)
+                    except OverflowError:  # A JSON integer too large for a float
+                        pass
+                if number is None or not math.isfinite(number):
+                    errors.append(f"row {index}: '{column}' must be a finite number, got {reprlib.repr(value)}")
+                    continue
+                low, high = self.ranges.get(column, (None, None))
+                if (low is not None and number < low) or (high is not None and number > high):
+                    errors.append(f"row {index}: '{column}'={number} is outside [{low}, {high}]")
+                matrix[index, position] = number
+
+        if errors:
+            raise PayloadValidationError(errors[:50])  # Enough to fix a payload without echoing a huge one
+        return matrix
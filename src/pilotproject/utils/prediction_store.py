@@ -0,0 +1,229 @@
+import os
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from itertools import count
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from src.pilotproject import logger
+
+
+# Schema dtypes are stored in the narrowest type that holds wine lab values
+COMPACT_DTYPES = {
+    "float64": "float32",
+    "float32": "float32",
+    "int64": "int8",
+    "int32": "int8",
+    "int16": "int8",
+    "int8": "int8",
+}
+
+TIMESTAMP_COLUMN = "timestamp"
+PARTITION_PREFIX = "date="
+
+
+def _import_pyarrow():
+    """
+    Imports pyarrow on demand; it is only required when the Parquet store is used.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "The Parquet prediction store requires 'pyarrow' (pip install pyarrow), "
+            "or set 'predictions_format: csv' in config.yaml"
+        ) from e
+    return pa, pq
+
+
+DateBound = Union[str, date, datetime, None]
+
+
+def _parse_bound(value: DateBound) -> Union[date, datetime, None]:
+    """
+    Parses a range bound. 'YYYY-MM-DD' strings and date objects select whole days;
+    datetimes (naive values are taken as UTC) select an exact instant.
+    """
+    if isinstance(value, str):
+        value = date.fromisoformat(value) if len(value) == 10 else datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+    return value
+
+
+def _bound_date(value: Union[date, datetime, None]) -> Optional[date]:
+    """
+    Returns the calendar day a parsed bound falls on.
+    """
+    return value.date() if isinstance(value, datetime) else value
+
+
+class ParquetPredictionStore:
+    """
+    Columnar, date-partitioned store for logged predictions.
+
+    Responsibilities:
+    - Write each flushed batch as an immutable Parquet file under `date=YYYY-MM-DD/`.
+    - Store features and the target in compact dtypes derived from `schema.yaml`.
+    - Read back a time range and/or a subset of columns, touching only the matching partitions.
+    - Compact a day's small part files into a single file.
+    """
+
+    def __init__(self, root_dir: Path, columns: Dict[str, str], target_column: str):
+        """
+        Parameters:
+            root_dir (Path): Root directory of the store.
+            columns (Dict[str, str]): Schema column names mapped to their declared dtypes.
+            target_column (str): Name of the predicted column.
+        """
+        self.path = Path(root_dir)
+        self.target_column = target_column
+        self.score_column = f"{target_column}_score"
+        self.feature_columns = [column for column in columns.keys() if column != target_column]
+        self.feature_dtype = {
+            column: COMPACT_DTYPES.get(str(columns[column]), "float32") for column in self.feature_columns
+        }
+        self.target_dtype = COMPACT_DTYPES.get(str(columns[target_column]), "float32")
+        self._sequence = count()
+        self._token = uuid.uuid4().hex[:8]  # Keeps file names unique across processes and restarts
+
+    def write(self, rows: np.ndarray, timestamps: np.ndarray) -> None:
+        """
+        Writes a batch of predictions, splitting it by UTC calendar day.
+
+        Parameters:
+            rows (np.ndarray): Matrix of features followed by the raw prediction, one row per prediction.
+            timestamps (np.ndarray): Unix timestamps (seconds) of each row.
+        """
+        pa, pq = _import_pyarrow()
+
+        days = (timestamps // 86400).astype(np.int64)
+        for day in np.unique(days):
+            mask = days == day
+            part = rows[mask]
+            scores = part[:, -1]
+
+            arrays = [pa.array((timestamps[mask] * 1000).astype("int64"), type=pa.timestamp("ms", tz="UTC"))]
+            names = [TIMESTAMP_COLUMN]
+            for index, column in enumerate(self.feature_columns):
+                arrays.append(pa.array(part[:, index].astype(self.feature_dtype[column])))
+                names.append(column)
+
+            if self.target_dtype.startswith("int"):
+                limits = np.iinfo(self.target_dtype)
+                target = np.clip(np.rint(scores), limits.min, limits.max).astype(self.target_dtype)
+            else:
+                target = scores.astype(self.target_dtype)
+            arrays.append(pa.array(target))
+            names.append(self.target_column)
+            arrays.append(pa.array(scores.astype("float32")))  # Unrounded model output
+            names.append(self.score_column)
+
+            partition_dir = self.path / f"{PARTITION_PREFIX}{date(1970, 1, 1) + timedelta(days=int(day))}"
+            partition_dir.mkdir(parents=True, exist_ok=True)
+            file_name = f"part-{self._token}-{os.getpid()}-{next(self._sequence):08d}.parquet"
+            tmp_path = partition_dir / f".{file_name}.tmp"
+
+            pq.write_table(pa.Table.from_arrays(arrays, names=names), tmp_path)
+            os.replace(tmp_path, partition_dir / file_name)  # Readers never see half-written files
+
+    def partitions(self, start: DateBound = None, end: DateBound = None) -> List[Path]:
+        """
+        Lists partition directories whose date falls inside [start, end].
+
+        Parameters:
+            start: First date to include, or None for no lower bound.
+            end: Last date to include, or None for no upper bound.
+
+        Returns:
+            List[Path]: Matching partition directories in date order.
+        """
+        if not self.path.exists():
+            return []
+
+        start_date, end_date = _bound_date(_parse_bound(start)), _bound_date(_parse_bound(end))
+        selected = []
+        for partition_dir in sorted(self.path.glob(f"{PARTITION_PREFIX}*")):
+            partition_date = date.fromisoformat(partition_dir.name[len(PARTITION_PREFIX):])
+            if start_date is not None and partition_date < start_date:
+                continue
+            if end_date is not None and partition_date > end_date:
+                continue
+            selected.append(partition_dir)
+        return selected
+
+    def read(self, start: DateBound = None, end: DateBound = None,
+             columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Loads predictions logged between start and end, reading only the requested columns.
+
+        - Partitions outside the date range are never opened.
+        - Row-level timestamp bounds are applied as a Parquet filter, so row groups outside
+          the range are skipped using file statistics.
+
+        Parameters:
+            start: Inclusive lower bound (date, datetime or ISO string), or None.
+            end: Upper bound; a date includes that whole day, a datetime is exclusive.
+            columns (Optional[List[str]]): Columns to load; defaults to all columns.
+
+        Returns:
+            pd.DataFrame: The matching predictions.
+        """
+        pa, pq = _import_pyarrow()
+        import pyarrow.dataset as ds
+
+        files = [str(path) for partition_dir in self.partitions(start, end)
+                 for path in sorted(partition_dir.glob("part-*.parquet"))]
+        if not files:
+            return pd.DataFrame(columns=columns or [])
+
+        dataset = ds.dataset(files, format="parquet")
+        timestamp_type = pa.timestamp("ms", tz="UTC")
+        expression = None
+        lower, upper = _parse_bound(start), _parse_bound(end)
+        if isinstance(lower, datetime):
+            expression = ds.field(TIMESTAMP_COLUMN) >= pa.scalar(lower, timestamp_type)
+        if isinstance(upper, datetime):
+            upper_expression = ds.field(TIMESTAMP_COLUMN) < pa.scalar(upper, timestamp_type)
+            expression = upper_expression if expression is None else expression & upper_expression
+
+        table = dataset.to_table(columns=columns, filter=expression)
+        logger.info(f"Loaded {table.num_rows} prediction row(s) from {len(files)} file(s) in '{self.path}'")
+        return table.to_pandas()
+
+    def compact(self, day: DateBound) -> Optional[Path]:
+        """
+        Merges all part files of one day into a single Parquet file.
+
+        Parameters:
+            day: The partition date to compact.
+
+        Returns:
+            Optional[Path]: Path of the compacted file, or None if the partition was empty.
+        """
+        pa, pq = _import_pyarrow()
+
+        partitions = self.partitions(day, day)
+        if not partitions:
+            return None
+
+        partition_dir = partitions[0]
+        part_files = sorted(partition_dir.glob("part-*.parquet"))
+        if len(part_files) <= 1:
+            return part_files[0] if part_files else None
+
+        table = pa.concat_tables([pq.read_table(path) for path in part_files])
+        file_name = f"part-{self._token}-{os.getpid()}-compacted-{next(self._sequence):08d}.parquet"
+        tmp_path = partition_dir / f".{file_name}.tmp"
+        pq.write_table(table.sort_by(TIMESTAMP_COLUMN), tmp_path)
+        os.replace(tmp_path, partition_dir / file_name)
+
+        for path in part_files:
+            path.unlink()
+
+        logger.info(f"Compacted {len(part_files)} file(s) in '{partition_dir}' into '{file_name}'")
+        return partition_dir / file_name
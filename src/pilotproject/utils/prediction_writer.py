@@ -0,0 +1,298 @@
+import atexit
+import io
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.pilotproject import logger
+
+try:
+    import fcntl  # POSIX advisory locks; keeps appends from several worker processes whole
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+OVERFLOW_POLICIES = ("drop", "block")
+
+_STOP = object()  # Sentinel that tells the writer thread to drain and exit
+
+
+class CSVPredictionSink:
+    """
+    Appends batches of logged predictions to a CSV file.
+
+    Responsibilities:
+    - Render a whole batch to text in memory, then append it, writing until every byte is out.
+    - Hold an exclusive file lock during the append so concurrent processes never interleave lines.
+    - Write the header row only when the file is new or empty.
+    """
+
+    def __init__(self, path: Path, columns: List[str]):
+        """
+        Parameters:
+            path (Path): Destination CSV file.
+            columns (List[str]): Column names, feature columns followed by the prediction column.
+        """
+        self.path = Path(path)
+        self.columns = columns
+
+    def write(self, rows: np.ndarray, timestamps: Optional[np.ndarray] = None) -> None:
+        """
+        Appends the given rows to the CSV file.
+
+        Parameters:
+            rows (np.ndarray): Matrix of shape (n_rows, len(columns)).
+            timestamps (Optional[np.ndarray]): Unused; the CSV log keeps its original columns.
+        """
+        buffer = io.StringIO()
+        pd.DataFrame(rows, columns=self.columns).to_csv(buffer, header=False, index=False)
+        body = buffer.getvalue()
+
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            if os.fstat(fd).st_size == 0:
+                body = ",".join(self.columns) + "\n" + body
+            data = memoryview(body.encode())
+            while data:  # os.write may write fewer bytes than asked, e.g. for a large batch
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)  # Closing the descriptor also releases the lock
+
+
+class PredictionLogWriter:
+    """
+    Background writer that takes prediction logging off the request path.
+
+    Responsibilities:
+    - Accept prediction batches into an in-memory queue bounded by its total row count.
+    - Flush queued rows to the sink from a single owner thread, by row count or elapsed time.
+    - Apply the configured overflow policy ('drop' or 'block') when the queue is full.
+    - Track submitted, written and dropped row counts.
+    """
+
+    def __init__(
+        self,
+        sink: Any,
+        max_queue_rows: int = 100000,
+        flush_rows: int = 1000,
+        flush_interval_seconds: float = 1.0,
+        overflow_policy: str = "drop",
+        block_timeout_seconds: float = 0.5
+    ):
+        """
+        Parameters:
+            sink (Any): Destination with a `write(rows, timestamps)` method, e.g. `CSVPredictionSink`
+                or `ParquetPredictionStore`.
+            max_queue_rows (int): Maximum number of rows queued or awaiting a flush; a batch larger
+                than this is still accepted when nothing else is pending, so it is not always dropped.
+            flush_rows (int): Flush as soon as this many rows are pending.
+            flush_interval_seconds (float): Flush pending rows at least this often.
+            overflow_policy (str): 'drop' discards batches when the queue is full; 'block' waits for space.
+            block_timeout_seconds (float): Longest a caller waits under the 'block' policy before dropping.
+        """
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow_policy}', expected one of {OVERFLOW_POLICIES}")
+
+        self.sink = sink
+        self.max_queue_rows = max_queue_rows
+        self.flush_rows = flush_rows
+        self.flush_interval_seconds = flush_interval_seconds
+        self.overflow_policy = overflow_policy
+        self.block_timeout_seconds = block_timeout_seconds
+
+        self.submitted_rows = 0
+        self.written_rows = 0
+        self.dropped_rows = 0
+        self.failed_flushes = 0
+
+        self._queue: Optional[queue.Queue] = None
+        self._space: Optional[threading.Condition] = None  # Guards `_queued_rows`
+        self._queued_rows = 0
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._start_lock = threading.Lock()
+
+    def _ensure_started(self) -> None:
+        """
+        Starts the writer thread on first use, and again in a forked child process,
+        since threads do not survive fork().
+        """
+        if self._pid == os.getpid():
+            return
+
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            self._queue = queue.Queue()  # Bounded by `_queued_rows`, not by the number of batches
+            self._space = threading.Condition()
+            self._queued_rows = 0
+            self._thread = threading.Thread(target=self._run, name="prediction-log-writer", daemon=True)
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def submit(self, features: np.ndarray, predictions: np.ndarray) -> bool:
+        """
+        Queues a batch of predictions for logging without touching the disk.
+
+        The arrays are referenced, not copied, and must not be modified afterwards.
+
+        Parameters:
+            features (np.ndarray): Feature matrix of shape (n_rows, n_features).
+            predictions (np.ndarray): Predictions of shape (n_rows,).
+
+        Returns:
+            bool: True if the batch was queued, False if it was dropped.
+        """
+        self._ensure_started()
+        n_rows = features.shape[0]
+        self.submitted_rows += n_rows
+        item = (time.time(), features, predictions)
+
+        def has_space() -> bool:
+            return self._queued_rows == 0 or self._queued_rows + n_rows <= self.max_queue_rows
+
+        with self._space:
+            if not has_space() and (
+                self.overflow_policy != "block" or not self._space.wait_for(has_space, self.block_timeout_seconds)
+            ):
+                self.dropped_rows += n_rows
+                logger.warning(f"Prediction log queue is full — dropped {n_rows} row(s) (policy='{self.overflow_policy}')")
+                return False
+            self._queued_rows += n_rows
+
+        self._queue.put_nowait(item)
+        return True
+
+    def _release(self, n_rows: int) -> None:
+        """
+        Frees queue space once rows have been flushed and wakes callers waiting for it.
+        """
+        with self._space:
+            self._queued_rows -= n_rows
+            self._space.notify_all()
+
+    def _run(self) -> None:
+        """
+        Writer thread loop: collects batches and flushes them by size or time.
+        """
+        pending = []
+        pending_rows = 0
+        deadline = time.monotonic() + self.flush_interval_seconds
+
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                self._flush(pending)
+                self._release(pending_rows)
+                return
+
+            if item is not None:
+                pending.append(item)
+                pending_rows += item[1].shape[0]
+
+            if pending_rows >= self.flush_rows or time.monotonic() >= deadline:
+                self._flush(pending)
+                self._release(pending_rows)  # Rows count against the limit until written
+                pending = []
+                pending_rows = 0
+                deadline = time.monotonic() + self.flush_interval_seconds
+
+    def _flush(self, pending: list) -> None:
+        """
+        Combines pending batches into one matrix and hands it to the sink.
+        """
+        if not pending:
+            return
+
+        rows = np.column_stack([
+            np.vstack([features for _, features, _ in pending]),
+            np.concatenate([predictions for _, _, predictions in pending])
+        ])
+        timestamps = np.concatenate([
+            np.full(features.shape[0], submitted_at) for submitted_at, features, _ in pending
+        ])
+
+        try:
+            self.sink.write(rows, timestamps)
+            self.written_rows += rows.shape[0]
+        except Exception as e:
+            self.failed_flushes += 1
+            logger.error(f"Failed to write {rows.shape[0]} prediction row(s): {e}")
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Flushes everything still queued and stops the writer thread.
+
+        Parameters:
+            timeout (float): Maximum seconds to wait for the final flush.
+        """
+        if self._pid != os.getpid() or self._thread is None:
+            return
+
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._pid = None
+
+    def stats(self) -> dict:
+        """
+        Returns row counters and the current queue depth.
+
+        Returns:
+            dict: Writer statistics suitable for JSON serialization.
+        """
+        return {
+            "submitted_rows": self.submitted_rows,
+            "written_rows": self.written_rows,
+            "dropped_rows": self.dropped_rows,
+            "failed_flushes": self.failed_flushes,
+            "queued_batches": self._queue.qsize() if self._pid == os.getpid() else 0,
+            "queued_rows": self._queued_rows if self._pid == os.getpid() else 0,
+            "overflow_policy": self.overflow_policy
+        }
+
+
+# One writer per destination file in each process, so every append goes through a single owner
+_writers: Dict[str, PredictionLogWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_prediction_log_writer(sink: Any, **options) -> PredictionLogWriter:
+    """
+    Returns the process-wide writer for a prediction sink, creating it on first use.
+
+    Writers are keyed by the sink's `path`, so every append to a given file or
+    store goes through one owner thread per process.
+
+    Parameters:
+        sink (Any): Destination with a `path` attribute and a `write(rows, timestamps)` method.
+        **options: Keyword arguments forwarded to `PredictionLogWriter`.
+
+    Returns:
+        PredictionLogWriter: The shared writer for this destination.
+    """
+    key = os.path.abspath(sink.path)
+    with _writers_lock:
+        if key not in _writers:
+            _writers[key] = PredictionLogWriter(sink, **options)
+        return _writers[key]
+
+
+@atexit.register
+def _close_writers() -> None:
+    """
+    Drains every writer at interpreter exit so queued predictions are not lost.
+    """
+    for writer in list(_writers.values()):
+        writer.close()
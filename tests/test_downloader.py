@@ -0,0 +1,117 @@
+import hashlib
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.pilotproject.utils.downloader import ChecksumMismatchError, RangeDownloader
+
+PAYLOAD = os.urandom(10_000)
+SHA256 = hashlib.sha256(PAYLOAD).hexdigest()
+CHUNK_SIZE = 1_000
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    """
+    Serves `server.payload`, honouring single byte ranges unless `server.ranges` is off.
+    Requests whose range starts at an offset in `server.fail_starts` get a 500.
+    """
+
+    def do_GET(self):
+        server = self.server
+        header = self.headers.get("Range")
+        server.requests.append(header)
+
+        if header and server.ranges:
+            start, end = (int(value) for value in header.split("=", 1)[1].split("-"))
+            if start in server.fail_starts:
+                self.send_error(500)
+                return
+            body = server.payload[start:end + 1]
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{start + len(body) - 1}/{len(server.payload)}")
+        else:
+            body = server.payload
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", '"v1"')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _RangeHandler)
+    httpd.payload, httpd.ranges, httpd.fail_starts, httpd.requests = PAYLOAD, True, set(), []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _downloader(server, destination, **options):
+    options = {"sha256": SHA256, "chunk_size": CHUNK_SIZE, "max_workers": 4, "timeout": 5, "retries": 0, **options}
+    return RangeDownloader(f"http://127.0.0.1:{server.server_port}/data.zip", destination, **options)
+
+
+def _part_files(destination):
+    return [destination.with_name(destination.name + suffix) for suffix in (".part", ".part.json")]
+
+
+def test_range_download(server, tmp_path):
+    destination = tmp_path / "data.zip"
+    assert _downloader(server, destination).download() == destination
+
+    assert destination.read_bytes() == PAYLOAD
+    assert not any(path.exists() for path in _part_files(destination))
+    ranges = [header for header in server.requests if header != "bytes=0-0"]
+    assert len(ranges) == len(PAYLOAD) // CHUNK_SIZE  # One request per chunk after the probe
+
+
+def test_resume_after_partial_download(server, tmp_path):
+    destination = tmp_path / "data.zip"
+    server.fail_starts = {5 * CHUNK_SIZE}
+    with pytest.raises(OSError):
+        _downloader(server, destination, max_workers=1).download()
+    assert not destination.exists()
+    assert all(path.exists() for path in _part_files(destination))
+
+    server.fail_starts, server.requests = set(), []
+    _downloader(server, destination, max_workers=1).download()
+
+    assert destination.read_bytes() == PAYLOAD
+    assert server.requests == ["bytes=0-0", f"bytes={5 * CHUNK_SIZE}-{6 * CHUNK_SIZE - 1}"]  # Only the missing chunk
+    assert not any(path.exists() for path in _part_files(destination))
+
+
+def test_falls_back_to_one_stream_without_range_support(server, tmp_path):
+    destination = tmp_path / "data.zip"
+    server.ranges = False
+    _downloader(server, destination).download()
+
+    assert destination.read_bytes() == PAYLOAD
+    assert len(server.requests) == 2  # The probe and one full download
+
+
+def test_checksum_mismatch_removes_part_files(server, tmp_path):
+    destination = tmp_path / "data.zip"
+    with pytest.raises(ChecksumMismatchError):
+        _downloader(server, destination, sha256="0" * 64).download()
+
+    assert not destination.exists()
+    assert not any(path.exists() for path in _part_files(destination))
+
+
+def test_verify(server, tmp_path):
+    destination = tmp_path / "data.zip"
+    downloader = _downloader(server, destination)
+    assert not downloader.verify(destination)
+    downloader.download()
+    assert downloader.verify(destination)
+    destination.write_bytes(PAYLOAD[:-1])
+    assert not downloader.verify(destination)
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import ElasticNet, Ridge
+
+from src.pilotproject.utils.linear_kernel import LinearKernel
+
+FEATURES = [f"feature_{i}" for i in range(11)]
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(42)
+    x = pd.DataFrame(rng.normal(size=(500, len(FEATURES))), columns=FEATURES)
+    y = x.to_numpy() @ rng.normal(size=len(FEATURES)) + 5.0 + rng.normal(scale=0.1, size=len(x))
+    return x, y
+
+
+@pytest.mark.parametrize("model", [ElasticNet(alpha=0.01, l1_ratio=0.5), Ridge(alpha=1.0)])
+def test_kernel_matches_model_predict(model, data, tmp_path):
+    x, y = data
+    model.fit(x, y)
+    kernel = LinearKernel.from_model(model, FEATURES, backend=type(model).__name__)
+
+    expected = model.predict(x)
+    np.testing.assert_allclose(kernel.predict(x), expected, rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(kernel.predict(x.to_numpy()), expected, rtol=1e-12, atol=1e-12)
+
+    path = tmp_path / "kernel.npz"
+    kernel.save(path)
+    loaded = LinearKernel.load(path)
+    assert loaded.feature_columns == FEATURES
+    assert loaded.backend == type(model).__name__
+    np.testing.assert_allclose(loaded.predict(x), expected, rtol=1e-12, atol=1e-12)
+
+
+def test_kernel_reorders_dataframe_columns(data):
+    x, y = data
+    model = Ridge().fit(x, y)
+    kernel = LinearKernel.from_model(model, FEATURES)
+    np.testing.assert_allclose(kernel.predict(x[FEATURES[::-1]]), model.predict(x), rtol=1e-12, atol=1e-12)
+
+
+def test_non_linear_model_is_rejected(data):
+    x, y = data
+    model = RandomForestRegressor(n_estimators=2, random_state=0).fit(x, y)
+    with pytest.raises(ValueError, match="not a linear model"):
+        LinearKernel.from_model(model, FEATURES)
+
+
+def test_feature_order_mismatch_is_rejected(data):
+    x, y = data
+    model = Ridge().fit(x, y)
+    with pytest.raises(ValueError, match="feature order"):
+        LinearKernel.from_model(model, FEATURES[::-1])